@@ -1,21 +1,260 @@
 """Scrapes NPB and Farm League statistics from various sources"""
 
-from time import sleep
-from random import randint
+from time import sleep, monotonic
 from datetime import datetime
 from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse, urlencode
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+    FIRST_COMPLETED,
+)
 import os
+import re
 import sys
 import shutil
 import tempfile
+import threading
+import io
+import csv
+import json
+import hashlib
+import zipfile
+import atexit
+import importlib.util
+import pickle
+import multiprocessing
 import requests
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, ElementFilter
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from playwright.sync_api import sync_playwright
 
+# Politeness budget per host used by HostScheduler. "rate" is the starting
+# requests per second, which grows by "step" while the host is healthy and
+# halves on 429/5xx or slow responses, always staying within "min_rate" and the
+# "max_rate" ceiling. "concurrency" caps the requests in flight at once
+HOST_RATE_LIMITS = {
+    "npb.jp": {
+        "rate": 0.5,
+        "min_rate": 0.1,
+        "max_rate": 2.0,
+        "step": 0.1,
+        "concurrency": 2,
+    },
+    "docs.google.com": {
+        "rate": 1.0,
+        "min_rate": 0.2,
+        "max_rate": 2.0,
+        "step": 0.2,
+        "concurrency": 2,
+    },
+    "npbbasement.com": {
+        "rate": 0.5,
+        "min_rate": 0.1,
+        "max_rate": 1.0,
+        "step": 0.1,
+        "concurrency": 1,
+    },
+    "web.archive.org": {
+        "rate": 0.5,
+        "min_rate": 0.05,
+        "max_rate": 1.0,
+        "step": 0.05,
+        "concurrency": 2,
+    },
+    "default": {
+        "rate": 0.5,
+        "min_rate": 0.1,
+        "max_rate": 1.0,
+        "step": 0.1,
+        "concurrency": 1,
+    },
+}
+# Player pages fetched and parsed at once by the career crawler
+CAREER_MAX_WORKERS = 4
+# Completed players between appends to the raw career files
+CAREER_FLUSH_EVERY = 100
+# Share of replaced (refreshed) rows that triggers a raw career file rewrite
+CAREER_COMPACT_RATIO = 0.25
+# Columns of the raw career batting and pitching files
+CAREER_BAT_COLUMNS = [
+    "Player",
+    "Link",
+    "年度",
+    "所属球団",
+    "試合",
+    "打席",
+    "打数",
+    "得点",
+    "安打",
+    "二塁打",
+    "三塁打",
+    "本塁打",
+    "塁打",
+    "打点",
+    "盗塁",
+    "盗塁刺",
+    "犠打",
+    "犠飛",
+    "四球",
+    "死球",
+    "三振",
+    "併殺打",
+    "打率",
+    "長打率",
+    "出塁率",
+]
+CAREER_PITCH_COLUMNS = [
+    "Player",
+    "Link",
+    "年度",
+    "所属球団",
+    "登板",
+    "勝利",
+    "敗北",
+    "セーブ",
+    "H",
+    "HP",
+    "完投",
+    "完封勝",
+    "無四球",
+    "勝率",
+    "打者",
+    "投球回",
+    "投球回_2",
+    "安打",
+    "本塁打",
+    "四球",
+    "死球",
+    "三振",
+    "暴投",
+    "ボーク",
+    "失点",
+    "自責点",
+    "防御率",
+]
+# A response slower than this multiple of the host's average latency is
+# treated like an error and slows the host down
+LATENCY_BACKOFF_FACTOR = 3.0
+# Connection pool size per host, hosts not listed use make_session()'s default
+HOST_POOL_SIZES = {
+    "npb.jp": 4,
+    "web.archive.org": 4,
+    "docs.google.com": 2,
+}
+# Pooled sessions shared by every scraper, one per host (see get_session())
+SESSION_REGISTRY = {}
+SESSION_LOCK = threading.Lock()
+# On-disk HTTP response cache used by get_url() (disabled with --no-cache)
+HTTP_CACHE = {
+    "enabled": True,
+    "dir": os.path.join(os.path.dirname(__file__), "stats", "http_cache"),
+    "max_age_days": 30,
+    "max_bytes": 200 * 1024 * 1024,
+}
+# Characters dropped or replaced in v2 stat table cells (see parse_stat_page())
+STAT_CELL_TRANSLATION = str.maketrans({",": None, "　": " ", "*": None, "+": None})
+# Row counts and hashes of every Raw file written by RawTableWriter, kept in
+# each year's raw/ directory
+RAW_MANIFEST_NAME = "raw_manifest.json"
+RAW_MANIFEST_LOCK = threading.Lock()
+# Scrapers hand their tables to the organizer classes directly, saving the Raw
+# files is a side output (--no-raw skips it). main() writes them on a
+# background thread and waits for them with flush_raw_writes(), other callers
+# get their Raw file before the scraper returns
+RAW_OUTPUT = {"enabled": True, "background": False}
+RAW_WRITE_POOL = ThreadPoolExecutor(max_workers=1)
+RAW_WRITES = []
+# npb.jp roster pages (current season only) per language suffix
+ROSTER_URLS = {
+    "en": {
+        "https://npb.jp/bis/eng/teams/rst_t.html": "Hanshin Tigers",
+        "https://npb.jp/bis/eng/teams/rst_c.html": "Hiroshima Carp",
+        "https://npb.jp/bis/eng/teams/rst_db.html": "DeNA BayStars",
+        "https://npb.jp/bis/eng/teams/rst_g.html": "Yomiuri Giants",
+        "https://npb.jp/bis/eng/teams/rst_s.html": "Yakult Swallows",
+        "https://npb.jp/bis/eng/teams/rst_d.html": "Chunichi Dragons",
+        "https://npb.jp/bis/eng/teams/rst_b.html": "ORIX Buffaloes",
+        "https://npb.jp/bis/eng/teams/rst_m.html": "Lotte Marines",
+        "https://npb.jp/bis/eng/teams/rst_h.html": "SoftBank Hawks",
+        "https://npb.jp/bis/eng/teams/rst_e.html": "Rakuten Eagles",
+        "https://npb.jp/bis/eng/teams/rst_l.html": "Seibu Lions",
+        "https://npb.jp/bis/eng/teams/rst_f.html": "Nipponham Fighters",
+    },
+    "jp": {
+        "https://npb.jp/bis/teams/rst_t.html": "Hanshin Tigers",
+        "https://npb.jp/bis/teams/rst_c.html": "Hiroshima Carp",
+        "https://npb.jp/bis/teams/rst_db.html": "DeNA BayStars",
+        "https://npb.jp/bis/teams/rst_g.html": "Yomiuri Giants",
+        "https://npb.jp/bis/teams/rst_s.html": "Yakult Swallows",
+        "https://npb.jp/bis/teams/rst_d.html": "Chunichi Dragons",
+        "https://npb.jp/bis/teams/rst_b.html": "ORIX Buffaloes",
+        "https://npb.jp/bis/teams/rst_m.html": "Lotte Marines",
+        "https://npb.jp/bis/teams/rst_h.html": "SoftBank Hawks",
+        "https://npb.jp/bis/teams/rst_e.html": "Rakuten Eagles",
+        "https://npb.jp/bis/teams/rst_l.html": "Seibu Lions",
+        "https://npb.jp/bis/teams/rst_f.html": "Nipponham Fighters",
+    },
+}
+WAYBACK_CDX_URL = "https://web.archive.org/cdx/search/cdx"
+# Past seasons rebuilt from Wayback Machine roster snapshots (--backfill-rosters)
+ROSTER_BACKFILL = {"enabled": False, "years": [str(y) for y in range(2016, 2025)]}
+# Record/replay archive of every fetched response (--record/--replay <archive>)
+HTTP_ARCHIVE = {"mode": None, "path": None, "zip": None, "keys": set()}
+HTTP_ARCHIVE_LOCK = threading.Lock()
+# Worker counts of the run's TaskGraph, "io" threads run the scrape nodes and
+# "cpu" processes run the organizer nodes
+TASK_WORKERS = {"io": 8, "cpu": min(4, os.cpu_count() or 1)}
+# Columns of each date's file in /year/game_log/ (see append_game_log())
+GAME_LOG_COLUMNS = ["Date", "HomeTeam", "RunsHome", "RunsAway", "AwayTeam"]
+# Heading tags that may hold the date of the games on npb.jp's games page
+GAME_DATE_HEADERS = ["h1", "h2", "h3", "h4", "caption"]
+# Date formats searched for in the games' heading (see parse_games_date())
+GAME_DATE_PATTERNS = [
+    (r"\d{4}/\d{1,2}/\d{1,2}", "%Y/%m/%d"),
+    (r"\d{4}年\d{1,2}月\d{1,2}日", "%Y年%m月%d日"),
+    (
+        r"(?:January|February|March|April|May|June|July|August|September|"
+        r"October|November|December) \d{1,2}, \d{4}",
+        "%B %d, %Y",
+    ),
+]
+# FIP constants by (Year, League), read from input/fip_const.csv once per
+# process. Constants calculated during a run update the table in memory and are
+# written back once at the end of the run (see save_fip_constants())
+FIP_CONSTANTS = {"table": None}
+FIP_CONSTANTS_LOCK = threading.Lock()
+# Every year's roster_data.csv in one table, kept in stats/all/raw and updated
+# year by year when a roster_data.csv changes (see get_roster_index())
+ROSTER_INDEX = {"index": None, "version": 2}
+ROSTER_INDEX_LOCK = threading.Lock()
+# Bump when a page parser changes so previously cached parsed rows are ignored
+PARSE_CACHE_VERSION = 1
+# HTML parser backend used by make_soup(), lxml is used when it is installed
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+# Scraped Google Sheets are also kept as typed caches that keep their dtypes,
+# Parquet when pyarrow is installed, else pickle (see read_gsheets_data())
+GSHEETS_CACHE_FORMAT = "parquet" if importlib.util.find_spec("pyarrow") else "pickle"
+# The parts of each page type that its parser reads, everything else is
+# dropped while parsing (see ParseScope). Tags match by name, id or class
+PARSE_SCOPES = {
+    "stats_v1": {"names": ["table"], "ids": ["stdivtitle"]},
+    "stats_v2": {"names": ["tr", "span"]},
+    "standings": {"names": ["table"]},
+    "daily_scores": {
+        "names": GAME_DATE_HEADERS,
+        "classes": ["contentsgame", "unit"],
+    },
+    "hatena_fielding": {"names": ["tr"]},
+    "team_directory": {"names": ["a"]},
+    "player_career": {"ids": ["pc_bio", "tablefix_b", "tablefix_p"]},
+    "roster": {"classes": ["rosterPlayer", "rosterRetire"]},
+}
 
 # TODO: declutter main() by putting most scraping/org functions in a separate function + redoing get_user_input()
 # TODO: need more robust error checking surrounding scrape and org functions
@@ -48,7 +287,8 @@ def main():
        allowing for manual control over scraping and data organization.
     5. Scrapes and organizes statistics for regular season and farm league
        games, including batting, pitching, fielding, standings, and daily
-       scores.
+       scores. The steps run as a TaskGraph, so independent scrapes and
+       organizers run concurrently.
     6. Optionally zips the output files for easier distribution.
 
     Returns:
@@ -60,19 +300,28 @@ def main():
     # Open the directory to store the scraped stat csv files
     rel_dir = os.path.dirname(__file__)
     stats_dir = os.path.join(rel_dir, "stats")
-    if not os.path.exists(stats_dir):
-        os.mkdir(stats_dir)
+    os.makedirs(stats_dir, exist_ok=True)
+
+    # Apply and remove optional "--" flags before checking for the year arg
+    args = parse_run_flags(sys.argv[1:])
+    if HTTP_CACHE["enabled"] is True:
+        prune_http_cache()
+    # Backfill past rosters instead of scraping stats
+    if ROSTER_BACKFILL["enabled"] is True:
+        backfill_roster_data(rel_dir, ROSTER_BACKFILL["years"])
+        HOST_SCHEDULER.print_summary()
+        return 0
 
     # Check for scrape_year command line arg
-    if len(sys.argv) == 2:
+    if len(args) == 1:
         print("ARGUMENTS DETECTED: " + str(sys.argv))
         # "-a" scrapes current year, else scrape for given year
-        if sys.argv[1] == "-a":
+        if args[0] == "-a":
             print("Setting year to: " + str(datetime.now().year))
             scrape_year = get_scrape_year(str(datetime.now().year))
         else:
-            print("Setting year to: " + str(sys.argv[1]))
-            scrape_year = get_scrape_year(sys.argv[1])
+            print("Setting year to: " + str(args[0]))
+            scrape_year = get_scrape_year(args[0])
         # Bypass all user input functions and set flags for scraping
         arg_bypass = True
         npb_scrape_yn = "Y"
@@ -81,7 +330,7 @@ def main():
         stat_zip_yn = "N"
         roster_data_yn = "Y"
         career_yn = "N"
-    elif len(sys.argv) > 2:
+    elif len(args) > 1:
         print(
             "ERROR: Too many arguments. Try using the desired stat year or use '-a' to scrape for the current year."
         )
@@ -105,184 +354,82 @@ def main():
 
     # Create year directory
     year_dir = os.path.join(stats_dir, scrape_year)
-    if not os.path.exists(year_dir):
-        os.mkdir(year_dir)
+    os.makedirs(year_dir, exist_ok=True)
 
-    # Roster data update
+    # Every scrape and organization step is a node of the run's task graph.
+    # Fetches run on threads, organizers on worker processes, and each node
+    # starts once the nodes it depends on have finished
+    graph = TaskGraph()
     if roster_data_yn == "Y":
-        if scrape_year != str(datetime.now().year):
-            print(
-                "WARNING: scrape year does not match current year, skipping roster update."
-            )
-        # else:
-        print("Updating roster_data.csv...")
-        # TODO: put a year check so old raw files dont get overwritten
-        get_roster_data(year_dir, "en", scrape_year)
-        get_roster_data(year_dir, "jp", scrape_year)
-        org_roster_data(year_dir, rel_dir, scrape_year)
+        graph.add("roster", update_roster_data, args=(rel_dir, year_dir, scrape_year))
     else:
         print("Skipping roster update...")
+    # roster_data.csv is read while organizing, so every organizer waits on it
+    roster_node = ["roster"] if roster_data_yn == "Y" else []
+    add_scrape_nodes(
+        graph, input_dir, year_dir, scrape_year, npb_scrape_yn, farm_scrape_yn
+    )
 
-    if npb_scrape_yn == "Y":
-        # Scrape regular season batting and pitching URLs
-        get_stats(input_dir, year_dir, "BR", scrape_year)
-        get_stats(input_dir, year_dir, "PR", scrape_year)
-        get_gsheets_data(input_dir, year_dir, "BR", scrape_year, "player")
-        get_gsheets_data(input_dir, year_dir, "PR", scrape_year, "player")
-        get_gsheets_data(input_dir, year_dir, "BR", scrape_year, "team")
-        get_gsheets_data(input_dir, year_dir, "PR", scrape_year, "team")
-        get_standings(year_dir, "C_npb", scrape_year)
-        get_standings(year_dir, "P_npb", scrape_year)
-        get_fielding(year_dir, "R", scrape_year)
     # NPB Daily Scores (only executes on current year)
     if scrape_year == str(datetime.now().year):
-        if npb_scrape_yn == "Y":
-            get_daily_scores(year_dir, "R", scrape_year)
-        npb_daily_scores = DailyScoresData(stats_dir, year_dir, "R", scrape_year)
-        npb_daily_scores.output_final()
-    # NPB Individual Fielding
-    # NOTE: fielding must be organized before any player stats to obtain player
-    # positions
-    npb_fielding = FieldingData(stats_dir, year_dir, "R", scrape_year)
-    # NPB Team Fielding
-    npb_team_fielding = TeamFieldingData(
-        npb_fielding.df, stats_dir, year_dir, "R", scrape_year
-    )
-    # NPB Standings
-    # NOTE: standings must be organized before any player stats to calculate correct IP/PA drop consts
-    npb_central_standings = StandingsData(stats_dir, year_dir, "C_npb", scrape_year)
-    npb_pacific_standings = StandingsData(stats_dir, year_dir, "P_npb", scrape_year)
-    # NPB Player stats
-    npb_bat_player_stats = PlayerData(stats_dir, year_dir, "BR", scrape_year)
-    npb_pitch_player_stats = PlayerData(stats_dir, year_dir, "PR", scrape_year)
-    # Adding positions to batting stats
-    npb_bat_player_stats.append_positions(npb_fielding.df, npb_pitch_player_stats.df)
-    # NPB Team stats
-    npb_bat_team_stats = TeamData(
-        npb_bat_player_stats.df, stats_dir, year_dir, "BR", scrape_year
-    )
-    npb_pitch_team_stats = TeamData(
-        npb_pitch_player_stats.df, stats_dir, year_dir, "PR", scrape_year
-    )
-    # NPB team summary
-    npb_team_summary = TeamSummaryData(
-        npb_team_fielding.df,
-        npb_central_standings.df,
-        npb_pacific_standings.df,
-        npb_bat_team_stats.df,
-        npb_pitch_team_stats.df,
-        stats_dir,
-        year_dir,
-        "R",
-        scrape_year,
-    )
-    # NPB output
-    npb_bat_player_stats.output_final()
-    npb_pitch_player_stats.output_final()
-    npb_bat_team_stats.output_final()
-    npb_pitch_team_stats.output_final()
-    npb_central_standings.output_final(npb_bat_team_stats.df, npb_pitch_team_stats.df)
-    npb_pacific_standings.output_final(npb_bat_team_stats.df, npb_pitch_team_stats.df)
-    npb_fielding.output_final()
-    npb_team_fielding.output_final()
-    npb_team_summary.output_final()
-    print("Regular season statistics finished!\n")
-
-    if farm_scrape_yn == "Y":
-        get_stats(input_dir, year_dir, "BF", scrape_year)
-        get_stats(input_dir, year_dir, "PF", scrape_year)
-        get_standings(year_dir, "E_farm", scrape_year)
-        get_standings(year_dir, "W_farm", scrape_year)
-        if int(scrape_year) >= 2026:
-            get_standings(year_dir, "C_farm", scrape_year)
-        get_fielding(year_dir, "F", scrape_year)
-    # Farm Fielding
-    farm_fielding = FieldingData(stats_dir, year_dir, "F", scrape_year)
-    # NPB Team Fielding
-    farm_team_fielding = TeamFieldingData(
-        farm_fielding.df, stats_dir, year_dir, "F", scrape_year
-    )
-    # Farm Standings
-    farm_eastern_standings = StandingsData(stats_dir, year_dir, "E_farm", scrape_year)
-    farm_western_standings = StandingsData(stats_dir, year_dir, "W_farm", scrape_year)
-    if int(scrape_year) >= 2026:
-        farm_central_standings = StandingsData(
-            stats_dir, year_dir, "C_farm", scrape_year
-        )
-    # Farm Player stats
-    farm_bat_player_stats = PlayerData(stats_dir, year_dir, "BF", scrape_year)
-    farm_pitch_player_stats = PlayerData(stats_dir, year_dir, "PF", scrape_year)
-    # Adding positions to batting stats
-    farm_bat_player_stats.append_positions(farm_fielding.df, farm_pitch_player_stats.df)
-    # Farm Team stats
-    farm_bat_team_stats = TeamData(
-        farm_bat_player_stats.df, stats_dir, year_dir, "BF", scrape_year
-    )
-    farm_pitch_team_stats = TeamData(
-        farm_pitch_player_stats.df, stats_dir, year_dir, "PF", scrape_year
-    )
-    # Farm output
-    farm_bat_player_stats.output_final()
-    farm_pitch_player_stats.output_final()
-    farm_bat_team_stats.output_final()
-    farm_pitch_team_stats.output_final()
-    farm_eastern_standings.output_final(
-        farm_bat_team_stats.df, farm_pitch_team_stats.df
-    )
-    farm_western_standings.output_final(
-        farm_bat_team_stats.df, farm_pitch_team_stats.df
-    )
-    if int(scrape_year) >= 2026:
-        farm_central_standings.output_final(
-            farm_bat_team_stats.df, farm_pitch_team_stats.df
+        graph.add(
+            "daily_scores_npb",
+            org_daily_scores,
+            args=(stats_dir, year_dir, "R", scrape_year),
+            inputs=graph.scraped("daily_scores_raw"),
+            after=roster_node,
+            kind="cpu",
         )
-    farm_fielding.output_final()
-    farm_team_fielding.output_final()
-    print("Farm statistics finished!\n")
+    add_season_nodes(graph, stats_dir, year_dir, "npb", scrape_year, roster_node)
+    add_season_nodes(graph, stats_dir, year_dir, "farm", scrape_year, roster_node)
     # If there are no post season URLs in npb_urls.csv, skip post season
     bp_urls, _ = get_stat_urls("BP", scrape_year)
     pp_urls, _ = get_stat_urls("PP", scrape_year)
     if len(bp_urls) > 0 and len(pp_urls) > 0:
         # Post season stat scraping
         if post_scrape_yn == "Y":
-            get_post_season_stats(year_dir, "BP", scrape_year)
-            get_post_season_stats(year_dir, "PP", scrape_year)
-        # Post season player stats
-        post_bat_player_stats = PlayerData(stats_dir, year_dir, "BP", scrape_year)
-        post_pitch_player_stats = PlayerData(stats_dir, year_dir, "PP", scrape_year)
-        # Post season team stats
-        post_bat_team_stats = TeamData(
-            post_bat_player_stats.df, stats_dir, year_dir, "BP", scrape_year
-        )
-        post_pitch_team_stats = TeamData(
-            post_pitch_player_stats.df, stats_dir, year_dir, "PP", scrape_year
-        )
-        # Post season output
-        post_bat_player_stats.output_final()
-        post_pitch_player_stats.output_final()
-        post_bat_team_stats.output_final()
-        post_pitch_team_stats.output_final()
-        print("Post season statistics finished!\n")
+            graph.add(
+                "stats_raw_post",
+                get_all_stats,
+                args=(input_dir, year_dir, ["BP", "PP"], scrape_year),
+            )
+        add_season_nodes(graph, stats_dir, year_dir, "post", scrape_year, roster_node)
     else:
         print("No post season URLs detected in npb_urls.csv, skipping...")
+    # The FIP constants calculated by the pitching stats are saved once
+    fip_nodes = [
+        node
+        for node in graph.tasks
+        if node.startswith("pitch_") or node.startswith("team_pitch_")
+    ]
+    graph.add("fip_const", save_fip_constants, inputs=fip_nodes)
+    # Career stats include this year's final batting and pitching stats
+    if career_yn == "Y":
+        graph.add("career_raw", get_career_data, args=(rel_dir, scrape_year))
+    for suffix in ["bio", "B", "P"]:
+        graph.add(
+            "career_" + suffix,
+            org_career_data,
+            args=(stats_dir, suffix, scrape_year),
+            after=graph.scraped("career_raw")
+            + ["output_bat_npb", "output_pitch_npb", "fip_const"],
+            kind="cpu",
+        )
+    RAW_OUTPUT["background"] = True
+    try:
+        graph.run()
+    finally:
+        # Wait for the Raw files saved in the background
+        flush_raw_writes()
+        RAW_OUTPUT["background"] = False
+    print("All statistics finished!\n")
 
     # Make upload zips for manual uploads/debugging
     if stat_zip_yn == "Y":
         print("Creating upload zip for given year.")
         make_zip(year_dir, "S", scrape_year)
 
-    # Career data scrape and organize
-    if career_yn == "Y":
-        get_career_data(rel_dir, scrape_year)
-    career_bio_df = CareerData(
-        stats_dir, os.path.join(stats_dir, "all"), "bio", scrape_year
-    )
-    career_bat_df = CareerData(
-        stats_dir, os.path.join(stats_dir, "all"), "B", scrape_year
-    )
-    career_pitch_df = CareerData(
-        stats_dir, os.path.join(stats_dir, "all"), "P", scrape_year
-    )
+    HOST_SCHEDULER.print_summary()
 
     if arg_bypass is False:
         _ = input("Press Enter to exit. ")
@@ -290,6 +437,406 @@ def main():
     return 0
 
 
+class TaskGraph:
+    """A run's scrape and organization steps declared as a dependency graph.
+    Nodes whose dependencies have finished run concurrently, I/O bound nodes
+    on a thread pool and CPU bound nodes on a process pool. A node's
+    function is called with its args followed by the results of its inputs,
+    so "cpu" nodes need picklable top-level functions, arguments and results
+
+    Attributes:
+        tasks (dict): Node name to its function, args, inputs, after and kind
+    """
+
+    def __init__(self):
+        self.tasks = {}
+
+    def add(self, name, func, args=(), inputs=(), after=(), kind="io"):
+        """Adds a node to the graph. Dependencies have to be added first,
+        which also keeps the graph free of cycles
+
+        Parameters:
+        name (string): The node's unique name
+        func (function): Called with args + the results of the input nodes
+        args (tuple): Leading positional arguments of func
+        inputs (list): Nodes whose results are passed to func (in order)
+        after (list): Nodes that must finish first, results aren't passed
+        kind (string): "io" = run on a thread, "cpu" = run on a process"""
+        for dep in list(inputs) + list(after):
+            if dep not in self.tasks:
+                raise ValueError(f"Task {name} depends on unknown task {dep}")
+        self.tasks[name] = {
+            "func": func,
+            "args": tuple(args),
+            "inputs": list(inputs),
+            "after": list(after),
+            "kind": kind,
+        }
+
+    def scraped(self, name):
+        """Returns [name] if the node was added to the graph, else [] (used for
+        scrape nodes that only exist when the user chose to scrape)"""
+        return [name] if name in self.tasks else []
+
+    def run(self):
+        """Runs every node, starting each as soon as its dependencies finish.
+        The first failing node cancels the nodes that haven't started yet and
+        its exception is raised
+
+        Returns:
+        results (dict): Node name to the value its function returned"""
+        results = {}
+        pending = dict(self.tasks)
+        running = {}
+        # Worker processes are spawned, forking a process with scraper threads
+        # running isn't safe
+        with ThreadPoolExecutor(
+            max_workers=TASK_WORKERS["io"]
+        ) as threads, ProcessPoolExecutor(
+            max_workers=TASK_WORKERS["cpu"],
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as processes:
+            while len(pending) > 0 or len(running) > 0:
+                for name, task in list(pending.items()):
+                    if not all(
+                        dep in results for dep in task["inputs"] + task["after"]
+                    ):
+                        continue
+                    pool = processes if task["kind"] == "cpu" else threads
+                    dep_results = [results[dep] for dep in task["inputs"]]
+                    future = pool.submit(task["func"], *task["args"], *dep_results)
+                    running[future] = name
+                    del pending[name]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        print(f"ERROR: Task {name} failed, stopping...")
+                        for other in running:
+                            other.cancel()
+                        raise error
+                    results[name] = future.result()
+        return results
+
+
+def add_scrape_nodes(graph, input_dir, year_dir, year, npb_scrape_yn, farm_scrape_yn):
+    """Adds the regular season and farm scrape nodes a run needs to its graph.
+    Scrape nodes return the scraped tables that the organizer nodes take in
+
+    Parameters:
+    graph (TaskGraph): The run's task graph
+    input_dir (string): The directory that holds the input files
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    year (string): The year being scraped
+    npb_scrape_yn (string): "Y" = scrape the regular season
+    farm_scrape_yn (string): "Y" = scrape the farm league"""
+    fielding_suffixes = []
+    if npb_scrape_yn == "Y":
+        # Scrape regular season batting and pitching URLs
+        graph.add(
+            "stats_raw_npb", get_all_stats, args=(input_dir, year_dir, ["BR", "PR"], year)
+        )
+        graph.add(
+            "gsheets_raw",
+            get_all_gsheets_data,
+            args=(
+                input_dir,
+                year_dir,
+                year,
+                [("BR", "player"), ("PR", "player"), ("BR", "team"), ("PR", "team")],
+            ),
+        )
+        for suffix in ["C_npb", "P_npb"]:
+            graph.add(
+                "standings_raw_" + suffix, get_standings, args=(year_dir, suffix, year)
+            )
+        fielding_suffixes.append("R")
+        # NPB Daily Scores (only executes on current year)
+        if year == str(datetime.now().year):
+            graph.add(
+                "daily_scores_raw", get_daily_scores, args=(year_dir, "R", year)
+            )
+    if farm_scrape_yn == "Y":
+        graph.add(
+            "stats_raw_farm", get_all_stats, args=(input_dir, year_dir, ["BF", "PF"], year)
+        )
+        for suffix in get_farm_leagues(year):
+            graph.add(
+                "standings_raw_" + suffix, get_standings, args=(year_dir, suffix, year)
+            )
+        fielding_suffixes.append("F")
+    # One node downloads both fielding CSVs, the browser is bound to its thread
+    if len(fielding_suffixes) > 0:
+        graph.add(
+            "fielding_raw", get_all_fielding, args=(year_dir, fielding_suffixes, year)
+        )
+
+
+def add_season_nodes(graph, stats_dir, year_dir, season, year, roster_node):
+    """Adds a season's organization and output nodes to the run's graph:
+    StandingsData -> PlayerData -> TeamData -> TeamSummaryData, then each
+    output_final(). Seasons are added in the order npb, farm, post, which is
+    also the order their FIP constants are saved in
+
+    Parameters:
+    graph (TaskGraph): The run's task graph
+    stats_dir (string): The directory that holds all year stats
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    season (string): "npb", "farm" or "post"
+    year (string): The year being organized
+    roster_node (list): The roster update node, if the run updates rosters"""
+    bat_suffix, pitch_suffix = {
+        "npb": ("BR", "PR"),
+        "farm": ("BF", "PF"),
+        "post": ("BP", "PP"),
+    }[season]
+    standings_suffixes = {
+        "npb": ["C_npb", "P_npb"],
+        "farm": get_farm_leagues(year),
+        "post": [],
+    }[season]
+    stat_inputs = graph.scraped("stats_raw_" + season)
+    # Only the regular season has Google Sheet stats
+    gsheets_node = graph.scraped("gsheets_raw") if season == "npb" else []
+    org_args = (stats_dir, year_dir)
+
+    # NOTE: standings must be organized before player stats are output to
+    # calculate correct IP/PA drop consts
+    for suffix in standings_suffixes:
+        graph.add(
+            "standings_" + suffix,
+            StandingsData,
+            args=org_args + (suffix, year),
+            inputs=graph.scraped("standings_raw_" + suffix),
+            after=roster_node,
+            kind="cpu",
+        )
+    # Player stats
+    graph.add(
+        "pitch_" + season,
+        org_player_data,
+        args=org_args + (pitch_suffix, year),
+        inputs=stat_inputs,
+        after=roster_node + gsheets_node,
+        kind="cpu",
+    )
+    bat_after = roster_node + gsheets_node
+    if season == "post":
+        graph.add(
+            "bat_" + season,
+            org_player_data,
+            args=org_args + (bat_suffix, year),
+            inputs=stat_inputs,
+            after=bat_after,
+            kind="cpu",
+        )
+    else:
+        # NOTE: fielding must be organized before any player stats to obtain
+        # player positions
+        field_suffix = "R" if season == "npb" else "F"
+        graph.add(
+            "fielding_" + season,
+            org_fielding_data,
+            args=org_args + (field_suffix, year),
+            inputs=graph.scraped("fielding_raw"),
+            after=roster_node,
+            kind="cpu",
+        )
+        graph.add(
+            "team_fielding_" + season,
+            org_team_fielding_data,
+            args=org_args + (field_suffix, year),
+            inputs=["fielding_" + season],
+            kind="cpu",
+        )
+        graph.add(
+            "bat_" + season,
+            org_bat_player_data,
+            args=org_args + (bat_suffix, year),
+            inputs=["fielding_" + season, "pitch_" + season] + stat_inputs,
+            after=bat_after,
+            kind="cpu",
+        )
+    # Team stats
+    for stat_type, suffix in [("bat", bat_suffix), ("pitch", pitch_suffix)]:
+        graph.add(
+            "team_" + stat_type + "_" + season,
+            org_team_data,
+            args=org_args + (suffix, year),
+            inputs=[stat_type + "_" + season],
+            after=gsheets_node,
+            kind="cpu",
+        )
+    if season == "npb":
+        graph.add(
+            "team_summary_npb",
+            org_team_summary_data,
+            args=org_args + ("R", year),
+            inputs=[
+                "team_fielding_npb",
+                "standings_C_npb",
+                "standings_P_npb",
+                "team_bat_npb",
+                "team_pitch_npb",
+            ],
+            kind="cpu",
+        )
+
+    # Output
+    output_nodes = ["bat", "pitch", "team_bat", "team_pitch"]
+    if season != "post":
+        output_nodes += ["fielding", "team_fielding"]
+    if season == "npb":
+        output_nodes.append("team_summary")
+    for node in output_nodes:
+        graph.add(
+            "output_" + node + "_" + season,
+            output_stats,
+            inputs=[node + "_" + season],
+            # Qualifiers are based on the drop consts saved by StandingsData
+            after=["standings_" + suffix for suffix in standings_suffixes]
+            if node in ("bat", "pitch")
+            else [],
+            kind="cpu",
+        )
+    # Standings are output with the team stats' final (output) dataframes
+    for suffix in standings_suffixes:
+        graph.add(
+            "output_standings_" + suffix,
+            output_standings,
+            inputs=[
+                "standings_" + suffix,
+                "output_team_bat_" + season,
+                "output_team_pitch_" + season,
+            ],
+            kind="cpu",
+        )
+
+
+def get_farm_leagues(year):
+    """Returns the farm league standings suffixes of a year (the farm Central
+    league starts in 2026)"""
+    farm_leagues = ["E_farm", "W_farm"]
+    if int(year) >= 2026:
+        farm_leagues.append("C_farm")
+    return farm_leagues
+
+
+def update_roster_data(rel_dir, year_dir, year):
+    """Scrapes the year's npb.jp rosters and rebuilds its roster_data.csv. Past
+    years are skipped, their roster_data.csv is only rebuilt from archived
+    rosters with --backfill-rosters
+
+    Parameters:
+    rel_dir (string): The directory of npb_scrape.py
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    year (string): The year of the rosters"""
+    if year != str(datetime.now().year):
+        # npb.jp roster pages only show the current season
+        print(
+            "WARNING: scrape year does not match current year, skipping roster "
+            "update (use --backfill-rosters to rebuild past rosters)."
+        )
+        return
+    print("Updating roster_data.csv...")
+    get_roster_data(year_dir, "en", year)
+    get_roster_data(year_dir, "jp", year)
+    org_roster_data(year_dir, rel_dir, year)
+
+
+def get_all_fielding(year_dir, suffixes, year):
+    """Downloads the fielding CSVs of several suffixes with one browser
+    session, which is started and closed on the calling thread
+
+    Parameters:
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    suffixes (list): Fielding suffixes ("R", "F") to download
+    year (string): The year of fielding stats
+
+    Returns:
+    fielding_dfs (dict): Suffix to its scraped fielding dataframe"""
+    with FieldingBrowser() as browser:
+        return {
+            suffix: get_fielding(year_dir, suffix, year, browser)
+            for suffix in suffixes
+        }
+
+
+def org_player_data(stats_dir, year_dir, suffix, year, stat_dfs=None):
+    """Returns the organized PlayerData of a suffix, stat_dfs holds the scraped
+    stat tables by suffix (None reads the Raw file)"""
+    return PlayerData(stats_dir, year_dir, suffix, year, (stat_dfs or {}).get(suffix))
+
+
+def org_bat_player_data(
+    stats_dir, year_dir, suffix, year, fielding, pitch_stats, stat_dfs=None
+):
+    """Returns the organized batting PlayerData of a suffix with positions
+    added from the FieldingData and pitching PlayerData"""
+    bat_stats = org_player_data(stats_dir, year_dir, suffix, year, stat_dfs)
+    bat_stats.append_positions(fielding.df, pitch_stats.df)
+    return bat_stats
+
+
+def org_fielding_data(stats_dir, year_dir, suffix, year, fielding_dfs=None):
+    """Returns the organized FieldingData of a suffix, fielding_dfs holds the
+    scraped fielding tables by suffix (None reads the Raw file)"""
+    return FieldingData(
+        stats_dir, year_dir, suffix, year, (fielding_dfs or {}).get(suffix)
+    )
+
+
+def org_team_fielding_data(stats_dir, year_dir, suffix, year, fielding):
+    """Returns the TeamFieldingData organized from a FieldingData"""
+    return TeamFieldingData(fielding.df, stats_dir, year_dir, suffix, year)
+
+
+def org_team_data(stats_dir, year_dir, suffix, year, player_stats):
+    """Returns the TeamData organized from a PlayerData"""
+    return TeamData(player_stats.df, stats_dir, year_dir, suffix, year)
+
+
+def org_team_summary_data(
+    stats_dir, year_dir, suffix, year, team_fielding, central, pacific, team_bat, team_pitch
+):
+    """Returns the TeamSummaryData of the organized team fielding, standings
+    and team stats"""
+    return TeamSummaryData(
+        team_fielding.df,
+        central.df,
+        pacific.df,
+        team_bat.df,
+        team_pitch.df,
+        stats_dir,
+        year_dir,
+        suffix,
+        year,
+    )
+
+
+def org_daily_scores(stats_dir, year_dir, suffix, year, raw_df=None):
+    """Organizes and outputs the daily scores"""
+    DailyScoresData(stats_dir, year_dir, suffix, year, raw_df).output_final()
+
+
+def org_career_data(stats_dir, suffix, year):
+    """Organizes the career stats of a suffix ("bio", "B" or "P")"""
+    CareerData(stats_dir, os.path.join(stats_dir, "all"), suffix, year)
+
+
+def output_stats(stats):
+    """Outputs a stat object's final files, returns the object since
+    output_final() can change its dataframe"""
+    stats.output_final()
+    return stats
+
+
+def output_standings(standings, team_bat, team_pitch):
+    """Outputs a StandingsData's final files using the output team stats"""
+    standings.output_final(team_bat.df, team_pitch.df)
+
+
 class Stats:
     """Base class for all NPB/Farm League statistic dataframes.
 
@@ -322,6 +869,8 @@ class Stats:
         self.year = year
         self.year_dir = year_dir
         self.df = pd.DataFrame()
+        # FIP constants calculated by this object, by (Year, League)
+        self.fip_updates = {}
 
     def __str__(self):
         """Outputs the Alt view of the associated dataframe (no HTML team or
@@ -334,8 +883,12 @@ class Stats:
         player names shows entire df instead of only Leaders if applicable)"""
         return self.df.to_csv()
 
-    def org_player_bat(self, suffix, year):
-        """Organize the raw batting stat csv and add additional stats"""
+    def org_player_bat(self, suffix, year, by_year=False):
+        """Organize the raw batting stat csv and add additional stats
+
+        by_year (bool): True if the df holds several years (career stats), so
+        league totals are summed per Year and Google Sheet stats are left to
+        the caller"""
         # TODO: make roster_revisions check in check_input_files
         if "ParkF" not in self.df.columns:
             self.df = select_park_factor(self.df, self.suffix, year)
@@ -356,48 +909,41 @@ class Stats:
         )
 
         # Skip if older than 2014 - player data is missing, creating bad sums/avgs
-        if int(year) >= 2014:
-            # Counting stat column totals used in other calculations
-            total_obp = (
-                self.df["H"].sum() + self.df["BB"].sum() + self.df["HP"].sum()
-            ) / (
-                self.df["AB"].sum()
-                + self.df["BB"].sum()
-                + self.df["HP"].sum()
-                + self.df["SF"].sum()
+        if by_year or int(year) >= 2014:
+            # Counting stat column totals used in other calculations (per row's
+            # year for career stats)
+            total_cols = ["H", "2B", "3B", "HR", "AB", "BB", "HP", "SF", "SB", "CS"]
+            if by_year:
+                lg = self.df.groupby(self.df["Year"].astype(str), sort=False)[
+                    total_cols
+                ].transform("sum")
+            else:
+                lg = self.df[total_cols].sum()
+            total_obp = (lg["H"] + lg["BB"] + lg["HP"]) / (
+                lg["AB"] + lg["BB"] + lg["HP"] + lg["SF"]
             )
+            lg_single = lg["H"] - lg["2B"] - lg["3B"] - lg["HR"]
             total_slg = (
-                (
-                    self.df["H"].sum()
-                    - self.df["2B"].sum()
-                    - self.df["3B"].sum()
-                    - self.df["HR"].sum()
-                )
-                + (2 * self.df["2B"].sum())
-                + (3 * self.df["3B"].sum())
-                + (4 * self.df["HR"].sum())
-            ) / self.df["AB"].sum()
+                lg_single + (2 * lg["2B"]) + (3 * lg["3B"]) + (4 * lg["HR"])
+            ) / lg["AB"]
             self.df["OPS+"] = 100 * (
                 (self.df["OBP"] / total_obp) + (self.df["SLG"] / total_slg) - 1
             )
             self.df["OPS+"] = self.df["OPS+"] / self.df["ParkF"]
-            lg_single = (
-                self.df["H"].sum()
-                - self.df["2B"].sum()
-                - self.df["3B"].sum()
-                - self.df["HR"].sum()
-            )
             pl_single = self.df["H"] - self.df["2B"] - self.df["3B"] - self.df["HR"]
             wsb_a = 0.17 * self.df["SB"] - 0.33 * self.df["CS"]
-            wsb_b = (self.df["SB"].sum() * 0.17 + self.df["CS"].sum() * -0.33) / (
-                lg_single + self.df["BB"].sum() + self.df["HP"].sum()
+            wsb_b = (lg["SB"] * 0.17 + lg["CS"] * -0.33) / (
+                lg_single + lg["BB"] + lg["HP"]
             )
             wsb_c = pl_single + self.df["BB"] + self.df["HP"]
             self.df["wSB"] = wsb_a - wsb_b * wsb_c
+            if by_year:
+                before_2014 = pd.to_numeric(self.df["Year"], errors="coerce") < 2014
+                self.df.loc[before_2014, ["OPS+", "wSB"]] = np.nan
 
         # Import additional NPB data from Google Sheets
         # TODO: errors out when passing career data for append bat and pitch gsheet data
-        if self.suffix in ("BR", "B") and 2021 <= int(year):
+        if not by_year and self.suffix in ("BR", "B") and 2021 <= int(year):
             self.append_gsheets_batter_data(year)
 
     def org_player_pitch(self, suffix, year):
@@ -422,7 +968,7 @@ class Stats:
         if int(year) >= 2014:
             # Counting stat column totals
             total_era = 9 * (self.df["ER"].sum() / self.df["IP"].sum())
-            fip_const = self.calculate_fip_const()
+            fip_const = get_fip_constant(year, self.get_fip_league())
             total_fip = (
                 (
                     13 * self.df["HR"].sum()
@@ -457,64 +1003,29 @@ class Stats:
         # Changing .33 to .1 and .66 to .2 in the IP column
         self.df["IP"] = convert_ip_column_out(self.df, "IP")
 
-    def calculate_fip_const(self):
-        """
-        Calculate the FIP (Fielding Independent Pitching) constant for a league.
-
-        The FIP constant adjusts the FIP formula to align with actual ERA. It is
-        calculated using the formula: FIP_const = lg_RA - (numerator / IP), where
-        lg_RA is the league's runs allowed per inning and the numerator combines
-        home runs, walks, hit-by-pitch, and strikeouts.
-
-        Returns:
-        fip_const (float): The FIP constant for the given year and league (NPB or Farm).
-
-        Process:
-            1. Reads the fallback FIP constants from input/fip_const.csv.
-            2. Determines whether to use NPB or Farm constants based on suffix.
-            3. If required columns (R, IP, HR, BB, IBB, HB, SO) are present in the
-               dataframe, calculates a fresh FIP constant from the data:
-               - Computes league runs allowed per 9 innings (lg_ra)
-               - Applies the FIP formula numerator
-               - Stores the calculated value back to the CSV for future use
-            4. Otherwise, falls back to the pre-existing value from the CSV.
-        """
-        fip_df = pd.read_csv(os.path.dirname(__file__) + "/input/fip_const.csv")
+    def get_fip_league(self):
+        """Returns the league ("NPB" or "Farm") that the object's FIP
+        constants are stored under in the FIP constant table"""
         if self.suffix in ("BF", "PF"):
-            fip_suffix = "Farm"
-        else:
-            fip_suffix = "NPB"
-
-        # Calculate a fresh FIP constant if all columns are present
-        if {"R", "IP", "HR", "BB", "IBB", "HB", "SO"}.issubset(self.df.columns):
-            lg_ra = self.df["R"].sum() * 9 / self.df["IP"].sum()
-            numerator = (
-                (13 * self.df["HR"].sum())
-                + (
-                    3
-                    * (self.df["BB"].sum() - self.df["IBB"].sum() + self.df["HB"].sum())
-                )
-                - (2 * self.df["SO"].sum())
-            )
-            fip_const = lg_ra - ((numerator) / (self.df["IP"].sum()))
-            # Store new FIP constant
-            fip_df.loc[
-                (fip_df["Year"].astype(str) == self.year)
-                & (fip_df["League"] == fip_suffix),
-                "FIP",
-            ] = fip_const
-            fip_df.to_csv(
-                (os.path.dirname(__file__) + "/input/fip_const.csv"), index=False
-            )
-        # Using year and suffix, determine FIP constant to use from fallback CSV
-        else:
-            filtered = fip_df[
-                (fip_df["Year"].astype(str) == self.year)
-                & (fip_df["League"] == fip_suffix)
-            ]
-            fip_const = filtered["FIP"].iloc[-1]
+            return "Farm"
+        return "NPB"
 
-        return fip_const
+    def update_fip_constants(self, df, years):
+        """Calculates the FIP constant of every year in pitching stats with one
+        groupby (see compute_fip_constants()) and stores them in the in-memory
+        FIP constant table and in fip_updates. The table is written to
+        input/fip_const.csv once per run by save_fip_constants(). A df without
+        every column the constant needs stores nothing, and the constants from
+        input/fip_const.csv are looked up instead
+
+        Parameters:
+        df (pandas dataframe): Pitching stats
+        years (pandas series or string): Each row's year, or the year of every
+        row"""
+        fip_consts = compute_fip_constants(df, years, self.get_fip_league())
+        for (year, league), fip_const in fip_consts.items():
+            set_fip_constant(year, league, fip_const)
+            self.fip_updates[(year, league)] = fip_const
 
     def fix_raw_pitch_col(self):
         """Converts IP and ERA cols to appropriate float types"""
@@ -576,11 +1087,8 @@ class Stats:
             year (str): The season year used to locate the raw CSV file.
         """
         # Read in raw Google Sheet file
-        gsheet_df = pd.read_csv(
-            os.path.join(self.stats_dir, year)
-            + "/raw/"
-            + year
-            + "GSheetsRawPR_player.csv"
+        gsheet_df = read_gsheets_data(
+            os.path.join(self.stats_dir, year), year, "PR", "player"
         )
         # Standardize column names
         gsheet_df = gsheet_df.rename(
@@ -655,20 +1163,42 @@ class Stats:
     def append_gsheets_batter_data(self, year):
         """Appends Google Sheets batter data to the main dataframe.
 
-        Reads raw Google Sheets batter data from a CSV file, standardizes
-        team and player column names, maps abbreviated team names to full
-        names, filters out percentile, null, and error columns, and merges
-        the resulting data with the main dataframe on Player and Team.
+        Merges the year's Google Sheets batter data (see
+        read_gsheets_batter_data()) with the main dataframe on Player and
+        Team and adds the stats based on it.
+
+        Args:
+            year (str): The season year used to locate the raw CSV file.
+        """
+        gsheet_df = self.read_gsheets_batter_data(year)
+        # Merge only needed columns from gsheet_df
+        self.df = pd.merge(
+            gsheet_df,
+            self.df,
+            on=["Player", "Team"],
+            how="right",
+        )
+
+        # Calculate new stats based off of GSheet stats
+        self.df["GB/FB"] = self.df["GB%"] / self.df["FB%"]
+
+    def read_gsheets_batter_data(self, year):
+        """Reads a year's Google Sheets batter data for merging.
+
+        Reads raw Google Sheets batter data, standardizes team and player
+        column names, maps abbreviated team names to full names, filters out
+        percentile, null, and error columns and the columns already in the
+        main dataframe, and rescales percentages to whole numbers.
 
         Args:
             year (str): The season year used to locate the raw CSV file.
+
+        Returns:
+            pandas.DataFrame: The Player, Team and new Google Sheets columns.
         """
         # Read in raw Google Sheet file
-        gsheet_df = pd.read_csv(
-            os.path.join(self.stats_dir, year)
-            + "/raw/"
-            + year
-            + "GSheetsRawBR_player.csv"
+        gsheet_df = read_gsheets_data(
+            os.path.join(self.stats_dir, year), year, "BR", "player"
         )
         # Standardize team and batter column names
         gsheet_df = gsheet_df.rename(
@@ -725,17 +1255,7 @@ class Stats:
                 col_max = gsheet_df[col].max()
                 if pd.notna(col_max) and col_max < 1.0:
                     gsheet_df[col] = gsheet_df[col] * 100
-
-        # Merge only needed columns from gsheet_df
-        self.df = pd.merge(
-            gsheet_df,
-            self.df,
-            on=["Player", "Team"],
-            how="right",
-        )
-
-        # Calculate new stats based off of GSheet stats
-        self.df["GB/FB"] = self.df["GB%"] / self.df["FB%"]
+        return gsheet_df
 
     def rescale_pct_stats(self):
         """
@@ -796,10 +1316,13 @@ class PlayerData(Stats):
         append_positions(field_df, pitch_df):
             Adds the primary position of a player to the player DataFrame."""
 
-    def __init__(self, stats_dir, year_dir, suffix, year):
+    def __init__(self, stats_dir, year_dir, suffix, year, raw_df=None):
         super().__init__(stats_dir, year_dir, suffix, year)
-        # Initialize data frame to store stats
-        if os.path.exists(
+        # Initialize data frame to store stats, from the scraper when it ran
+        # this session, else from the Raw file
+        if raw_df is not None:
+            self.df = raw_df
+        elif os.path.exists(
             self.year_dir + "/raw/" + year + "StatsRaw" + suffix + ".csv"
         ):
             self.df = pd.read_csv(
@@ -813,6 +1336,7 @@ class PlayerData(Stats):
             self.org_player_bat(self.suffix, self.year)
         elif self.suffix in ("PF", "PR"):
             self.fix_raw_pitch_col()
+            self.update_fip_constants(self.df, self.year)
             self.org_player_pitch(self.suffix, self.year)
         elif self.suffix == "BP":
             self.org_post_player_bat()
@@ -1379,6 +1903,7 @@ class PlayerData(Stats):
         # Determine cumulative ERA between all rounds
         self.df["ERA"] = (9 * self.df["ER"]) / self.df["IP"]
         self.df = translate_players(self.df, self.suffix, self.year)
+        self.update_fip_constants(self.df, self.year)
         self.org_player_pitch(self.suffix, self.year)
 
     def org_post_player_bat(self):
@@ -1438,8 +1963,7 @@ class PlayerData(Stats):
         # of games that team has played"""
         # Make new raw const file in write mode (made in writeStandingsStats())
         const_dir = os.path.join(self.year_dir, "drop_const")
-        if not os.path.exists(const_dir):
-            os.mkdir(const_dir)
+        os.makedirs(const_dir, exist_ok=True)
 
         # Read in the correct raw const files for reg season or farm
         # Regular season team,game files
@@ -1510,7 +2034,7 @@ class PlayerData(Stats):
         # Fill NaN values in all colums with 0 (if needed)
         pivot_df = pivot_df.fillna(0)
         # Get primary positions
-        pivot_df["Pos"] = pivot_df.apply(assign_primary_or_utl, axis=1)
+        pivot_df["Pos"] = classify_positions(pivot_df)
         # Extract only the player name, team, and primary_position:
         temp_primary_df = pivot_df[["Player", "Pos", "Team"]]
         # Then merge if needed:
@@ -1697,92 +2221,42 @@ class TeamData(Stats):
     def org_team_bat(self):
         """Outputs batting team stat files using the organized player stat
         dataframes"""
-        # Initialize list to hold team stats
-        team_bat_list = []
-        # Form team stat rows
-        for team in self.player_df["Team"].unique():
-            temp_stat_df = self.player_df[self.player_df.Team == team]
-            temp_stat_df = temp_stat_df.apply(pd.to_numeric, errors="coerce")
-            new_team_stat = [
-                team,
-                temp_stat_df["PA"].sum(),
-                temp_stat_df["AB"].sum(),
-                temp_stat_df["R"].sum(),
-                temp_stat_df["H"].sum(),
-                temp_stat_df["2B"].sum(),
-                temp_stat_df["3B"].sum(),
-                temp_stat_df["HR"].sum(),
-                temp_stat_df["TB"].sum(),
-                temp_stat_df["RBI"].sum(),
-                temp_stat_df["SB"].sum(),
-                temp_stat_df["CS"].sum(),
-                temp_stat_df["SH"].sum(),
-                temp_stat_df["SF"].sum(),
-                temp_stat_df["SO"].sum(),
-                temp_stat_df["BB"].sum(),
-                temp_stat_df["IBB"].sum(),
-                temp_stat_df["HP"].sum(),
-                temp_stat_df["GDP"].sum(),
-                # AVG
-                temp_stat_df["H"].sum() / temp_stat_df["AB"].sum(),
-            ]
-            # Calculate OBP, SLG (needs calcs/totals of other stats)
-            total_obp = (
-                temp_stat_df["H"].sum()
-                + temp_stat_df["BB"].sum()
-                + temp_stat_df["HP"].sum()
-            ) / (
-                temp_stat_df["AB"].sum()
-                + temp_stat_df["BB"].sum()
-                + temp_stat_df["HP"].sum()
-                + temp_stat_df["SF"].sum()
-            )
-            new_team_stat.append(total_obp)
-            total_slg = (
-                (
-                    temp_stat_df["H"].sum()
-                    - temp_stat_df["2B"].sum()
-                    - temp_stat_df["3B"].sum()
-                    - temp_stat_df["HR"].sum()
-                )
-                + (2 * temp_stat_df["2B"].sum())
-                + (3 * temp_stat_df["3B"].sum())
-                + (4 * temp_stat_df["HR"].sum())
-            ) / temp_stat_df["AB"].sum()
-            new_team_stat.append(total_slg)
-            # OPS
-            new_team_stat.append(total_slg + total_obp)
-
-            # Append as a new team row in team_bat_list
-            team_bat_list.append(new_team_stat)
-
-        # Initialize dataframe and ensure stats are in numeric format
-        self.df = pd.DataFrame(team_bat_list, columns=self.col_init_arr)
-        cols = self.df.columns.drop(["Team"])
-        self.df[cols] = self.df[cols].apply(pd.to_numeric, errors="coerce")
+        # Sum every counting stat per team in one pass (teams keep the order
+        # they first appear in)
+        count_cols = self.col_init_arr[1:-4]
+        self.df = (
+            self.player_df[count_cols]
+            .apply(pd.to_numeric, errors="coerce")
+            .groupby(self.player_df["Team"], sort=False)
+            .sum()
+            .reset_index()
+        )
+        # League totals, shared by the league based stats and League Average
+        lg = self.df[count_cols].sum()
+        # Calculate AVG, OBP, SLG, OPS from the team totals
+        team_single = self.df["H"] - self.df["2B"] - self.df["3B"] - self.df["HR"]
+        self.df["AVG"] = self.df["H"] / self.df["AB"]
+        self.df["OBP"] = (self.df["H"] + self.df["BB"] + self.df["HP"]) / (
+            self.df["AB"] + self.df["BB"] + self.df["HP"] + self.df["SF"]
+        )
+        self.df["SLG"] = (
+            team_single
+            + (2 * self.df["2B"])
+            + (3 * self.df["3B"])
+            + (4 * self.df["HR"])
+        ) / self.df["AB"]
+        self.df["OPS"] = self.df["SLG"] + self.df["OBP"]
         # Retrieve park factors for any remaining team stats (EX: OPS+)
         self.df = select_park_factor(self.df, self.suffix, self.year)
 
         # Calculate OPS+, ISO, K%, BB%, BB/K, TTO%, BABIP, wSB
-        league_obp = (
-            self.df["H"].sum() + self.df["BB"].sum() + self.df["HP"].sum()
-        ) / (
-            self.df["AB"].sum()
-            + self.df["BB"].sum()
-            + self.df["HP"].sum()
-            + self.df["SF"].sum()
+        lg_single = lg["H"] - lg["2B"] - lg["3B"] - lg["HR"]
+        league_obp = (lg["H"] + lg["BB"] + lg["HP"]) / (
+            lg["AB"] + lg["BB"] + lg["HP"] + lg["SF"]
         )
         league_slg = (
-            (
-                self.df["H"].sum()
-                - self.df["2B"].sum()
-                - self.df["3B"].sum()
-                - self.df["HR"].sum()
-            )
-            + (2 * self.df["2B"].sum())
-            + (3 * self.df["3B"].sum())
-            + (4 * self.df["HR"].sum())
-        ) / self.df["AB"].sum()
+            lg_single + (2 * lg["2B"]) + (3 * lg["3B"]) + (4 * lg["HR"])
+        ) / lg["AB"]
         self.df["OPS+"] = (
             100 * ((self.df["OBP"] / league_obp) + (self.df["SLG"] / league_slg) - 1)
         ) / self.df["ParkF"]
@@ -1796,16 +2270,9 @@ class TeamData(Stats):
         self.df["BABIP"] = (self.df["H"] - self.df["HR"]) / (
             self.df["AB"] - self.df["SO"] - self.df["HR"] + self.df["SF"]
         )
-        lg_single = (
-            self.df["H"].sum()
-            - self.df["2B"].sum()
-            - self.df["3B"].sum()
-            - self.df["HR"].sum()
-        )
-        team_single = self.df["H"] - self.df["2B"] - self.df["3B"] - self.df["HR"]
         wsb_a = 0.17 * self.df["SB"] - 0.33 * self.df["CS"]
-        wsb_b = (self.df["SB"].sum() * 0.17 + self.df["CS"].sum() * -0.33) / (
-            lg_single + self.df["BB"].sum() + self.df["HP"].sum() - self.df["IBB"].sum()
+        wsb_b = (lg["SB"] * 0.17 + lg["CS"] * -0.33) / (
+            lg_single + lg["BB"] + lg["HP"] - lg["IBB"]
         )
         wsb_c = team_single + self.df["BB"] + self.df["HP"] - self.df["IBB"]
         self.df["wSB"] = wsb_a - wsb_b * wsb_c
@@ -1815,7 +2282,7 @@ class TeamData(Stats):
             self.year_dir, "raw", (self.year + "GSheetsRawBR_team.csv")
         )
         if os.path.exists(gsheet_path) and self.suffix == "BR":
-            gsheet_df = pd.read_csv(gsheet_path)
+            gsheet_df = read_gsheets_data(self.year_dir, self.year, "BR", "team")
             # Convert GSheets abbreviated names to merge with full team names in our df
             team_dict = {
                 "Hanshin": "Hanshin Tigers",
@@ -1866,19 +2333,16 @@ class TeamData(Stats):
         league_avg["OPS+"] = 100
         # Recalculate stats that are based on league averages
         league_avg["OPS"] = league_slg + league_obp
-        league_avg["AVG"] = self.df["H"].sum() / self.df["AB"].sum()
+        league_avg["AVG"] = lg["H"] / lg["AB"]
         league_avg["OBP"] = league_obp
         league_avg["SLG"] = league_slg
         league_avg["ISO"] = league_avg["SLG"] - league_avg["AVG"]
-        league_avg["BABIP"] = (self.df["H"].sum() - self.df["HR"].sum()) / (
-            self.df["AB"].sum()
-            - self.df["SO"].sum()
-            - self.df["HR"].sum()
-            + self.df["SF"].sum()
+        league_avg["BABIP"] = (lg["H"] - lg["HR"]) / (
+            lg["AB"] - lg["SO"] - lg["HR"] + lg["SF"]
         )
-        league_avg["K%"] = (self.df["SO"].sum() / self.df["PA"].sum()) * 100
-        league_avg["BB%"] = (self.df["BB"].sum() / self.df["PA"].sum()) * 100
-        league_avg["BB/K"] = self.df["BB"].sum() / self.df["SO"].sum()
+        league_avg["K%"] = (lg["SO"] / lg["PA"]) * 100
+        league_avg["BB%"] = (lg["BB"] / lg["PA"]) * 100
+        league_avg["BB/K"] = lg["BB"] / lg["SO"]
         # Calculate Google Sheet data league weighted averages
         if self.suffix == "BR" and self.gsheet_added is True:
             for col in new_gsheet_cols:
@@ -1894,53 +2358,28 @@ class TeamData(Stats):
         # IP column ".1 .2 .3" calculation fix
         self.player_df["IP"] = convert_ip_column_in(self.player_df, "IP")
 
-        # Initialize list to hold team stats
-        team_pitch_list = []
-        # Form team stat rows and collect only COUNTING stats
-        for team in self.player_df["Team"].unique():
-            temp_stat_df = self.player_df[self.player_df.Team == team]
-            temp_stat_df = temp_stat_df.apply(pd.to_numeric, errors="coerce")
-            new_team_stat = [
-                team,
-                temp_stat_df["W"].sum(),
-                temp_stat_df["L"].sum(),
-                temp_stat_df["SV"].sum(),
-                temp_stat_df["CG"].sum(),
-                temp_stat_df["SHO"].sum(),
-                temp_stat_df["BF"].sum(),
-                temp_stat_df["IP"].sum(),
-                temp_stat_df["H"].sum(),
-                temp_stat_df["HR"].sum(),
-                temp_stat_df["SO"].sum(),
-                temp_stat_df["BB"].sum(),
-                temp_stat_df["IBB"].sum(),
-                temp_stat_df["HB"].sum(),
-                temp_stat_df["WP"].sum(),
-                temp_stat_df["R"].sum(),
-                temp_stat_df["ER"].sum(),
-            ]
-            if self.suffix == "PR":
-                new_team_stat.insert(4, temp_stat_df["HLD"].sum())
-            team_pitch_list.append(new_team_stat)
-
-        # Initialize new team stat dataframe
-        self.df = pd.DataFrame(team_pitch_list, columns=self.col_init_arr)
+        # Sum every counting stat per team in one pass (teams keep the order
+        # they first appear in)
+        count_cols = self.col_init_arr[1:]
+        self.df = (
+            self.player_df[count_cols]
+            .apply(pd.to_numeric, errors="coerce")
+            .groupby(self.player_df["Team"], sort=False)
+            .sum()
+            .reset_index()
+        )
+        # League totals, shared by the league based stats and League Average
+        lg = self.df[count_cols].sum()
         # Create park factor col to use for any remaining team stats
         self.df = select_park_factor(self.df, self.suffix, self.year)
 
-        # Required league totals not in team df
-        total_ip = self.player_df["IP"].sum()
-        total_hr = self.player_df["HR"].sum()
-        total_so = self.player_df["SO"].sum()
-        total_bb = self.player_df["BB"].sum()
-        total_hb = self.player_df["HB"].sum()
-        total_er = self.player_df["ER"].sum()
-        total_bf = self.player_df["BF"].sum()
-        total_era = 9 * (total_er / total_ip)
-        total_kwera = 4.80 - (10 * ((total_so - total_bb) / total_bf))
-        fip_const = self.calculate_fip_const()
+        # League rate stats
+        total_era = 9 * (lg["ER"] / lg["IP"])
+        total_kwera = 4.80 - (10 * ((lg["SO"] - lg["BB"]) / lg["BF"]))
+        self.update_fip_constants(self.df, self.year)
+        fip_const = get_fip_constant(self.year, self.get_fip_league())
         total_fip = (
-            ((13 * total_hr) + (3 * (total_bb + total_hb)) - (2 * total_so)) / total_ip
+            ((13 * lg["HR"]) + (3 * (lg["BB"] + lg["HB"])) - (2 * lg["SO"])) / lg["IP"]
         ) + fip_const
 
         # Calculations for RATE stats
@@ -1974,7 +2413,7 @@ class TeamData(Stats):
             self.year_dir, "raw", (self.year + "GSheetsRawPR_team.csv")
         )
         if os.path.exists(gsheet_path) and self.suffix == "PR":
-            gsheet_df = pd.read_csv(gsheet_path)
+            gsheet_df = read_gsheets_data(self.year_dir, self.year, "PR", "team")
             # Convert GSheets abbreviated names to merge with full team names in our df
             team_dict = {
                 "Hanshin": "Hanshin Tigers",
@@ -2032,13 +2471,10 @@ class TeamData(Stats):
         league_avg["ERA-"] = 100
         league_avg["FIP-"] = 100
         league_avg["kwERA-"] = 100
-        league_avg["K%"] = (self.df["SO"].sum() / self.df["BF"].sum()) * 100
-        league_avg["BB%"] = (self.df["BB"].sum() / self.df["BF"].sum()) * 100
-        league_avg["HR%"] = (self.df["HR"].sum() / self.df["BF"].sum()) * 100
-        league_avg["K-BB%"] = (
-            (self.df["SO"].sum() / self.df["BF"].sum())
-            - (self.df["BB"].sum() / self.df["BF"].sum())
-        ) * 100
+        league_avg["K%"] = (lg["SO"] / lg["BF"]) * 100
+        league_avg["BB%"] = (lg["BB"] / lg["BF"]) * 100
+        league_avg["HR%"] = (lg["HR"] / lg["BF"]) * 100
+        league_avg["K-BB%"] = ((lg["SO"] / lg["BF"]) - (lg["BB"] / lg["BF"])) * 100
         # Calculate Google Sheet data league weighted averages
         if self.suffix == "PR" and self.gsheet_added is True:
             for col in new_gsheet_cols:
@@ -2269,21 +2705,28 @@ class StandingsData(Stats):
             such as runs scored (RS), runs allowed (RA), run differential
             (Diff), and expected winning percentage (XPCT)."""
 
-    def __init__(self, stats_dir, year_dir, suffix, year):
+    def __init__(self, stats_dir, year_dir, suffix, year, raw_df=None):
         """StandingsData new variables:
         df (pandas dataframe): Holds a league's standings stats
         const_df (pandas dataframe): 2 column df with team names and the games
-        they've played"""
+        they've played
+
+        raw_df (pandas dataframe): The scraped standings (see get_standings()),
+        the Raw file is read if None"""
         super().__init__(stats_dir, year_dir, suffix, year)
         # Initialize dataframe and year dir to store stats
-        self.df = pd.read_csv(
-            self.year_dir + "/raw/" + year + "StandingsRaw" + suffix + ".csv"
-        )
+        if raw_df is not None:
+            self.df = raw_df
+        else:
+            self.df = pd.read_csv(
+                self.year_dir + "/raw/" + year + "StandingsRaw" + suffix + ".csv"
+            )
 
         # Do bare minimum to prepare IP/PA const file for PlayerData objects
         # Further organization of stats comes later in output_final()
         # Drop last unnamed column
-        self.df.drop(self.df.columns[len(self.df.columns) - 1], axis=1, inplace=True)
+        if str(self.df.columns[-1]).startswith("Unnamed"):
+            self.df.drop(self.df.columns[-1], axis=1, inplace=True)
         # Replace all team entries with correct names from dictionary
         team_dict = {
             "HanshinTigers": "Hanshin Tigers",
@@ -2344,8 +2787,7 @@ class StandingsData(Stats):
         # Make Raw const df, file, and dir for IP/PA calculations
         self.const_df = self.df[["Team", "G"]]
         const_dir = os.path.join(self.year_dir, "drop_const")
-        if not os.path.exists(const_dir):
-            os.mkdir(const_dir)
+        os.makedirs(const_dir, exist_ok=True)
         new_csv_const = const_dir + "/" + self.year + "const_raw" + self.suffix + ".csv"
         self.const_df.to_csv(new_csv_const, index=False)
 
@@ -2486,14 +2928,20 @@ class FieldingData(Stats):
             Organizes raw fielding statistics and calculates additional metrics
             such as Total Zone Rating (TZR) and TZR per 143 games (TZR/143)."""
 
-    def __init__(self, stats_dir, year_dir, suffix, year):
+    def __init__(self, stats_dir, year_dir, suffix, year, raw_df=None):
         """FieldingData new variables:
-        df (pandas dataframe): Holds the individual fielding stats"""
+        df (pandas dataframe): Holds the individual fielding stats
+
+        raw_df (pandas dataframe): The scraped fielding stats (see
+        get_fielding()), the Raw file is read if None"""
         super().__init__(stats_dir, year_dir, suffix, year)
         # Initialize data frame to store stats
-        self.df = pd.read_csv(
-            self.year_dir + "/raw/" + year + "FieldingRaw" + suffix + ".csv"
-        )
+        if raw_df is not None:
+            self.df = raw_df
+        else:
+            self.df = pd.read_csv(
+                self.year_dir + "/raw/" + year + "FieldingRaw" + suffix + ".csv"
+            )
         # Modify df for correct stats
         self.org_fielding()
 
@@ -3046,14 +3494,20 @@ class DailyScoresData(Stats):
             Organizes raw daily game scores, converts team abbreviations to
             full names, and formats the data for presentation."""
 
-    def __init__(self, stats_dir, year_dir, suffix, year):
+    def __init__(self, stats_dir, year_dir, suffix, year, raw_df=None):
         """DailyScores new variables:
-        df (pandas dataframe): Holds the scores of the games"""
+        df (pandas dataframe): Holds the scores of the games
+
+        raw_df (pandas dataframe): The scraped scores (see get_daily_scores()),
+        the Raw file is read if None"""
         super().__init__(stats_dir, year_dir, suffix, year)
         # Initialize dataframe to store scores
-        self.df = pd.read_csv(
-            self.year_dir + "/raw/" + year + "DailyScoresRaw" + suffix + ".csv"
-        )
+        if raw_df is not None:
+            self.df = raw_df
+        else:
+            self.df = pd.read_csv(
+                self.year_dir + "/raw/" + year + "DailyScoresRaw" + suffix + ".csv"
+            )
         # Modify df for correct stats
         self.org_daily_scores()
 
@@ -3181,22 +3635,16 @@ class CareerData(Stats):
         organization method to process the data."""
         super().__init__(stats_dir, year_dir, suffix, year)
         # Load dataframe from file and organize data
+        raw_dir = os.path.join(self.stats_dir, self.year_dir, "raw")
         if self.suffix == "bio":
-            self.df = pd.read_csv(
-                os.path.join(self.stats_dir, self.year_dir, "raw", "raw_career_bio.csv")
-            )
+            self.df = read_raw_career_data(raw_dir, "bio")
+            self.df = self.df.rename_axis("Link").reset_index()
             self.org_career_bio()
         elif self.suffix == "B":
-            self.df = pd.read_csv(
-                os.path.join(self.stats_dir, self.year_dir, "raw", "raw_career_bat.csv")
-            )
+            self.df = read_raw_career_data(raw_dir, "bat")
             self.org_career_bat()
         elif self.suffix == "P":
-            self.df = pd.read_csv(
-                os.path.join(
-                    self.stats_dir, self.year_dir, "raw", "raw_career_pitch.csv"
-                )
-            )
+            self.df = read_raw_career_data(raw_dir, "pitch")
             self.org_career_pitch()
         else:
             self.df = pd.DataFrame()
@@ -3217,7 +3665,6 @@ class CareerData(Stats):
         10. Splits combined columns into separate ones (Height/Weight -> Height, Weight).
         11. Reorders columns to a standard layout."""
         self.df = self.df.drop(["経歴"], axis=1)
-        self.df.rename(columns={"Unnamed: 0": "Link"}, inplace=True)
         # Translate column names and players
         self.df.rename(
             columns={
@@ -3377,50 +3824,45 @@ class CareerData(Stats):
             inplace=True,
         )
         # TODO: fix so stats dont get "broken" (2016 and above are translated, 2016 and below stay jp) (likely need to make a master file)
-        # TODO: make a function to combine all roster_data.csvs? or make a mode parameter/look at suffix in translate_players()
         self.df = translate_players(self.df, self.suffix, self.year, mode="career")
         self.df = translate_teams(self.df, self.suffix)
 
-        # Get all unique years in the data
-        unique_years = self.df["Year"].astype(str).unique()
-
-        # Process each year separately to calculate year-specific averages
-        processed_dfs = []
-        original_df = self.df.copy()
-
-        for year in unique_years:
-            # Filter to single year
-            year_df = original_df[original_df["Year"].astype(str) == year].copy()
-
-            if year_df.empty:
-                continue
-
-            # Temporarily set self.df to the single-year dataframe
-            self.df = year_df
-
-            # Call org_player_bat with the single year
-            self.org_player_bat(self.suffix, year)
+        # Rows are grouped by year, in the order the years first appear
+        year_key = self.df["Year"].astype(str)
+        self.df = self.df.iloc[
+            np.argsort(pd.factorize(year_key)[0], kind="stable")
+        ].reset_index(drop=True)
+        years = list(dict.fromkeys(self.df["Year"].astype(str)))
+
+        if len(years) > 0:
+            # Calculate every year's stats at once, league totals per year
+            self.org_player_bat(self.suffix, self.year, by_year=True)
+            # Columns of each year's stats, used to keep the column order of
+            # the year by year results
+            year_cols = {}
+            for year in years:
+                year_cols[year] = [
+                    col
+                    for col in self.df.columns
+                    if int(year) >= 2014 or col not in ("OPS+", "wSB")
+                ]
+            self.append_career_gsheets_data(years, year_cols)
 
-            # Standardize all percentages for Streamlit display
+            # Standardize all percentages for Streamlit display, per year
+            year_key = self.df["Year"].astype(str)
             for col in self.df.columns.to_list():
                 # Most new columns that need rescaling end in % except for HR/FB
                 if "%" in col or col == "HR/FB":
                     # If there are entries under 1.0, then we need to rescale to whole number format
-                    col_max = self.df[col].max()
-                    if pd.notna(col_max) and col_max <= 1.0:
-                        self.df[col] = self.df[col] * 100
+                    col_max = self.df[col].groupby(year_key).transform("max")
+                    rescale = col_max.notna() & (col_max <= 1.0)
+                    self.df.loc[rescale, col] = self.df.loc[rescale, col] * 100
 
             # Add positions from fielding
-            self.append_career_bat_positions(year)
+            self.append_career_bat_positions(years, year_cols)
 
-            # Store the processed year dataframe
-            processed_dfs.append(self.df.copy())
-
-        # Combine all processed years back together
-        if processed_dfs:
-            self.df = pd.concat(processed_dfs, ignore_index=True)
-        else:
-            self.df = original_df
+            # Each year's columns in the order they first appear
+            self.df = self.df[list(dict.fromkeys(sum(year_cols.values(), [])))]
 
         # DEBUG TODO: make output_bio()
         self.df.to_csv(os.path.join(self.year_dir, "streamlit_src", "career_bat.csv"))
@@ -3472,6 +3914,10 @@ class CareerData(Stats):
         self.df = translate_players(self.df, self.suffix, self.year, mode="career")
         self.df = translate_teams(self.df, self.suffix)
 
+        # Every year's FIP constant at once, the per year organizing below
+        # only looks them up
+        self.update_fip_constants(self.df, self.df["Year"])
+
         # Get all unique years in the data
         unique_years = self.df["Year"].astype(str).unique()
 
@@ -3513,38 +3959,74 @@ class CareerData(Stats):
         # DEBUG TODO: make output_bio()
         self.df.to_csv(os.path.join(self.year_dir, "streamlit_src", "career_pitch.csv"))
 
-    def append_career_bat_positions(self, year):
-        """Appends player positions to career batting data from yearly stats.
+    def append_career_gsheets_data(self, years, year_cols):
+        """Merges every year's Google Sheets batter data (2021 and later) into
+        the career batting data at once, on Player, Team and Year.
 
         Args:
-            year (str): The year to retrieve position data from.
+            years (list): The years in the career data.
+            year_cols (dict): Each year's columns, updated with the Google
+                Sheets columns the year gets.
+        """
+        gsheet_dfs = []
+        for year in years:
+            if int(year) < 2021:
+                continue
+            gsheet_df = self.read_gsheets_batter_data(year)
+            # Google Sheet columns come first, as in append_gsheets_batter_data()
+            year_cols[year] = (
+                gsheet_df.columns.to_list()
+                + [col for col in year_cols[year] if col not in ("Player", "Team")]
+                + ["GB/FB"]
+            )
+            gsheet_dfs.append(gsheet_df.assign(_year=year))
+        if len(gsheet_dfs) == 0:
+            return
+        self.df["_year"] = self.df["Year"].astype(str)
+        self.df = self.df.merge(
+            pd.concat(gsheet_dfs, ignore_index=True),
+            on=["Player", "Team", "_year"],
+            how="left",
+        ).drop("_year", axis=1)
+        # Calculate new stats based off of GSheet stats
+        self.df["GB/FB"] = self.df["GB%"] / self.df["FB%"]
 
-        Reads the yearly batting stats file for the given year, extracts the
-        Player and Team columns, normalizes team names by removing HTML links,
-        and merges position data back into the career dataframe using a left
-        join on Player and Team. Prints debugging information about the number
+    def append_career_bat_positions(self, years, year_cols):
+        """Appends player positions to career batting data from yearly stats.
+
+        Args:
+            years (list): The years to retrieve position data from.
+            year_cols (dict): Each year's columns, updated with Pos for the
+                years that have yearly stats.
+
+        Reads each year's batting stats file once, extracts the Player, Team
+        and Pos columns, normalizes team names by removing HTML links, and
+        merges position data into the career dataframe with one left join on
+        Player, Team and Year. Prints debugging information about the number
         of matching player-team combinations found."""
-        batting_df_filename = os.path.join(
-            self.stats_dir, year, "npb", (year + "StatsFinalBR.csv")
-        )
-        if os.path.exists(batting_df_filename):
+        # Remove Tablepress link formatting and extend name for teams
+        team_dict = {
+            "<a href=https://npb.jp/bis/eng/teams/index_g.html>Yomiuri</a>": "Yomiuri Giants",
+            "<a href=https://npb.jp/bis/eng/teams/index_d.html>Chunichi</a>": "Chunichi Dragons",
+            "<a href=https://npb.jp/bis/eng/teams/index_t.html>Hanshin</a>": "Hanshin Tigers",
+            "<a href=https://npb.jp/bis/eng/teams/index_c.html>Hiroshima</a>": "Hiroshima Carp",
+            "<a href=https://npb.jp/bis/eng/teams/index_db.html>DeNA</a>": "DeNA BayStars",
+            "<a href=https://npb.jp/bis/eng/teams/index_s.html>Yakult</a>": "Yakult Swallows",
+            "<a href=https://npb.jp/bis/eng/teams/index_h.html>SoftBank</a>": "SoftBank Hawks",
+            "<a href=https://npb.jp/bis/eng/teams/index_l.html>Seibu</a>": "Seibu Lions",
+            "<a href=https://npb.jp/bis/eng/teams/index_e.html>Rakuten</a>": "Rakuten Eagles",
+            "<a href=https://npb.jp/bis/eng/teams/index_m.html>Lotte</a>": "Lotte Marines",
+            "<a href=https://npb.jp/bis/eng/teams/index_f.html>Nipponham</a>": "Nipponham Fighters",
+            "<a href=https://npb.jp/bis/eng/teams/index_b.html>ORIX</a>": "ORIX Buffaloes",
+        }
+        position_dfs = []
+        for year in years:
+            batting_df_filename = os.path.join(
+                self.stats_dir, year, "npb", (year + "StatsFinalBR.csv")
+            )
+            if not os.path.exists(batting_df_filename):
+                continue
             batting_df = pd.read_csv(batting_df_filename)
-
-            # Remove Tablepress link formatting and extend name for teams
-            team_dict = {
-                "<a href=https://npb.jp/bis/eng/teams/index_g.html>Yomiuri</a>": "Yomiuri Giants",
-                "<a href=https://npb.jp/bis/eng/teams/index_d.html>Chunichi</a>": "Chunichi Dragons",
-                "<a href=https://npb.jp/bis/eng/teams/index_t.html>Hanshin</a>": "Hanshin Tigers",
-                "<a href=https://npb.jp/bis/eng/teams/index_c.html>Hiroshima</a>": "Hiroshima Carp",
-                "<a href=https://npb.jp/bis/eng/teams/index_db.html>DeNA</a>": "DeNA BayStars",
-                "<a href=https://npb.jp/bis/eng/teams/index_s.html>Yakult</a>": "Yakult Swallows",
-                "<a href=https://npb.jp/bis/eng/teams/index_h.html>SoftBank</a>": "SoftBank Hawks",
-                "<a href=https://npb.jp/bis/eng/teams/index_l.html>Seibu</a>": "Seibu Lions",
-                "<a href=https://npb.jp/bis/eng/teams/index_e.html>Rakuten</a>": "Rakuten Eagles",
-                "<a href=https://npb.jp/bis/eng/teams/index_m.html>Lotte</a>": "Lotte Marines",
-                "<a href=https://npb.jp/bis/eng/teams/index_f.html>Nipponham</a>": "Nipponham Fighters",
-                "<a href=https://npb.jp/bis/eng/teams/index_b.html>ORIX</a>": "ORIX Buffaloes",
-            }
             batting_df["Team"] = (
                 batting_df["Team"]
                 .map(team_dict)
@@ -3552,54 +4034,111 @@ class CareerData(Stats):
                 .fillna(batting_df["Team"])
                 .astype(str)
             )
-
-            # Strip whitespace from Player and Team columns in both dataframes
-            # to ensure proper matching
+            # Strip whitespace from Player and Team columns to ensure proper
+            # matching
             batting_df["Player"] = batting_df["Player"].astype(str).str.strip()
             batting_df["Team"] = batting_df["Team"].astype(str).str.strip()
-            self.df["Player"] = self.df["Player"].astype(str).str.strip()
-            self.df["Team"] = self.df["Team"].astype(str).str.strip()
-
-            # Get unique player-team combinations from both dataframes for debugging
-            career_players = set(zip(self.df["Player"], self.df["Team"]))
-            batting_players = set(zip(batting_df["Player"], batting_df["Team"]))
-
-            # Find matching player-team combinations
-            matching_players = career_players.intersection(batting_players)
-            print("Adding positions to player batting career file...")
-            print(f"Career data unique player-team combos: {len(career_players)}")
-            print(f"Yearly stats unique player-team combos: {len(batting_players)}")
-            print(f"Matching player-team combos: {len(matching_players)}")
+            position_dfs.append(batting_df[["Player", "Team", "Pos"]].assign(_year=year))
+            # Pos moves to the end of the year's columns
+            year_cols[year] = [col for col in year_cols[year] if col != "Pos"] + ["Pos"]
+        if len(position_dfs) == 0:
+            return
+        position_df = pd.concat(position_dfs, ignore_index=True)
+
+        # Strip the career rows of the years being matched
+        self.df["_year"] = self.df["Year"].astype(str)
+        matched_years = self.df["_year"].isin(position_df["_year"])
+        for col in ["Player", "Team"]:
+            self.df[col] = self.df[col].where(
+                ~matched_years, self.df[col].astype(str).str.strip()
+            )
 
-            # Merge on player and team - use left join to keep all career records
-            self.df = self.df.merge(
-                batting_df[["Player", "Team", "Pos"]],
-                on=["Player", "Team"],
-                how="left",
-                suffixes=("_career", "_year"),
+        # Get unique player-team combinations from both dataframes for debugging
+        career_players = set(
+            zip(
+                self.df.loc[matched_years, "Player"],
+                self.df.loc[matched_years, "Team"],
+                self.df.loc[matched_years, "_year"],
             )
+        )
+        batting_players = set(
+            zip(position_df["Player"], position_df["Team"], position_df["_year"])
+        )
+        # Find matching player-team combinations
+        matching_players = career_players.intersection(batting_players)
+        print("Adding positions to player batting career file...")
+        print(f"Career data unique player-team-year combos: {len(career_players)}")
+        print(f"Yearly stats unique player-team-year combos: {len(batting_players)}")
+        print(f"Matching player-team-year combos: {len(matching_players)}")
+
+        # Merge on player, team and year - use left join to keep all career records
+        self.df = self.df.merge(
+            position_df,
+            on=["Player", "Team", "_year"],
+            how="left",
+            suffixes=("_career", "_year"),
+        ).drop("_year", axis=1)
 
-            # If no Pos from merge, try to use any existing Pos column
-            if "Pos_career" in self.df.columns and "Pos_year" in self.df.columns:
-                self.df["Pos"] = self.df["Pos_year"].fillna(self.df["Pos_career"])
-                self.df = self.df.drop(["Pos_career", "Pos_year"], axis=1)
-            elif "Pos_career" in self.df.columns:
-                self.df["Pos"] = self.df["Pos_career"]
-                self.df = self.df.drop(["Pos_career"], axis=1)
+        # If no Pos from merge, try to use any existing Pos column
+        if "Pos_career" in self.df.columns and "Pos_year" in self.df.columns:
+            self.df["Pos"] = self.df["Pos_year"].fillna(self.df["Pos_career"])
+            self.df = self.df.drop(["Pos_career", "Pos_year"], axis=1)
 
 
-def get_url(try_url):
-    """Attempts a GET request from the passed in URL
+def get_url(try_url, params=None, timeout=10):
+    """Attempts a GET request from the passed in URL using the pooled session
+    of the URL's host (see get_session()), paced by HOST_SCHEDULER. Cached pages
+    are revalidated with If-None-Match/If-Modified-Since and served from disk
+    on a 304
 
     Parameters:
     try_url (string): The URL to attempt opening
+    params (dict): Optional query string parameters
+    timeout (float/tuple): Request timeout, or (connect timeout, read timeout)
 
     Returns:
     response (Response): The URL's response"""
+    if HTTP_ARCHIVE["mode"] == "replay":
+        return load_archived_response(try_url, params)
     try:
         print("Connecting to: " + try_url)
-        response = requests.get(try_url, timeout=10)
-        response.raise_for_status()
+        # Revalidate a cached copy instead of downloading the page again
+        cached = load_cached_response(try_url, params)
+        headers = {}
+        if cached is not None:
+            if cached.headers.get("ETag"):
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if cached.headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+        # Wait for the host's politeness budget before sending the request
+        host_state = HOST_SCHEDULER.acquire(try_url)
+        started = monotonic()
+        status_code = None
+        try:
+            response = get_session(try_url).get(
+                try_url, params=params, timeout=timeout, headers=headers
+            )
+            status_code = response.status_code
+        finally:
+            HOST_SCHEDULER.release(host_state, status_code, monotonic() - started)
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            response = cached
+        else:
+            response.raise_for_status()
+            store_cached_response(try_url, params, response)
+        if HTTP_ARCHIVE["mode"] == "record":
+            archive_response(
+                try_url,
+                params,
+                {
+                    "status_code": response.status_code,
+                    "url": response.url,
+                    "headers": dict(response.headers),
+                    "encoding": response.encoding,
+                },
+                response.content,
+            )
     # Page doesn't exist (404 not found, 403 not authorized, etc)
     except HTTPError as hp:
         print(hp)
@@ -3609,15 +4148,174 @@ def get_url(try_url):
     return response
 
 
-def make_session():
+class HostScheduler:
+    """Adaptive politeness scheduler shared by every request. Each host has a
+    token bucket refilled at an adjustable rate plus a cap on requests in
+    flight. The rate follows AIMD: it grows additively after healthy responses
+    and halves after a 429/5xx or a response much slower than usual, within the
+    host's HOST_RATE_LIMITS budget"""
+
+    def __init__(self, rate_limits):
+        """Parameters:
+        rate_limits (dict): Host name: budget dict (see HOST_RATE_LIMITS)"""
+        self.rate_limits = rate_limits
+        self.lock = threading.Lock()
+        self.hosts = {}
+
+    def get_host(self, url):
+        """Returns the scheduler state of a URL's host, creating it on first use
+
+        Parameters:
+        url (string): Any URL on the host
+
+        Returns:
+        state (dict): The host's token bucket and AIMD state"""
+        netloc = urlparse(url).netloc
+        with self.lock:
+            if netloc not in self.hosts:
+                limits = self.rate_limits["default"]
+                for host, host_limits in self.rate_limits.items():
+                    if netloc == host or netloc.endswith("." + host):
+                        limits = host_limits
+                self.hosts[netloc] = {
+                    "name": netloc,
+                    "limits": limits,
+                    "rate": limits["rate"],
+                    "tokens": 1.0,
+                    "refilled": monotonic(),
+                    "slots": threading.BoundedSemaphore(limits["concurrency"]),
+                    "latency": None,
+                    "requests": 0,
+                    "waited": 0.0,
+                }
+            return self.hosts[netloc]
+
+    def acquire(self, url):
+        """Blocks until a request to the URL's host may start
+
+        Parameters:
+        url (string): The URL about to be requested
+
+        Returns:
+        state (dict): The host state, pass to release()"""
+        state = self.get_host(url)
+        state["slots"].acquire()
+        with self.lock:
+            now = monotonic()
+            # Refill the bucket (one token of burst) at the current rate
+            state["tokens"] = min(
+                1.0, state["tokens"] + (now - state["refilled"]) * state["rate"]
+            )
+            state["refilled"] = now
+            # Reserve a token, waiting for it if the bucket is empty
+            state["tokens"] -= 1.0
+            wait = 0.0
+            if state["tokens"] < 0:
+                wait = -state["tokens"] / state["rate"]
+            state["requests"] += 1
+            state["waited"] += wait
+        if wait > 0:
+            sleep(wait)
+        return state
+
+    def release(self, state, status_code=None, latency=None):
+        """Frees the request slot taken by acquire() and adapts the host's rate
+
+        Parameters:
+        state (dict): The host state returned by acquire()
+        status_code (int): The response status, None if the request failed
+        latency (float): Seconds the request took"""
+        self.record(state, status_code, latency)
+        state["slots"].release()
+
+    def record(self, state, status_code=None, latency=None):
+        """Adapts a host's rate to a finished request (AIMD)
+
+        Parameters:
+        state (dict): The host state returned by acquire()
+        status_code (int): The response status, None if the request failed
+        latency (float): Seconds the request took"""
+        limits = state["limits"]
+        with self.lock:
+            slow = (
+                latency is not None
+                and state["latency"] is not None
+                and latency > LATENCY_BACKOFF_FACTOR * state["latency"]
+            )
+            if status_code is None or status_code == 429 or status_code >= 500 or slow:
+                # Multiplicative decrease
+                state["rate"] = max(limits["min_rate"], state["rate"] / 2)
+            else:
+                # Additive increase
+                state["rate"] = min(limits["max_rate"], state["rate"] + limits["step"])
+            if latency is not None:
+                if state["latency"] is None:
+                    state["latency"] = latency
+                else:
+                    state["latency"] = 0.8 * state["latency"] + 0.2 * latency
+
+    def concurrency(self, url):
+        """Returns the number of requests allowed in flight to a URL's host
+
+        Parameters:
+        url (string): Any URL on the host
+
+        Returns:
+        concurrency (int): The host's concurrency budget"""
+        return self.get_host(url)["limits"]["concurrency"]
+
+    def print_summary(self):
+        """Prints the requests made, time spent waiting and final rate per host"""
+        with self.lock:
+            for state in self.hosts.values():
+                print(
+                    f"{state['name']}: {state['requests']} requests, "
+                    f"{state['waited']:.1f}s pacing, {state['rate']:.2f} req/s"
+                )
+
+
+# The scheduler every request goes through (see get_url())
+HOST_SCHEDULER = HostScheduler(HOST_RATE_LIMITS)
+
+
+def fetch_pages(url_arr, timeout=10):
+    """Fetches a list of URLs concurrently. Requests are paced per host by
+    HOST_SCHEDULER, so total time scales with the politeness budget instead of
+    per page sleeps
+
+    Parameters:
+    url_arr (list): The URLs to fetch
+    timeout (float/tuple): Request timeout, or (connect timeout, read timeout)
+
+    Returns:
+    responses (list): The URL responses, in the same order as url_arr"""
+    url_arr = list(url_arr)
+    if len(url_arr) == 0:
+        return []
+    hosts = {}
+    for url in url_arr:
+        hosts[urlparse(url).netloc] = HOST_SCHEDULER.concurrency(url)
+    with ThreadPoolExecutor(max_workers=sum(hosts.values())) as pool:
+        # map() keeps the input order regardless of completion order
+        return list(
+            pool.map(
+                get_url, url_arr, [None] * len(url_arr), [timeout] * len(url_arr)
+            )
+        )
+
+
+def make_session(pool_size=10):
     """Create and configure a requests Session with retry logic.
 
+    Args:
+        pool_size (int, optional): Number of pooled keep-alive connections.
+
     Returns:
         requests.Session: A configured session with:
         - Retry strategy: 5 total retries with 1.5x backoff factor
         - Retry on status codes: 429, 500, 502, 503, 504
         - Custom User-Agent and Accept headers
-        - HTTP adapter with connection pooling (10 connections, 10 max size)"""
+        - HTTP adapter with connection pooling (pool_size connections)"""
     retry = Retry(
         total=5,
         connect=5,
@@ -3627,7 +4325,9 @@ def make_session():
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
+    adapter = HTTPAdapter(
+        max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size
+    )
 
     s = requests.Session()
     s.headers.update(
@@ -3641,22 +4341,400 @@ def make_session():
     return s
 
 
+def get_session(url):
+    """Returns the process wide pooled session for a URL's host, creating it
+    on first use. Every request to a host then reuses the same keep-alive
+    connections and make_session()'s retry policy.
+
+    Args:
+        url (str): Any URL on the desired host.
+
+    Returns:
+        requests.Session: The shared session for the URL's host."""
+    host = urlparse(url).netloc
+    with SESSION_LOCK:
+        if host not in SESSION_REGISTRY:
+            SESSION_REGISTRY[host] = make_session(HOST_POOL_SIZES.get(host, 10))
+        return SESSION_REGISTRY[host]
+
+
+def parse_run_flags(args):
+    """Applies and removes the optional "--" flags from the command line args
+
+    Parameters:
+    args (list): The command line arguments, without the program name
+
+    Returns:
+    remaining_args (list): The arguments that are not flags"""
+    remaining_args = []
+    arg_iter = iter(args)
+    for arg in arg_iter:
+        if arg in ("--record", "--replay"):
+            archive_path = next(arg_iter, None)
+            if archive_path is None:
+                sys.exit("ERROR: " + arg + " needs an archive path. Exiting...")
+            open_http_archive(arg[2:], archive_path)
+        elif arg == "--no-cache":
+            print("HTTP cache disabled for this run.")
+            HTTP_CACHE["enabled"] = False
+        elif arg == "--backfill-rosters":
+            ROSTER_BACKFILL["enabled"] = True
+        elif arg == "--no-raw":
+            print("Raw files will not be saved for this run.")
+            RAW_OUTPUT["enabled"] = False
+        else:
+            remaining_args.append(arg)
+    return remaining_args
+
+
+def get_cache_paths(url, params=None):
+    """Returns the metadata and body file paths of a URL's HTTP cache entry
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+
+    Returns:
+    meta_path (string): Path to the entry's JSON metadata (validators, headers)
+    body_path (string): Path to the entry's raw response body"""
+    key = url
+    if params:
+        key += "?" + urlencode(sorted(params.items()))
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return (
+        os.path.join(HTTP_CACHE["dir"], digest + ".json"),
+        os.path.join(HTTP_CACHE["dir"], digest + ".body"),
+    )
+
+
+def load_cached_response(url, params=None):
+    """Loads a cached response for a URL
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+
+    Returns:
+    response (Response): The cached response, or None if there is no entry"""
+    if HTTP_CACHE["enabled"] is False:
+        return None
+    meta_path, body_path = get_cache_paths(url, params)
+    try:
+        with open(meta_path, encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+        with open(body_path, "rb") as body_file:
+            body = body_file.read()
+    except (OSError, ValueError):
+        return None
+    # Mark the entry as recently used for size based eviction
+    os.utime(meta_path)
+    return build_response(meta, body)
+
+
+def build_response(meta, body):
+    """Rebuilds a response stored by the HTTP cache or the HTTP archive
+
+    Parameters:
+    meta (dict): The response's url, headers, encoding and optional status_code
+    body (bytes): The response body
+
+    Returns:
+    response (Response): The rebuilt response"""
+    response = requests.Response()
+    response.status_code = meta.get("status_code", 200)
+    response.url = meta["url"]
+    response.headers = requests.structures.CaseInsensitiveDict(meta["headers"])
+    response.encoding = meta["encoding"]
+    response._content = body  # pylint: disable=protected-access
+    return response
+
+
+def store_cached_response(url, params, response):
+    """Stores a response in the HTTP cache if it carries a validator
+    (ETag or Last-Modified) that later requests can revalidate with
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+    response (Response): The successful response to store"""
+    if HTTP_CACHE["enabled"] is False:
+        return
+    validators = {}
+    for header in ["ETag", "Last-Modified"]:
+        if response.headers.get(header):
+            validators[header] = response.headers[header]
+    if len(validators) == 0:
+        return
+
+    os.makedirs(HTTP_CACHE["dir"], exist_ok=True)
+    meta_path, body_path = get_cache_paths(url, params)
+    meta = {
+        "url": response.url,
+        "headers": validators,
+        "encoding": response.encoding,
+        "stored": datetime.now().isoformat(),
+    }
+    # Write to unique temporary files first so readers never see a partial
+    # entry, fetch_pages() threads may store the same URL at once
+    fd, tmp_path = tempfile.mkstemp(dir=HTTP_CACHE["dir"], suffix=".tmp")
+    with os.fdopen(fd, "wb") as body_file:
+        body_file.write(response.content)
+    os.replace(tmp_path, body_path)
+    fd, tmp_path = tempfile.mkstemp(dir=HTTP_CACHE["dir"], suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as meta_file:
+        json.dump(meta, meta_file)
+    os.replace(tmp_path, meta_path)
+
+
+def open_http_archive(mode, archive_path):
+    """Opens the HTTP archive that every response is recorded into or replayed
+    from. A replay serves get_url() and the fielding CSV downloads from the
+    archive alone, without touching the network or the host pacing
+
+    Parameters:
+    mode (string): "record" (a new archive is written) or "replay"
+    archive_path (string): The archive's .zip path"""
+    if mode == "record":
+        print("Recording every response into: " + archive_path)
+        archive = zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED)
+        archive.writestr(
+            "archive.json",
+            json.dumps({"recorded": datetime.now().isoformat(timespec="seconds")}),
+        )
+    else:
+        archive = zipfile.ZipFile(archive_path, "r")
+        recorded = json.loads(archive.read("archive.json"))["recorded"]
+        print("Replaying responses recorded " + recorded + " from: " + archive_path)
+    HTTP_ARCHIVE["mode"] = mode
+    HTTP_ARCHIVE["path"] = archive_path
+    HTTP_ARCHIVE["zip"] = archive
+    # Closed at exit, so an interrupted recording still leaves a readable archive
+    atexit.register(close_http_archive)
+
+
+def close_http_archive():
+    """Closes the HTTP archive, if one is open"""
+    with HTTP_ARCHIVE_LOCK:
+        if HTTP_ARCHIVE["zip"] is not None:
+            HTTP_ARCHIVE["zip"].close()
+        HTTP_ARCHIVE["mode"] = None
+        HTTP_ARCHIVE["zip"] = None
+
+
+def get_archive_name(url, params=None):
+    """Returns the archive entry name shared by a request's metadata and body
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+
+    Returns:
+    name (string): The entry name, without extension"""
+    key = url
+    if params:
+        key += "?" + urlencode(sorted(params.items()))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def archive_response(url, params, meta, body):
+    """Records a response in the HTTP archive. Only the first response of a
+    request is kept, which is the one a replay serves
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+    meta (dict): The response's status_code, url, headers and encoding
+    body (bytes): The response body"""
+    name = get_archive_name(url, params)
+    meta = dict(meta, request_url=url, params=params)
+    meta["recorded"] = datetime.now().isoformat(timespec="seconds")
+    with HTTP_ARCHIVE_LOCK:
+        if HTTP_ARCHIVE["zip"] is None or name in HTTP_ARCHIVE["keys"]:
+            return
+        HTTP_ARCHIVE["keys"].add(name)
+        HTTP_ARCHIVE["zip"].writestr(name + ".json", json.dumps(meta))
+        HTTP_ARCHIVE["zip"].writestr(name + ".body", body)
+
+
+def load_archived_response(url, params=None):
+    """Serves a request from the HTTP archive being replayed
+
+    Parameters:
+    url (string): The requested URL
+    params (dict): The request's query string parameters
+
+    Returns:
+    response (Response): The recorded response
+
+    Raises:
+    requests.exceptions.ConnectionError: The request was never recorded"""
+    name = get_archive_name(url, params)
+    with HTTP_ARCHIVE_LOCK:
+        try:
+            meta = json.loads(HTTP_ARCHIVE["zip"].read(name + ".json"))
+            body = HTTP_ARCHIVE["zip"].read(name + ".body")
+        except KeyError as e:
+            raise requests.exceptions.ConnectionError(
+                "Not in replay archive " + HTTP_ARCHIVE["path"] + ": " + url
+            ) from e
+    print("Replaying: " + url)
+    return build_response(meta, body)
+
+
+def prune_http_cache():
+    """Evicts HTTP cache entries (including cached parsed rows and CDX
+    results) older than HTTP_CACHE["max_age_days"], then the least recently
+    used entries until the cache fits HTTP_CACHE["max_bytes"]"""
+    entries = []
+    now = datetime.now().timestamp()
+    for cache_dir in [
+        HTTP_CACHE["dir"],
+        os.path.join(HTTP_CACHE["dir"], "parsed"),
+        os.path.join(HTTP_CACHE["dir"], "cdx"),
+    ]:
+        if not os.path.exists(cache_dir):
+            continue
+        for filename in os.listdir(cache_dir):
+            if not filename.endswith(".json"):
+                continue
+            meta_path = os.path.join(cache_dir, filename)
+            body_path = meta_path[: -len(".json")] + ".body"
+            last_used = os.path.getmtime(meta_path)
+            size = os.path.getsize(meta_path)
+            if os.path.exists(body_path):
+                size += os.path.getsize(body_path)
+            entries.append((last_used, size, meta_path, body_path))
+
+    # Oldest entries first
+    entries.sort()
+    total_size = sum(entry[1] for entry in entries)
+    removed = 0
+    for last_used, size, meta_path, body_path in entries:
+        expired = now - last_used > HTTP_CACHE["max_age_days"] * 86400
+        if expired is False and total_size <= HTTP_CACHE["max_bytes"]:
+            break
+        for path in [meta_path, body_path]:
+            if os.path.exists(path):
+                os.remove(path)
+        total_size -= size
+        removed += 1
+    if removed > 0:
+        print("Evicted " + str(removed) + " HTTP cache entries.")
+
+
+class ParseScope(ElementFilter):
+    """Keeps only the tags that match one of the given names, ids or classes
+    (and everything inside them) while a page is parsed. Unlike a SoupStrainer,
+    a tag may match on any one of the three"""
+
+    def __init__(self, names=(), ids=(), classes=()):
+        super().__init__()
+        self.names = set(names)
+        self.ids = set(ids)
+        self.classes = set(classes)
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        if name in self.names:
+            return True
+        if not attrs:
+            return False
+        if attrs.get("id") in self.ids:
+            return True
+        tag_classes = attrs.get("class", "")
+        if isinstance(tag_classes, str):
+            tag_classes = tag_classes.split()
+        return any(tag_class in self.classes for tag_class in tag_classes)
+
+    def allow_string_creation(self, string):
+        # Top level text sits outside every kept tag
+        return False
+
+
+def make_soup(content, page_type=None, parser=None):
+    """Parses a page with the fastest installed HTML parser backend
+
+    Parameters:
+    content (bytes): The page body
+    page_type (string): A PARSE_SCOPES key, only that page type's tags are
+    parsed. The whole page is parsed if None
+    parser (string): The BeautifulSoup parser, HTML_PARSER if None
+
+    Returns:
+    soup (BeautifulSoup): The parsed page"""
+    parse_only = None
+    if page_type is not None:
+        parse_only = ParseScope(**PARSE_SCOPES[page_type])
+    return BeautifulSoup(content, parser or HTML_PARSER, parse_only=parse_only)
+
+
+def parse_page_cached(
+    url, content, parse_key, parse_func, parse_args=(), page_type=None
+):
+    """Parses a page with parse_func(soup, *parse_args), reusing the rows
+    parsed on a previous run when the page body's hash has not changed. The
+    soup parse is skipped entirely for unchanged pages
+
+    Parameters:
+    url (string): The page's URL
+    content (bytes): The page body
+    parse_key (string): Identifies the parser and its settings for this page
+    parse_func (function): Returns a list of rows from a BeautifulSoup
+    parse_args (tuple): Extra arguments passed to parse_func
+    page_type (string): The PARSE_SCOPES key used to parse the page
+
+    Returns:
+    rows (list): The parsed rows (lists of strings)
+    unchanged (bool): True if the rows came from the cache"""
+    body_hash = hashlib.sha256(content).hexdigest()
+    parse_key = parse_key + HTML_PARSER + "v" + str(PARSE_CACHE_VERSION)
+    cache_dir = os.path.join(HTTP_CACHE["dir"], "parsed")
+    cache_path = os.path.join(
+        cache_dir, hashlib.sha1((url + parse_key).encode("utf-8")).hexdigest() + ".json"
+    )
+    if HTTP_CACHE["enabled"] is True:
+        try:
+            with open(cache_path, encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            if cached["hash"] == body_hash and cached["key"] == parse_key:
+                os.utime(cache_path)
+                return cached["rows"], True
+        except (OSError, ValueError, KeyError):
+            pass
+
+    rows = parse_func(make_soup(content, page_type), *parse_args)
+    if HTTP_CACHE["enabled"] is True:
+        os.makedirs(cache_dir, exist_ok=True)
+        # fetch_pages() threads may parse the same URL at once
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                {"url": url, "key": parse_key, "hash": body_hash, "rows": rows},
+                cache_file,
+            )
+        os.replace(tmp_path, cache_path)
+    return rows, False
+
+
 def get_daily_scores(year_dir, suffix, year):
-    """The main daily scores scraping function that produces Raw daily scores files"""
-    # Make output file
-    output_file = make_raw_daily_scores_file(year_dir, suffix, year)
-    output_file.write("HomeTeam,RunsHome,RunsAway,AwayTeam\n")
+    """The main daily scores scraping function that produces Raw daily scores
+    files
+
+    Returns:
+    scores_df (DataFrame): The Raw daily scores table, typed as if read from
+    the file"""
+    header = ["HomeTeam", "RunsHome", "RunsAway", "AwayTeam"]
+    score_rows = []
     # Grab URLs to scrape
     url = "https://npb.jp/bis/eng/" + year + "/games/"
     # Make GET request
     r = get_url(url)
     # Create the soup for parsing the html content
-    soup = BeautifulSoup(r.content, "html.parser")
+    soup = make_soup(r.content, "daily_scores")
 
     if int(year) < 2026:
-        game_divs = soup.find_all("div", class_="contentsgame")
+        game_blocks = soup.find_all("div", class_="contentsgame")
         # Extract table rows from npb.jp daily game stats
-        for result in game_divs:
+        for result in game_blocks:
             teams = result.find_all(class_="contentsTeam")
             runs = result.find_all(class_="contentsRuns")
             i = 0
@@ -3666,13 +4744,11 @@ def get_daily_scores(year_dir, suffix, year):
                 team2 = teams[i + 1].get_text()
                 team2_runs = runs[i + 1].get_text()
                 i += 2
-                output_file.write(
-                    team1 + "," + team1_runs + "," + team2_runs + "," + team2 + "\n"
-                )
+                score_rows.append([team1, team1_runs, team2_runs, team2])
     else:
-        games = soup.find_all("div", class_="unit")
+        game_blocks = soup.find_all("div", class_="unit")
         # Extract table rows from npb.jp daily game stats
-        for result in games:
+        for result in game_blocks:
             teams = result.find_all(class_="team_name")
             left_team_runs = result.find_all(class_="score_text score_left")
             right_team_runs = result.find_all(class_="score_text score_right")
@@ -3683,13 +4759,212 @@ def get_daily_scores(year_dir, suffix, year):
                 team2 = teams[i + 1].get_text()
                 team2_runs = right_team_runs[i].get_text()
                 i += 2
-                output_file.write(
-                    team1 + "," + team1_runs + "," + team2_runs + "," + team2 + "\n"
-                )
+                score_rows.append([team1, team1_runs, team2_runs, team2])
 
-    # After all URLs are scraped, close output file
+    # Keep the day's scores, the games page only shows the latest day
+    game_date = parse_games_date(game_blocks, year)
+    if game_date is None:
+        print(
+            "WARNING: no " + year + " date found above the games on " + url
+            + ", the game log was not updated"
+        )
+    else:
+        append_game_log(year_dir, game_date, score_rows)
     r.close()
-    output_file.close()
+
+    if RAW_OUTPUT["enabled"] is True:
+        output_file = make_raw_daily_scores_file(year_dir, suffix, year)
+        output_file.write_header(header)
+        for row in score_rows:
+            output_file.write_row(row)
+        save_raw_table(output_file)
+    return make_raw_frame(header, score_rows)
+
+
+def parse_games_date(game_blocks, year):
+    """Finds the date of the games shown on npb.jp's games page from the
+    games' own header, the first heading inside the first game block or else
+    the nearest heading above it. Dates elsewhere on the page (navigation,
+    schedule links) are not used
+
+    Parameters:
+    game_blocks (list): The page's game blocks (contentsgame/unit tags)
+    year (string): The year of the games page
+
+    Returns:
+    game_date (string): The games' date as YYYY-MM-DD, None if the games'
+    header doesn't show a date in the given year"""
+    if len(game_blocks) == 0:
+        return None
+    header = game_blocks[0].find(GAME_DATE_HEADERS)
+    if header is None:
+        header = game_blocks[0].find_previous(GAME_DATE_HEADERS)
+    if header is None:
+        return None
+    text = header.get_text(" ", strip=True)
+    for pattern, date_format in GAME_DATE_PATTERNS:
+        for match in re.finditer(pattern, text):
+            try:
+                game_date = datetime.strptime(match.group(0), date_format)
+            except ValueError:
+                continue
+            if str(game_date.year) == year:
+                return game_date.strftime("%Y-%m-%d")
+    return None
+
+
+def append_game_log(year_dir, game_date, score_rows):
+    """Adds a day's scored games to the year's game log, a directory of one
+    csv per date (/year/game_log/[Date].csv). A game already in the log (same
+    date, home and away team) has its score replaced, so a score logged while
+    the game was in progress is updated to the final score on a later run
+
+    Parameters:
+    year_dir (string): The directory that stores the scraped NPB stats
+    game_date (string): The games' date as YYYY-MM-DD
+    score_rows (list): [HomeTeam, RunsHome, RunsAway, AwayTeam] rows
+
+    Returns:
+    new_games (int): The number of games added to or updated in the log"""
+    log_dir = os.path.join(year_dir, "game_log")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, game_date + ".csv")
+    logged_rows = []
+    if os.path.exists(log_path):
+        with open(log_path, newline="", encoding="utf-8") as log_file:
+            logged_rows = list(csv.reader(log_file))[1:]
+    # Keyed by (Date, HomeTeam, AwayTeam), keeps the logged order
+    log_rows = {(row[0], row[1], row[4]): row for row in logged_rows}
+    new_games = 0
+    for home_team, runs_home, runs_away, away_team in score_rows:
+        runs_home = runs_home.strip()
+        runs_away = runs_away.strip()
+        # Scheduled and postponed games have no score yet
+        if not (runs_home.isdigit() and runs_away.isdigit()):
+            continue
+        key = (game_date, home_team.strip(), away_team.strip())
+        row = [key[0], key[1], runs_home, runs_away, key[2]]
+        if log_rows.get(key) == row:
+            continue
+        log_rows[key] = row
+        new_games += 1
+    if new_games == 0:
+        return 0
+    with RawTableWriter(log_path) as log_writer:
+        log_writer.write_header(GAME_LOG_COLUMNS)
+        for row in log_rows.values():
+            log_writer.write_row(row)
+    print(
+        str(new_games) + " game(s) added or updated in the game log: " + log_path
+    )
+    return new_games
+
+
+def read_game_log(year_dir, start_date=None, end_date=None):
+    """Reads the year's game log, only opening the dates within the range
+
+    Parameters:
+    year_dir (string): The directory that stores the scraped NPB stats
+    start_date (string): First date to include (YYYY-MM-DD), None = all
+    end_date (string): Last date to include (YYYY-MM-DD), None = all
+
+    Returns:
+    log_df (pandas dataframe): One row per game, sorted by date"""
+    log_dir = os.path.join(year_dir, "game_log")
+    frames = []
+    if os.path.exists(log_dir):
+        for filename in sorted(os.listdir(log_dir)):
+            if not filename.endswith(".csv"):
+                continue
+            game_date = filename[: -len(".csv")]
+            if start_date is not None and game_date < start_date:
+                continue
+            if end_date is not None and game_date > end_date:
+                continue
+            frames.append(pd.read_csv(os.path.join(log_dir, filename)))
+    if len(frames) == 0:
+        return pd.DataFrame(columns=GAME_LOG_COLUMNS)
+    log_df = pd.concat(frames, ignore_index=True)
+    log_df["Date"] = pd.to_datetime(log_df["Date"])
+    return log_df
+
+
+def get_team_games_log(log_df):
+    """Splits each logged game into one row per team
+
+    Parameters:
+    log_df (pandas dataframe): A game log from read_game_log()
+
+    Returns:
+    team_df (pandas dataframe): Date, Team, Opponent, Site ("Home"/"Away"),
+    RS (runs scored) and RA (runs allowed) per team game"""
+    home_df = pd.DataFrame(
+        {
+            "Date": log_df["Date"],
+            "Team": log_df["HomeTeam"],
+            "Opponent": log_df["AwayTeam"],
+            "Site": "Home",
+            "RS": log_df["RunsHome"],
+            "RA": log_df["RunsAway"],
+        }
+    )
+    away_df = pd.DataFrame(
+        {
+            "Date": log_df["Date"],
+            "Team": log_df["AwayTeam"],
+            "Opponent": log_df["HomeTeam"],
+            "Site": "Away",
+            "RS": log_df["RunsAway"],
+            "RA": log_df["RunsHome"],
+        }
+    )
+    return pd.concat([home_df, away_df], ignore_index=True).sort_values(
+        ["Date", "Team"], kind="stable", ignore_index=True
+    )
+
+
+def get_run_differential(year_dir, start_date=None, end_date=None):
+    """Returns each team's daily and season to date run differential
+
+    Parameters:
+    year_dir (string): The directory that stores the scraped NPB stats
+    start_date (string): First date to include (YYYY-MM-DD), None = all
+    end_date (string): Last date to include (YYYY-MM-DD), None = all
+
+    Returns:
+    diff_df (pandas dataframe): Date, Team, RS, RA, Diff and CumDiff rows"""
+    team_df = get_team_games_log(read_game_log(year_dir, start_date, end_date))
+    diff_df = team_df.groupby(["Date", "Team"], as_index=False)[["RS", "RA"]].sum()
+    diff_df["Diff"] = diff_df["RS"] - diff_df["RA"]
+    diff_df["CumDiff"] = diff_df.groupby("Team")["Diff"].cumsum()
+    return diff_df
+
+
+def get_home_away_splits(year_dir, start_date=None, end_date=None):
+    """Returns each team's home and away records and runs
+
+    Parameters:
+    year_dir (string): The directory that stores the scraped NPB stats
+    start_date (string): First date to include (YYYY-MM-DD), None = all
+    end_date (string): Last date to include (YYYY-MM-DD), None = all
+
+    Returns:
+    split_df (pandas dataframe): G, W, L, T, RS, RA and Diff per Team + Site
+    """
+    team_df = get_team_games_log(read_game_log(year_dir, start_date, end_date))
+    team_df["W"] = (team_df["RS"] > team_df["RA"]).astype(int)
+    team_df["L"] = (team_df["RS"] < team_df["RA"]).astype(int)
+    team_df["T"] = (team_df["RS"] == team_df["RA"]).astype(int)
+    split_df = team_df.groupby(["Team", "Site"], as_index=False).agg(
+        G=("Date", "size"),
+        W=("W", "sum"),
+        L=("L", "sum"),
+        T=("T", "sum"),
+        RS=("RS", "sum"),
+        RA=("RA", "sum"),
+    )
+    split_df["Diff"] = split_df["RS"] - split_df["RA"]
+    return split_df
 
 
 def get_stats(input_dir, year_dir, suffix, year):
@@ -3705,203 +4980,221 @@ def get_stats(input_dir, year_dir, suffix, year):
     "PR" = reg season pitching stat URLs passed in
     "BF" = farm batting stat URLs passed in
     "PF" = farm pitching stat URLs passed in
-    year (string): The desired NPB year to scrape"""
+    year (string): The desired NPB year to scrape
+
+    Returns:
+    stat_df (DataFrame): The Raw stat table (see write_raw_stats())"""
     # TODO: gsheets source changes and previous years get wiped - skip this scrape if the current year doesnt match the scrape year (maybe remove google_sheet_urls.csv entirely?)
-    # Make output file
-    output_file = make_raw_player_file(year_dir, suffix, year)
-    # Grab URLs to scrape
-    url_arr, version = get_stat_urls(suffix, year)
-    # Create header row
-    if suffix == "BR":
-        output_file.write(
-            "Player,G,PA,AB,R,H,2B,3B,HR,TB,RBI,SB,CS,SH,SF,BB,IBB,HP,SO,GDP,AVG,SLG,OBP,Team,\n"
-        )
-    elif suffix == "BF":
-        output_file.write(
-            "Player,G,PA,AB,R,H,2B,3B,HR,TB,RBI,SB,CS,SH,SF,BB,IBB,HP,SO,GDP,AVG,SLG,OBP,Team,\n"
-        )
-    elif suffix == "PR" and version == "v1":
-        output_file.write(
-            "Pitcher,G,W,L,SV,HLD,CG,SHO,PCT,BF,IP,,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
-        )
-    elif suffix == "PR" and version == "v2":
-        output_file.write(
-            "Pitcher,G,W,L,SV,HLD,HP,CG,SHO,NBBG,PCT,BF,IP,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
-        )
-    elif suffix == "PF" and version == "v1":
-        output_file.write(
-            "Pitcher,G,W,L,SV,CG,SHO,PCT,BF,IP,,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
-        )
-    elif suffix == "PF" and version == "v2":
-        output_file.write(
-            "Pitcher,G,W,L,SV,CG,SHO,NBBG,PCT,BF,IP,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
+    return get_all_stats(input_dir, year_dir, [suffix], year)[suffix]
+
+
+def get_all_stats(input_dir, year_dir, suffixes, year):
+    """Scrapes the Raw stat files of several suffixes in one pass. The team
+    pages of every suffix are fetched concurrently (see fetch_pages()), then
+    each Raw stat file is written in the same row order as npb_urls.csv
+
+    Parameters:
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    suffixes (list): The stat suffixes to scrape ("BR", "PR", "BF", "PF", "BP", "PP")
+    year (string): The desired NPB year to scrape
+
+    Returns:
+    stat_dfs (dict): Each suffix's Raw stat table (see write_raw_stats())"""
+    # Grab URLs to scrape for every suffix
+    suffix_urls = {}
+    for suffix in suffixes:
+        suffix_urls[suffix] = get_stat_urls(suffix, year)
+
+    # Fetch all team pages at once, responses come back in request order
+    all_urls = []
+    for suffix in suffixes:
+        all_urls.extend(suffix_urls[suffix][0])
+    responses = fetch_pages(all_urls)
+
+    stat_dfs = {}
+    start = 0
+    for suffix in suffixes:
+        url_arr, version = suffix_urls[suffix]
+        stat_dfs[suffix] = write_raw_stats(
+            year_dir,
+            suffix,
+            year,
+            version,
+            responses[start : start + len(url_arr)],
         )
+        start += len(url_arr)
+    return stat_dfs
 
-    # Loop through all team stat pages in url_arr
-    for url in url_arr:
-        # Make GET request
-        r = get_url(url)
-        # Create the soup for parsing the html content
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        if version == "v1":
-            # Since header row was created, skip to stat rows
-            iter_soup = iter(soup.table)
-            # Left handed pitcher/batter and switch hitter row skip
-            next(iter_soup)
-            # npb.jp header row skip
-            next(iter_soup)
-            # Extract table rows from npb.jp team stats
-            for table_row in iter_soup:
-                # Skip first column for left handed batter/pitcher or switch hitter
-                iter_table = iter(table_row)
-                next(iter_table)
-                # Write output in csv file format
-                for entry in iter_table:
-                    # Remove commas in first and last names
-                    entry_text = entry.get_text()
-                    if entry_text.find(","):
-                        entry_text = entry_text.replace(",", "")
-                    # Write output in csv file format
-                    output_file.write(entry_text + ",")
-
-                # Get team
-                title_div = soup.find(id="stdivtitle")
-                year_title_str = revise_year_title_str(
-                    title_div.h1.get_text(), suffix, year
-                )
-                # Append as last entry and move to next row
-                output_file.write(year_title_str + ",\n")
-
-        # New 2025 post season and onwards table type
-        elif version == "v2":
-            player_stat_rows = iter(soup.find_all("tr"))
-            # Skip header row
-            next(player_stat_rows)
-            for row in player_stat_rows:
-                for entry in row.find_all("td"):
-                    # TODO: remove if statements? text filtering possibly handled in later code
-                    entry_text = entry.get_text()
-                    entry_text = entry_text.strip()
-                    entry_text = entry_text.replace(",", "")
-                    entry_text = entry_text.replace("　", " ")
-                    entry_text = entry_text.replace("*", "")
-                    entry_text = entry_text.replace("+", "")
-                    # Write output in csv file format
-                    output_file.write(entry_text + ",")
-
-                # Get team
-                title = soup.find("span")
-                year_title_str = revise_year_title_str(str(title.string), suffix, year)
-                # Append as last entry and move to next row
-                output_file.write(year_title_str + ",\n")
 
+def write_raw_stats(year_dir, suffix, year, version, responses):
+    """Parses fetched team stat pages into a Raw stat table and saves it as a
+    Raw stat file (see save_raw_table()). If every page is unchanged since the
+    last run (see parse_page_cached()), the existing Raw stat file is kept as is
+
+    Parameters:
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    suffix (string): Determines header row of csv file ("BR", "PR", "BF", "PF",
+    "BP", "PP")
+    year (string): The desired NPB year to scrape
+    version (string): The npb_urls.csv page version ("v1" or "v2")
+    responses (list): The team page responses in npb_urls.csv order
+
+    Returns:
+    stat_df (DataFrame): The Raw stat table, typed as if read from the file"""
+    stat_rows = []
+    unchanged = True
+    for r in responses:
+        rows, cached = parse_page_cached(
+            r.url,
+            r.content,
+            "stats" + suffix + year + str(version),
+            parse_stat_page,
+            (suffix, year, version),
+            "stats_v2" if version == "v2" else "stats_v1",
+        )
+        stat_rows.extend(rows)
+        unchanged = unchanged and cached
         # Close request
         r.close()
-        # Pace requests to npb.jp to avoid excessive requests
-        sleep(randint(1, 3))
-    # After all URLs are scraped, close output file
-    output_file.close()
+
+    # Create header row
+    if suffix in ("BR", "BF", "BP"):
+        header = "Player,G,PA,AB,R,H,2B,3B,HR,TB,RBI,SB,CS,SH,SF,BB,IBB,HP,SO,GDP,AVG,SLG,OBP,Team,"
+    elif suffix in ("PR", "PP") and version == "v1":
+        header = "Pitcher,G,W,L,SV,HLD,CG,SHO,PCT,BF,IP,,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,"
+    elif suffix in ("PR", "PP") and version == "v2":
+        header = "Pitcher,G,W,L,SV,HLD,HP,CG,SHO,NBBG,PCT,BF,IP,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,"
+    elif suffix == "PF" and version == "v1":
+        header = "Pitcher,G,W,L,SV,CG,SHO,PCT,BF,IP,,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,"
+    else:
+        header = "Pitcher,G,W,L,SV,CG,SHO,NBBG,PCT,BF,IP,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,"
+    stat_df = make_raw_frame(header.split(","), stat_rows)
+
+    raw_csv_name = os.path.join(year_dir, "raw", year + "StatsRaw" + suffix + ".csv")
+    if unchanged is True and is_raw_file_complete(raw_csv_name):
+        print("Stat pages unchanged, keeping: " + raw_csv_name)
+    elif RAW_OUTPUT["enabled"] is True:
+        # Write every row at once
+        output_file = make_raw_player_file(year_dir, suffix, year)
+        output_file.write_frame(stat_df)
+        save_raw_table(output_file)
+    return stat_df
+
+
+def make_raw_frame(columns, rows):
+    """Builds a DataFrame from parsed table rows one column at a time, typed
+    the same way pd.read_csv() reads the Raw file. Blank entries become NaN,
+    every column that only holds numbers is converted to a numeric type and
+    blank column names become "Unnamed: [position]"
+
+    Parameters:
+    columns (list): The column names, a trailing "" keeps the Raw files' empty
+    last column
+    rows (list): The parsed rows (lists of strings), shorter rows are padded
+
+    Returns:
+    raw_df (DataFrame): The typed table"""
+    columns = [
+        column if column != "" else "Unnamed: " + str(i)
+        for i, column in enumerate(columns)
+    ]
+    if len(rows) == 0:
+        return pd.DataFrame(columns=columns)
+    width = len(columns)
+    rows = [row[:width] + [""] * (width - len(row)) for row in rows]
+    raw_df = pd.DataFrame(
+        {i: convert_raw_column(values) for i, values in enumerate(zip(*rows))}
+    )
+    raw_df.columns = columns
+    return raw_df
+
+
+def convert_raw_column(values):
+    """Converts one column of parsed strings into a Series, numeric if every
+    non-blank entry is a number
+
+    Parameters:
+    values (tuple): The column's entries
+
+    Returns:
+    column (Series): The typed column"""
+    column = pd.Series([np.nan if value == "" else value for value in values])
+    try:
+        return pd.to_numeric(column)
+    except (ValueError, TypeError):
+        return column
+
+
+def parse_stat_page(soup, suffix, year, version):
+    """Extracts the player stat rows of a single npb.jp team stat page
+
+    Parameters:
+    soup (BeautifulSoup): The parsed team stat page
+    suffix (string): The stat suffix of the page ("BR", "PR", "BF", "PF", "BP",
+    "PP")
+    year (string): The desired NPB year to scrape
+    version (string): The npb_urls.csv page version ("v1" or "v2")
+
+    Returns:
+    rows (list): The stat rows (lists of strings), each ending with the team"""
+    rows = []
+    if version == "v1":
+        # Since header row was created, skip to stat rows
+        iter_soup = iter(soup.table)
+        # Left handed pitcher/batter and switch hitter row skip
+        next(iter_soup)
+        # npb.jp header row skip
+        next(iter_soup)
+        # Get team once for the whole page
+        title_div = soup.find(id="stdivtitle")
+        year_title_str = revise_year_title_str(title_div.h1.get_text(), suffix, year)
+        # Extract table rows from npb.jp team stats, skipping the first column
+        # (left handed batter/pitcher or switch hitter) and removing commas in
+        # first and last names
+        for table_row in iter_soup:
+            row = [entry.get_text().replace(",", "") for entry in table_row][1:]
+            # Append team as last entry and move to next row
+            row.append(year_title_str)
+            rows.append(row)
+
+    # New 2025 post season and onwards table type
+    elif version == "v2":
+        player_stat_rows = iter(soup.find_all("tr"))
+        # Skip header row
+        next(player_stat_rows)
+        # Get team once for the whole page
+        title = soup.find("span")
+        year_title_str = revise_year_title_str(str(title.string), suffix, year)
+        for table_row in player_stat_rows:
+            row = [
+                entry.get_text().strip().translate(STAT_CELL_TRANSLATION)
+                for entry in table_row.find_all("td")
+            ]
+            # Append team as last entry and move to next row
+            row.append(year_title_str)
+            rows.append(row)
+
+    return rows
 
 
 def get_post_season_stats(year_dir, suffix, year):
-    # TODO: merge with get_stats?
     """The main post season stat scraping function that makes Raw stat files.
-    Saving Raw stat files allows for scraping and stat organization to be
-    independent of each other. Different scraping schemas are used for URLs
-    before 2025 post season and after 2025 post season.
+    Post season team pages are parsed like the regular season ones (see
+    write_raw_stats()), the schema depends on the npb_urls.csv page version
+    (before and after the 2025 post season)
 
     Parameters:
-    yearDir (string): The directory that stores the raw, scraped NPB stats
+    year_dir (string): The directory that stores the raw, scraped NPB stats
     suffix (string): Determines header row of csv file and indicates the stats
     that the URLs point to:
     "BP" = post season batting stat URLs passed in
     "PP" = post season pitching stat URLs passed in
     year (string): The desired npb year to scrape
 
-    Returns: N/A"""
-    # Make output file
-    output_file = make_raw_player_file(year_dir, suffix, year)
-    # Grab URLs to scrape
+    Returns:
+    stat_df (DataFrame): The Raw stat table (see write_raw_stats())"""
     url_arr, version = get_stat_urls(suffix, year)
-    # Create header row
-    if suffix == "BP":
-        output_file.write(
-            "Player,G,PA,AB,R,H,2B,3B,HR,TB,RBI,SB,CS,SH,SF,BB,IBB,HP,SO,GDP,AVG,SLG,OBP,Team,\n"
-        )
-    if suffix == "PP" and version == "v1":
-        output_file.write(
-            "Pitcher,G,W,L,SV,HLD,CG,SHO,PCT,BF,IP,,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
-        )
-    if suffix == "PP" and version == "v2":
-        output_file.write(
-            "Pitcher,G,W,L,SV,HLD,HP,CG,SHO,NBBG,PCT,BF,IP,H,HR,BB,IBB,HB,SO,WP,BK,R,ER,ERA,Team,\n"
-        )
-
-    # Loop through all team stat pages in url_arr
-    for url in url_arr:
-        # Make GET request
-        r = get_url(url)
-        # Create the soup for parsing the html content
-        soup = BeautifulSoup(r.content, "html.parser")
-        if version == "v1":
-            # Since header row was created, skip to stat rows
-            iter_soup = iter(soup.table)
-            # Left handed pitcher/batter and switch hitter row skip
-            next(iter_soup)
-            # npb.jp header row skip
-            next(iter_soup)
-            # Extract table rows from npb.jp team stats
-            for table_row in iter_soup:
-                # Skip first column for left handed batter/pitcher or switch hitter
-                iter_table = iter(table_row)
-                next(iter_table)
-                # Write output in csv file format
-                for entry in iter_table:
-                    # Remove commas in first and last names
-                    entry_text = entry.get_text()
-                    if entry_text.find(","):
-                        entry_text = entry_text.replace(",", "")
-                    # Write output in csv file format
-                    output_file.write(entry_text + ",")
-
-                # Get team
-                title_div = soup.find(id="stdivtitle")
-                year_title_str = revise_year_title_str(
-                    title_div.h1.get_text(), suffix, year
-                )
-                # Append as last entry and move to next row
-                output_file.write(year_title_str + ",\n")
-
-        # New 2025 post season and onwards table type
-        elif version == "v2":
-            player_stat_rows = iter(soup.find_all("tr"))
-            # Skip header row
-            next(player_stat_rows)
-            for row in player_stat_rows:
-                for entry in row.find_all("td"):
-                    # TODO: remove if statements? text filtering possibly handled in later code
-                    entry_text = entry.get_text()
-                    if entry_text.find(","):
-                        entry_text = entry_text.replace(",", "")
-                    if entry_text.find("　"):
-                        entry_text = entry_text.replace("　", " ")
-                    if entry_text.find("*"):
-                        entry_text = entry_text.replace("*", "")
-                    # Write output in csv file format
-                    output_file.write(entry_text + ",")
-
-                # Get team
-                title = soup.find("span")
-                year_title_str = revise_year_title_str(str(title.string), suffix, year)
-                # Append as last entry and move to next row
-                output_file.write(year_title_str + ",\n")
-        # Close request
-        r.close()
-        # Pace requests to npb.jp to avoid excessive requests
-        sleep(randint(3, 5))
-    # After all URLs are scraped, close output file
-    output_file.close()
+    return write_raw_stats(year_dir, suffix, year, version, fetch_pages(url_arr))
 
 
 def revise_year_title_str(year_title_str, suffix, year):
@@ -3974,7 +5267,9 @@ def revise_stats(df, rel_dir, year):
 
     This function reads a revision file containing corrections for player statistics,
     identifying errors in the data and applying the specified revisions. It's intended
-    as a final sweep before outputting statistics.
+    as a final sweep before outputting statistics. The revisions are compiled once
+    per year (see compile_revisions()) and each revised column is updated in one
+    pass, keeping its dtype when the revisions fit it.
 
     Parameters:
         df (pandas.DataFrame): The dataframe containing player statistics to be revised.
@@ -3993,7 +5288,6 @@ def revise_stats(df, rel_dir, year):
         os.path.join(rel_dir, "input", year), "roster_revisions.csv"
     )
     if os.path.exists(revise_filename):
-        revise_df = pd.read_csv(revise_filename, dtype=str)
         # Determine player identifier column based on available columns
         if "Player" in df.columns:
             player_col = "Player"
@@ -4003,40 +5297,110 @@ def revise_stats(df, rel_dir, year):
             # No player column found, return original dataframe
             return df
 
-        # Apply each revision from the CSV
-        for _, revision_row in revise_df.iterrows():
-            col_name = revision_row["ColumnName"]
-            player_name = revision_row["PlayerName"]
-            error_value = revision_row["Error"]
-            revision_value = revision_row["Revision"]
+        stages = INPUT_STORE.index(
+            revise_filename,
+            "revisions_" + player_col,
+            lambda revise_df: compile_revisions(revise_df, player_col),
+            dtype=str,
+        )
+        for stage in stages:
+            for col_name, lookup in stage.items():
+                # Check if the column exists in the dataframe
+                if col_name in df.columns:
+                    df[col_name] = apply_revisions(df[player_col], df[col_name], lookup)
 
-            # Check if the column exists in the dataframe
-            if col_name not in df.columns:
-                continue
+    return df
 
-            # Convert column to string for consistent comparison (for non-NaN values)
-            df[col_name] = df[col_name].astype(str)
 
-            # Find rows where the player name matches
-            player_mask = df[player_col].astype(str) == player_name
+def get_revision_key(value):
+    """Returns the value revisions match on: the value as text, or None for
+    NaN/"nan"/"" (matched by revisions with an empty Error)"""
+    if pd.isna(value) or value in ("nan", ""):
+        return None
+    return value
 
-            # Handle NaN error values specially using pd.isna()
-            if pd.isna(error_value):
-                # When error_value is NaN, match rows where the column is NaN
-                error_mask = (
-                    df[col_name].isna() | (df[col_name] == "nan") | (df[col_name] == "")
-                )
-            else:
-                # For non-NaN error values, use string comparison
-                error_mask = df[col_name].astype(str) == error_value
 
-            # Combine masks to find matching rows
-            mask = player_mask & error_mask
+def compile_revisions(revise_df, player_col):
+    """Compiles roster_revisions.csv into per-column lookups. Revisions are
+    applied in file order, so a column's later revisions can revise earlier
+    ones and revisions after a player rename match the new name. Revisions
+    are split into stages at each switch between player column revisions and
+    other columns, within a stage every column is revised in one pass
 
-            # Apply the revision to matching rows
-            df.loc[mask, col_name] = revision_value
+    Parameters:
+    revise_df (pandas dataframe): The roster_revisions.csv table (read as str)
+    player_col (string): The player identifier column ("Player" or "Pitcher")
 
-    return df
+    Returns:
+    stages (list): Dicts of column name: {(player, error key): revision}"""
+    stages = []
+    stage = None
+    renames = None
+    for col_name, player_name, error_value, revision_value in zip(
+        revise_df["ColumnName"],
+        revise_df["PlayerName"],
+        revise_df["Error"],
+        revise_df["Revision"],
+    ):
+        is_rename = col_name == player_col
+        if is_rename and player_name != error_value:
+            # A rename only matches rows whose current name is the player's
+            continue
+        if stage is None or is_rename != renames:
+            stage = {}
+            stages.append(stage)
+            renames = is_rename
+        lookup = stage.setdefault(col_name, {})
+        error_key = get_revision_key(error_value)
+        # Rows an earlier revision set to the error are revised again, renamed
+        # rows go by their new name
+        for key, revised in lookup.items():
+            if (is_rename or key[0] == player_name) and get_revision_key(
+                revised
+            ) == error_key:
+                lookup[key] = revision_value
+        lookup.setdefault((player_name, error_key), revision_value)
+    return stages
+
+
+def apply_revisions(players, column, lookup):
+    """Revises one column with a compiled lookup (see compile_revisions())
+
+    Parameters:
+    players (pandas series): The player identifier column
+    column (pandas series): The column to revise
+    lookup (dict): (player, error key): revision
+
+    Returns:
+    column (pandas series): The revised column, in its original dtype unless a
+    revision does not fit it (the column is then converted to str)"""
+    player_names = players.astype(str)
+    revised_players = {player_name for player_name, _ in lookup}
+    candidates = player_names.isin(revised_players)
+    if not candidates.any():
+        return column
+    rows = []
+    values = []
+    for row, player_name, value in zip(
+        np.flatnonzero(candidates),
+        player_names[candidates],
+        column[candidates].astype(str),
+    ):
+        key = (player_name, get_revision_key(value))
+        if key in lookup:
+            rows.append(row)
+            values.append(lookup[key])
+    if len(rows) == 0:
+        return column
+    column = column.copy()
+    try:
+        column.iloc[rows] = pd.Series(values).astype(column.dtype).values
+    except (ValueError, TypeError):
+        # The revision does not fit the column's dtype (e.g. text in a numeric
+        # column), keep the column as text like the revision file
+        column = column.astype(str)
+        column.iloc[rows] = values
+    return column
 
 
 def get_gsheets_data(input_dir, year_dir, suffix, year, stat_type):
@@ -4051,54 +5415,168 @@ def get_gsheets_data(input_dir, year_dir, suffix, year, stat_type):
     "BF" = farm batting stat URLs passed in
     "PF" = farm pitching stat URLs passed in
     year (string): The desired NPB year to scrape"""
-    # Google sheet stats not available before 2021, so return immediately
-    if int(year) < 2021:
+    get_all_gsheets_data(input_dir, year_dir, year, [(suffix, stat_type)])
+
+
+def get_all_gsheets_data(input_dir, year_dir, year, sheets):
+    """Scrapes several Google Sheets of a year concurrently. Each sheet is
+    saved as a typed cache (see write_gsheets_cache()) that the organizers
+    load without re-parsing, and as its Raw csv unless Raw output is disabled.
+    A sheet whose download matches the one behind its cache is left as is
+
+    Parameters:
+    input_dir (string): The directory that holds google_sheet_urls.csv
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    year (string): The desired NPB year to scrape
+    sheets (list): (suffix, stat_type) pairs to scrape, e.g. ("BR", "player")
+    """
+    # Google sheet stats not available before 2021, and team stats not
+    # available before 2025
+    sheets = [
+        (suffix, stat_type)
+        for suffix, stat_type in sheets
+        if int(year) >= 2021 and (int(year) >= 2025 or stat_type != "team")
+    ]
+    if len(sheets) == 0:
         return
-    # Google sheet team stats not available before 2025, so return
-    if int(year) < 2025 and stat_type == "team":
+    url_path = os.path.join(input_dir, "google_sheet_urls.csv")
+    if not os.path.exists(url_path):
+        print("WARNING: No google_sheet_urls.csv found, skipping Google Sheets...")
         return
+    gsheet_df = pd.read_csv(url_path)
+    gsheet_df = gsheet_df[gsheet_df.Year.astype(str) == year]
+    sheet_urls = {}
+    for suffix, stat_type in sheets:
+        link = gsheet_df.loc[
+            (gsheet_df.Stat_Type == stat_type) & (gsheet_df.Suffix == suffix[0]),
+            "Link",
+        ]
+        if len(link) == 0:
+            print(
+                "WARNING: No Google Sheet for "
+                + year
+                + " "
+                + suffix
+                + " "
+                + stat_type
+                + " stats, skipping..."
+            )
+            continue
+        sheet_urls[(suffix, stat_type)] = link.iloc[0]
 
-    gsheet_df = pd.read_csv(os.path.join(input_dir, "google_sheet_urls.csv"))
+    raw_dir = os.path.join(year_dir, "raw")
+    os.makedirs(raw_dir, exist_ok=True)
+    responses = fetch_pages(sheet_urls.values())
+    for (suffix, stat_type), r in zip(sheet_urls, responses):
+        content = r.content
+        r.close()
+        new_csv_name = year + "GSheetsRaw" + suffix + "_" + stat_type + ".csv"
+        cache_path = get_gsheets_cache_path(year_dir, year, suffix, stat_type)
+        source_hash = hashlib.sha256(content).hexdigest()
+        manifest = read_raw_manifest(os.path.join(raw_dir, RAW_MANIFEST_NAME))
+        entry = manifest.get(os.path.basename(cache_path), {})
+        if (
+            entry.get("source_sha256") == source_hash
+            and os.path.exists(cache_path)
+            and (
+                RAW_OUTPUT["enabled"] is False
+                or os.path.exists(os.path.join(raw_dir, new_csv_name))
+            )
+        ):
+            print("Google Sheet unchanged, keeping " + cache_path)
+            continue
 
-    # Drop all rows that are not the df's year, type, or suffix then scrape
-    gsheet_df = gsheet_df.drop(gsheet_df[gsheet_df.Year.astype(str) != year].index)
-    gsheet_df = gsheet_df.drop(gsheet_df[gsheet_df.Stat_Type != stat_type].index)
-    gsheet_df = gsheet_df.drop(gsheet_df[gsheet_df.Suffix != suffix[0]].index)
-    gsheet_url = gsheet_df["Link"].iloc[0]
+        # Save file
+        df = pd.read_csv(io.BytesIO(content))
+        if RAW_OUTPUT["enabled"] is True:
+            raw_gsheet_name = store_dataframe(df, raw_dir, new_csv_name, "csv")
+        # Written after the csv so read_gsheets_data() sees the cache as newer
+        write_gsheets_cache(df, cache_path)
+        update_raw_manifest(
+            cache_path,
+            {
+                "rows": len(df),
+                "source_sha256": source_hash,
+                "written": datetime.now().isoformat(timespec="seconds"),
+            },
+        )
+        if RAW_OUTPUT["enabled"] is False:
+            continue
 
-    print("Connecting to: " + gsheet_url)
-    sleep(randint(1, 3))
+        # Output to user
+        if suffix == "PR" and stat_type == "player":
+            print(
+                "Raw NPB player pitching statistics from Google Sheets will be stored in: "
+                + raw_gsheet_name
+            )
+        elif suffix == "BR" and stat_type == "player":
+            print(
+                "Raw NPB player batting statistics from Google Sheets will be stored in: "
+                + raw_gsheet_name
+            )
+        elif suffix == "BR" and stat_type == "team":
+            print(
+                "Raw NPB team batting statistics from Google Sheets will be stored in: "
+                + raw_gsheet_name
+            )
+        elif suffix == "PR" and stat_type == "team":
+            print(
+                "Raw NPB team pitching statistics from Google Sheets will be stored in: "
+                + raw_gsheet_name
+            )
 
-    df = pd.read_csv(gsheet_url)
 
-    # Save file
-    new_csv_name = year + "GSheetsRaw" + suffix + "_" + stat_type + ".csv"
-    raw_dir = os.path.join(year_dir, "raw")
-    if not os.path.exists(raw_dir):
-        os.mkdir(raw_dir)
-    raw_gsheet_name = store_dataframe(df, raw_dir, new_csv_name, "csv")
+def get_gsheets_cache_path(year_dir, year, suffix, stat_type):
+    """Returns the path of a Google Sheet's typed cache in the year's raw dir,
+    a Parquet file when pyarrow is installed, else a pickle"""
+    extension = ".parquet" if GSHEETS_CACHE_FORMAT == "parquet" else ".pkl"
+    return os.path.join(
+        year_dir, "raw", year + "GSheetsRaw" + suffix + "_" + stat_type + extension
+    )
 
-    # Output to user
-    if suffix == "PR" and stat_type == "player":
-        print(
-            "Raw NPB player pitching statistics from Google Sheets will be stored in: "
-            + raw_gsheet_name
-        )
-    elif suffix == "BR" and stat_type == "player":
-        print(
-            "Raw NPB player batting statistics from Google Sheets will be stored in: "
-            + raw_gsheet_name
-        )
-    elif suffix == "BR" and stat_type == "team":
-        print(
-            "Raw NPB team batting statistics from Google Sheets will be stored in: "
-            + raw_gsheet_name
-        )
-    elif suffix == "PR" and stat_type == "team":
-        print(
-            "Raw NPB team pitching statistics from Google Sheets will be stored in: "
-            + raw_gsheet_name
-        )
+
+def write_gsheets_cache(df, cache_path):
+    """Atomically saves a Google Sheet dataframe with its dtypes kept
+
+    Parameters:
+    df (pandas dataframe): The parsed Google Sheet
+    cache_path (string): Path from get_gsheets_cache_path()"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as cache_file:
+        if GSHEETS_CACHE_FORMAT == "parquet":
+            df.to_parquet(cache_file, index=False)
+        else:
+            df.to_pickle(cache_file)
+    os.replace(tmp_path, cache_path)
+
+
+def read_gsheets_data(year_dir, year, suffix, stat_type):
+    """Loads a scraped Google Sheet. The typed cache is used when it is at
+    least as new as the Raw csv, otherwise the Raw csv is parsed
+
+    Parameters:
+    year_dir (string): The directory that stores the raw, scraped NPB stats
+    year (string): The year of the Google Sheet
+    suffix (string): "BR" or "PR"
+    stat_type (string): "player" or "team"
+
+    Returns:
+    gsheet_df (pandas dataframe): The Google Sheet's stats"""
+    csv_path = os.path.join(
+        year_dir, "raw", year + "GSheetsRaw" + suffix + "_" + stat_type + ".csv"
+    )
+    cache_path = get_gsheets_cache_path(year_dir, year, suffix, stat_type)
+    if os.path.exists(cache_path) and (
+        not os.path.exists(csv_path)
+        or os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)
+    ):
+        try:
+            if GSHEETS_CACHE_FORMAT == "parquet":
+                return pd.read_parquet(cache_path)
+            return pd.read_pickle(cache_path)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            print("WARNING: Unreadable Google Sheet cache, using " + csv_path)
+    return pd.read_csv(csv_path)
 
 
 def get_standings(year_dir, suffix, year):
@@ -4116,7 +5594,6 @@ def get_standings(year_dir, suffix, year):
 
     Scrapes the official NPB standings page, extracts team statistics (G, W, L, PCT, etc.),
     and writes them to a raw CSV file for later processing into PA/IP drop constants."""
-    output_file = make_raw_standings_file(year_dir, suffix, year)
     # Get URL to scrape
     if suffix in ("C_farm", "E_farm", "W_farm") and int(year) >= 2026:
         url_suffix = suffix.replace("_farm", "").lower()
@@ -4126,9 +5603,46 @@ def get_standings(year_dir, suffix, year):
         url_suffix = url_suffix.replace("_npb", "").lower()
         url = f"https://npb.jp/bis/eng/{year}/stats/std_{url_suffix}.html"
     r = get_url(url)
-    # Create the soup for parsing the html content
-    soup = BeautifulSoup(r.content, "html.parser")
+    rows, unchanged = parse_page_cached(
+        url,
+        r.content,
+        "standings" + year,
+        parse_standings_page,
+        (year,),
+        "standings",
+    )
+    # Close request
+    r.close()
+
+    raw_csv_name = os.path.join(
+        year_dir, "raw", year + "StandingsRaw" + suffix + ".csv"
+    )
+    if unchanged is True and is_raw_file_complete(raw_csv_name):
+        print("Standings page unchanged, keeping: " + raw_csv_name)
+    elif RAW_OUTPUT["enabled"] is True:
+        output_file = make_raw_standings_file(year_dir, suffix, year)
+        if len(rows) > 0:
+            output_file.write_header(rows[0])
+        for row in rows[1:]:
+            output_file.write_row(row)
+        save_raw_table(output_file)
+    if len(rows) == 0:
+        return None
+    # Rows end with an empty column, like the Raw file
+    return make_raw_frame(rows[0] + [""], rows[1:])
+
+
+def parse_standings_page(soup, year):
+    """Extracts the header and team rows of an npb.jp standings page
+
+    Parameters:
+        soup (BeautifulSoup): The parsed standings page.
+        year (string): The desired standings stat year.
 
+    Returns:
+        list: The header row followed by the team rows (lists of strings).
+            Empty if the page has no standings table."""
+    rows = []
     # Grab all rows in the first subtable on the page (pre 2026 tables)
     version = "v1"
     if len(soup.find_all("table")) >= 2 and int(year) < 2026:
@@ -4139,27 +5653,25 @@ def get_standings(year_dir, suffix, year):
         table = soup.find("table", {"class": "tablefix2"})
     # Stop running if no table is available
     else:
-        # Close request and output file
-        r.close()
-        output_file.close()
-        return
+        return rows
 
     if version == "v1":
         # Create header row
         iter_table = iter(table)
         tr = next(iter_table)
+        header_row = []
         # Loop through each td in a table row
         for td in tr:
             entry_text = td.get_text()
             # Skip empty column
             if entry_text == "":
                 continue
-            # Insert each entry using csv format
-            output_file.write(entry_text + ",")
-        output_file.write("\n")
+            header_row.append(entry_text)
+        rows.append(header_row)
 
         # Since header row was created, skip to stat rows
         for tr in iter_table:
+            row = []
             # Loop through each td in a table row
             for td in tr:
                 entry_text = td.get_text()
@@ -4169,23 +5681,24 @@ def get_standings(year_dir, suffix, year):
                 # Skip empty columns
                 if entry_text == "":
                     continue
-                # Insert each entry using csv format
-                output_file.write(entry_text + ",")
+                row.append(entry_text)
             # Skip duplicate named table row
-            next(iter_table)
-            output_file.write("\n")
+            next(iter_table, None)
+            rows.append(row)
     elif version == "v2":
+        header_row = []
         # Loop through each th in the header table row
         for th in table.find_all("th"):
             entry_text = th.get_text()
             # Skip empty column
             if entry_text == "":
                 continue
-            # Insert each entry using csv format
-            output_file.write(entry_text + ",")
+            header_row.append(entry_text)
+        rows.append(header_row)
 
-        # Process stat rows
-        for tr in table.find_all("tr"):
+        # Process stat rows, the header table row's (empty) tds end the header row
+        for i, tr in enumerate(table.find_all("tr")):
+            row = []
             for td in tr.find_all("td"):
                 entry_text = td.get_text()
                 # Standardize blank spots in the csv
@@ -4194,20 +5707,16 @@ def get_standings(year_dir, suffix, year):
                 # Skip empty columns
                 if entry_text == "":
                     continue
-                # Insert each entry using csv format
-                output_file.write(entry_text + ",")
-            # Skip duplicate named table row
-            # next(iter_table)
-            output_file.write("\n")
+                row.append(entry_text)
+            if i == 0:
+                header_row.extend(row)
+            else:
+                rows.append(row)
 
-    # Close request and output file
-    r.close()
-    output_file.close()
-    # Pace requests to npb.jp to avoid excessive requests
-    sleep(randint(1, 3))
+    return rows
 
 
-def get_fielding(year_dir, suffix, year):
+def get_fielding(year_dir, suffix, year, browser=None):
     """Scrapes the fielding stats for the desired year and suffix
 
     Parameters:
@@ -4215,73 +5724,222 @@ def get_fielding(year_dir, suffix, year):
     suffix (string): Indicates URL being scraped:
     "R" = regular season fielding stats
     "F" = farm fielding stats
-    year (string): The desired fielding stat year"""
-    rel_dir = os.path.dirname(__file__)
-    url_file = rel_dir + "/input/fielding_urls.csv"
+    year (string): The desired fielding stat year
+    browser (FieldingBrowser): Optional browser session to reuse for
+    npbbasement.com downloads, a temporary one is used if not given
+
+    Returns:
+    fielding_df (DataFrame): The Raw fielding table, typed as if read from the
+    file (None if the fielding URL is not recognized)"""
     # Grab singular fielding URL from file
     # TODO: implement better url filtering since npbbasement has all stats at 1 url
-    df = pd.read_csv(url_file)
-    df = df.drop(df[df.Year.astype(str) != year].index)
     if "R" in suffix:
         fielding_league = "NPB"
     else:
         fielding_league = "Farm"
-    df = df.drop(df[df.League != fielding_league].index)
+    df = select_input_rows(
+        "fielding_urls.csv", ["Year", "League"], (year, fielding_league)
+    )
     fielding_url = df["Link"].iloc[0]
 
-    output_file = make_raw_fielding_file(year_dir, suffix, year)
+    raw_csv_name = os.path.join(year_dir, "raw", year + "FieldingRaw" + suffix + ".csv")
 
     # Pre 2026/pre migration to https://npbbasement.com/fielding
     if "bo-no05.hatenadiary.org" in fielding_url:
         r = get_url(fielding_url)
-        soup = BeautifulSoup(r.content, "html.parser")
-        # Grab all fielding table entries
-        fielding_tr = soup.find_all("tr")
-        for tr in fielding_tr:
-            if tr.get_text() == "":
-                continue
-            for td in tr:
-                entry_text = td.get_text()
-                entry_text = entry_text.strip()
-                if entry_text == "":
-                    continue
-                output_file.write(entry_text + ",")
-            output_file.write("\n")
+        rows, unchanged = parse_page_cached(
+            fielding_url,
+            r.content,
+            "fielding",
+            parse_hatena_fielding_page,
+            page_type="hatena_fielding",
+        )
         r.close()
+        if unchanged is True and is_raw_file_complete(raw_csv_name):
+            print("Fielding page unchanged, keeping: " + raw_csv_name)
+        elif RAW_OUTPUT["enabled"] is True:
+            output_file = make_raw_fielding_file(year_dir, suffix, year)
+            for row in rows:
+                output_file.write_row(row)
+            save_raw_table(output_file)
+        if len(rows) == 0:
+            return None
+        # Rows end with an empty column, like the Raw file
+        return make_raw_frame(rows[0] + [""], rows[1:])
 
     # Post 2026/migration to https://npbbasement.com/fielding
     if "npbbasement.com" in fielding_url:
         division = "farm" if "F" in suffix else "top"
-        with sync_playwright() as pw:
-            browser = pw.chromium.launch(headless=True)
-            page = browser.new_page()
-            print(f"Connecting to: {fielding_url}")
-            page.goto(fielding_url, wait_until="networkidle", timeout=30000)
-            sleep(3)
-            # Select division (top = NPB regular season, farm = farm league)
-            page.locator("select").first.select_option(division)
-            sleep(1)
-            # Select year
-            page.locator("select").nth(1).select_option(year)
-            sleep(1)
+        if browser is None:
+            with FieldingBrowser() as temp_browser:
+                csv_content = temp_browser.download_csv(fielding_url, division, year)
+        else:
+            csv_content = browser.download_csv(fielding_url, division, year)
+        write_fielding_csv(year_dir, suffix, year, csv_content)
+        return pd.read_csv(io.StringIO(csv_content))
+    return None
+
+
+class FieldingBrowser:
+    """A reusable headless browser session for npbbasement.com fielding CSV
+    downloads. The browser starts on the first download and keeps its page
+    loaded, so the NPB and farm CSVs of any year come from one page load.
+    Playwright's sync API is thread bound, so a session must be used and
+    closed on the thread that made its first download"""
+
+    def __init__(self):
+        self.playwright = None
+        self.browser = None
+        self.page = None
+        self.page_url = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def download_csv(self, url, division, year):
+        """Downloads a fielding CSV from the npbbasement.com fielding page
+
+        Parameters:
+        url (string): The npbbasement.com fielding page URL
+        division (string): "top" = NPB regular season, "farm" = farm league
+        year (string): The desired fielding stat year
+
+        Returns:
+        csv_content (string): The downloaded CSV text (BOM removed)"""
+        archive_params = {"division": division, "year": year}
+        if HTTP_ARCHIVE["mode"] == "replay":
+            return load_archived_response(url, archive_params).content.decode("utf-8")
+        if self.browser is None:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(headless=True)
+            self.page = self.browser.new_page()
+
+        # Each download counts as one request in npbbasement's budget
+        host_state = HOST_SCHEDULER.acquire(url)
+        started = monotonic()
+        status_code = None
+        try:
+            if self.page_url != url:
+                print(f"Connecting to: {url}")
+                self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                self.page_url = url
+            self.select_table(division, year)
             # Download CSV via button click
-            with page.expect_download(timeout=30000) as download_info:
-                page.locator("button:has-text('DOWNLOAD CSV')").click()
-            download = download_info.value
-            # Read downloaded file content, strip BOM, write to output
-            download_path = download.path()
+            with self.page.expect_download(timeout=30000) as download_info:
+                self.page.locator("button:has-text('DOWNLOAD CSV')").click()
+            download_path = download_info.value.path()
+            # Read downloaded file content, strip BOM
             with open(download_path, "r", encoding="utf-8-sig") as dl_file:
                 csv_content = dl_file.read()
-            output_file.write(csv_content)
-            browser.close()
+            status_code = 200
+        finally:
+            HOST_SCHEDULER.release(host_state, status_code, monotonic() - started)
+        if HTTP_ARCHIVE["mode"] == "record":
+            archive_response(
+                url,
+                archive_params,
+                {"status_code": 200, "url": url, "headers": {}, "encoding": "utf-8"},
+                csv_content.encode("utf-8"),
+            )
+        return csv_content
 
-    # Pace requests to avoid excessive requests
-    sleep(randint(1, 3))
-    # After all URLs are scraped, close output file
-    output_file.close()
+    def select_table(self, division, year):
+        """Selects a division and year on the fielding page and waits until
+        the table shows them. A reused page has already reached networkidle,
+        so the wait is on the table's data request and the table's contents
+
+        Parameters:
+        division (string): "top" = NPB regular season, "farm" = farm league
+        year (string): The desired fielding stat year"""
+        # Wait for the division and year selectors to render
+        selects = self.page.locator("select")
+        selects.nth(1).wait_for(state="visible", timeout=30000)
+        table_text = self.page.evaluate(
+            "() => document.querySelector('table')?.innerText ?? ''"
+        )
+        changed = False
+        # Select division then year, waits until the options exist
+        for select, value in ((selects.first, division), (selects.nth(1), year)):
+            if select.input_value() == value:
+                continue
+            with self.page.expect_response(
+                lambda response: response.request.resource_type in ("fetch", "xhr"),
+                timeout=30000,
+            ) as response_info:
+                select.select_option(value)
+            response_info.value.finished()
+            changed = True
+        if changed:
+            # Wait until the new data replaced the previous table
+            self.page.wait_for_function(
+                "text => (document.querySelector('table')?.innerText ?? '') !== text",
+                arg=table_text,
+                timeout=30000,
+            )
+
+    def close(self):
+        """Closes the browser, if it was started"""
+        if self.browser is not None:
+            self.browser.close()
+            self.playwright.stop()
+        self.playwright = None
+        self.browser = None
+        self.page = None
+        self.page_url = None
+
+
+def parse_hatena_fielding_page(soup):
+    """Extracts the fielding rows of a bo-no05.hatenadiary.org fielding page
+
+    Parameters:
+    soup (BeautifulSoup): The parsed fielding page
+
+    Returns:
+    rows (list): The fielding table rows (lists of strings)"""
+    rows = []
+    # Grab all fielding table entries
+    fielding_tr = soup.find_all("tr")
+    for tr in fielding_tr:
+        if tr.get_text() == "":
+            continue
+        row = []
+        for td in tr:
+            entry_text = td.get_text()
+            entry_text = entry_text.strip()
+            if entry_text == "":
+                continue
+            row.append(entry_text)
+        rows.append(row)
+    return rows
+
+
+def write_fielding_csv(year_dir, suffix, year, csv_content):
+    """Writes a downloaded fielding CSV to its Raw fielding file, unless the
+    existing Raw file already holds the same content (compared by hash)
 
+    Parameters:
+    year_dir (string): The directory to store relevant year statistics
+    suffix (string): "R" = regular season, "F" = farm fielding stats
+    year (string): The desired fielding stat year
+    csv_content (string): The downloaded CSV text"""
+    if RAW_OUTPUT["enabled"] is False:
+        return
+    raw_csv_name = os.path.join(year_dir, "raw", year + "FieldingRaw" + suffix + ".csv")
+    content_hash = hashlib.sha256(csv_content.encode("utf-8")).hexdigest()
+    if os.path.exists(raw_csv_name):
+        with open(raw_csv_name, "rb") as raw_file:
+            if hashlib.sha256(raw_file.read()).hexdigest() == content_hash:
+                print("Fielding CSV unchanged, keeping: " + raw_csv_name)
+                return
+    output_file = make_raw_fielding_file(year_dir, suffix, year)
+    output_file.write(csv_content)
+    save_raw_table(output_file)
 
-def get_career_data(rel_dir, year):
+
+def get_career_data(rel_dir, year, refresh_stale=True):
     """Scrape all NPB team player entries and their career stats.
 
     Navigates the NPB team player directory, extracts individual player links,
@@ -4292,16 +5950,18 @@ def get_career_data(rel_dir, year):
     Parameters:
         rel_dir (str): The directory path where year-specific statistics are stored.
         year (str): The base year for the player search URL (e.g., "2024").
+        refresh_stale (bool, optional): Also re-fetch already scraped players
+            that are still active (see find_stale_career_players()).
 
     Side Effects:
-        Creates three CSV files in stats/all/raw/:
+        Appends to three CSV files in stats/all/raw/:
             - raw_career_bio.csv: Player biographical information
             - raw_career_bat.csv: Career batting statistics for all players
             - raw_career_pitch.csv: Career pitching statistics for all players
 
     Note:
         Attempts to load existing career data files first to avoid re-scraping
-        players that already have data."""
+        players that already have data. Only active players are refreshed."""
     team_url_dict = {
         "Hanshin Tigers": f"https://npb.jp/bis/players/search/yearly/{year}/1961001/",
         "Hiroshima Carp": f"https://npb.jp/bis/players/search/yearly/{year}/1968001/",
@@ -4316,230 +5976,392 @@ def get_career_data(rel_dir, year):
         "Seibu Lions": f"https://npb.jp/bis/players/search/yearly/{year}/2008001/",
         "Nipponham Fighters": f"https://npb.jp/bis/players/search/yearly/{year}/2004001/",
     }
-    # Grab existing bio_df if possible, else create a new one
-    try:
-        bio_df = pd.read_csv(
-            os.path.join(rel_dir, "stats", "all", "raw", "raw_career_bio.csv"),
-            index_col=0,
-        )
-    except Exception as e:
-        print("Unable to load a raw_career_bio.csv, creating new file...")
-        bio_df = pd.DataFrame()
-    try:
-        bat_stat_df = pd.read_csv(
-            os.path.join(rel_dir, "stats", "all", "raw", "raw_career_bat.csv")
-        )
-    except Exception as e:
-        print("Unable to load a raw_career_bat.csv, creating new file...")
-        bat_stat_df = pd.DataFrame(
-            columns=[
-                "Player",
-                "Link",
-                "年度",
-                "所属球団",
-                "試合",
-                "打席",
-                "打数",
-                "得点",
-                "安打",
-                "二塁打",
-                "三塁打",
-                "本塁打",
-                "塁打",
-                "打点",
-                "盗塁",
-                "盗塁刺",
-                "犠打",
-                "犠飛",
-                "四球",
-                "死球",
-                "三振",
-                "併殺打",
-                "打率",
-                "長打率",
-                "出塁率",
-            ]
-        )
-    try:
-        pitch_stat_df = pd.read_csv(
-            os.path.join(rel_dir, "stats", "all", "raw", "raw_career_pitch.csv")
-        )
-    except Exception as e:
-        print("Unable to load a raw_career_pitch.csv, creating new file...")
-        pitch_stat_df = pd.DataFrame(
-            columns=[
-                "Player",
-                "Link",
-                "年度",
-                "所属球団",
-                "登板",
-                "勝利",
-                "敗北",
-                "セーブ",
-                "H",
-                "HP",
-                "完投",
-                "完封勝",
-                "無四球",
-                "勝率",
-                "打者",
-                "投球回",
-                "投球回_2",
-                "安打",
-                "本塁打",
-                "四球",
-                "死球",
-                "三振",
-                "暴投",
-                "ボーク",
-                "失点",
-                "自責点",
-                "防御率",
-            ]
-        )
-
-    # Initialize counter and set to store players scraped
-    players_scraped = 0
+    raw_dir = os.path.join(rel_dir, "stats", "all", "raw")
+    # Grab existing career data if possible, else start with empty DataFrames
+    bio_df = read_raw_career_data(raw_dir, "bio")
+    bat_stat_df = read_raw_career_data(raw_dir, "bat")
+    pitch_stat_df = read_raw_career_data(raw_dir, "pitch")
+    os.makedirs(raw_dir, exist_ok=True)
     # Loads previously scraped players from raw_career_bio.csv in set if possible
-    # TODO: make it possible to refresh players that have already been scraped
     try:
         processed_urls = set[str](bio_df.index.tolist())
     except:
         processed_urls = set[str]()
 
-    for team, url in team_url_dict.items():
+    # Recover players completed by an interrupted run from the journal
+    journal_path = os.path.join(raw_dir, "career_journal.jsonl")
+    journal_records = load_career_journal(journal_path)
+    for record in journal_records:
+        processed_urls.add(record["url"])
+    if len(journal_records) > 0:
+        print(f"Recovered {len(journal_records)} players from {journal_path}")
+
+    # Collect unscraped players from every team's player directory
+    pending_players = []
+    team_responses = fetch_pages(team_url_dict.values())
+    for team, r in zip(team_url_dict.keys(), team_responses):
         print(f"Scraping {team} {year} NPB.jp team roster...")
-        r = get_url(url)
         print(f"Connected successfully. Status code: {r.status_code}")
-        soup = BeautifulSoup(r.content, "html.parser")
-
-        # Find all player links on the page
-        # The page structure contains player names as links to their individual stats pages
-        player_links = soup.find_all("a", href=True)
-        print(f"Total links found on page: {len(player_links)}")
-
-        for link in player_links:
-            href = link.get("href", "")
-            name_element = link.find(class_="name")
-            if name_element:
-                player_name = name_element.get_text(strip=True)
-            else:
-                player_name = link.get_text(strip=True)
+        soup = make_soup(r.content, "team_directory")
+        r.close()
+        for player_url, player_name in extract_player_links(soup):
+            # Skip if we've already processed this player
+            if player_url in processed_urls:
+                continue
+            processed_urls.add(player_url)
+            print(f"  Found unscraped player: {player_name}")
+            pending_players.append((player_url, player_name))
+
+    # Re-fetch already scraped players whose current season lines may change,
+    # their appended rows replace the old ones (see read_raw_career_data())
+    if refresh_stale is True:
+        skip_urls = {player_url for player_url, _ in pending_players}
+        skip_urls.update(record["url"] for record in journal_records)
+        refresh_count = 0
+        for player_url, player_name in find_stale_career_players(
+            bio_df, bat_stat_df, pitch_stat_df, rel_dir, year
+        ):
+            if player_url not in skip_urls:
+                refresh_count += 1
+                pending_players.append((player_url, player_name))
+        print(f"Refreshing {refresh_count} active players...")
+
+    crawl_career_players(pending_players, raw_dir, journal_path, journal_records)
+    compact_raw_career_data(raw_dir)
+
+
+def find_stale_career_players(bio_df, bat_stat_df, pitch_stat_df, rel_dir, year):
+    """Finds already scraped players whose career data can still change: players
+    whose latest batting/pitching 年度 is the current season, or who are on the
+    season's roster_data.csv.
+
+    Parameters:
+        bio_df (pandas.DataFrame): Career bio data, indexed by player URL.
+        bat_stat_df (pandas.DataFrame): Career batting rows.
+        pitch_stat_df (pandas.DataFrame): Career pitching rows.
+        rel_dir (str): The directory holding the input directory.
+        year (str): The current season.
+
+    Returns:
+        list: (player_url, player_name) tuples of the players to refresh."""
+    if len(bio_df.index) == 0:
+        return []
+    stale_urls = set()
+    # Players with a current season line
+    for df in [bat_stat_df, pitch_stat_df]:
+        if len(df.index) == 0:
+            continue
+        latest_year = pd.to_numeric(df["年度"], errors="coerce").groupby(df["Link"]).max()
+        stale_urls.update(latest_year[latest_year == int(year)].index)
+
+    # Players on the current roster (roster links are English page links)
+    roster_file = os.path.join(rel_dir, "input", year, "roster_data.csv")
+    if os.path.exists(roster_file):
+        roster_df = pd.read_csv(roster_file, usecols=["Link"])
+        stale_urls.update(
+            roster_df["Link"].dropna().astype(str).str.replace("/eng", "", regex=False)
+        )
+
+    stale_players = []
+    for player_url, player_name in bio_df["Player"].items():
+        if player_url in stale_urls:
+            stale_players.append((player_url, player_name))
+    return stale_players
+
+
+def crawl_career_players(players, raw_dir, journal_path, recovered_records=()):
+    """Fetches and parses player career pages with a bounded worker pool.
+
+    Player records are collected in a batch and appended to the raw career
+    files every CAREER_FLUSH_EVERY players. Each player is written to a
+    write-ahead journal as soon as it completes, and the journal is cleared
+    after every append, so a crash or timeout only loses the players still in
+    flight. A batch is appended in directory order.
+
+    Parameters:
+        players (list): (player_url, player_name) tuples to scrape.
+        raw_dir (str): The stats/all/raw directory holding the raw career files.
+        journal_path (str): Path of the write-ahead journal.
+        recovered_records (list): Journaled records of an interrupted run that
+            still need appending."""
+    players_scraped = 0
+    # (directory position, record) pairs, recovered records come first
+    batch = [(-1, record) for record in recovered_records]
+    started = monotonic()
+    with ThreadPoolExecutor(max_workers=CAREER_MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(fetch_player_career_stats, player_url, player_name): i
+            for i, (player_url, player_name) in enumerate(players)
+        }
+        with open(journal_path, "a", encoding="utf-8") as journal_file:
+            # Journal players as they finish, a slow player doesn't hold back
+            # the ones after it
+            for future in as_completed(futures):
+                record = future.result()
+                if record is None:
+                    continue
+                # Journal first so the player is never scraped twice
+                journal_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+                batch.append((futures[future], record))
+                players_scraped += 1
+
+                if len(batch) >= CAREER_FLUSH_EVERY:
+                    append_raw_career_data(raw_dir, sort_career_batch(batch))
+                    journal_file.seek(0)
+                    journal_file.truncate()
+                    batch = []
+                    elapsed_min = (monotonic() - started) / 60
+                    print(
+                        f"  {players_scraped}/{len(players)} players scraped "
+                        f"({players_scraped / elapsed_min:.1f} players/minute)"
+                    )
+            if len(batch) > 0:
+                append_raw_career_data(raw_dir, sort_career_batch(batch))
+                journal_file.seek(0)
+                journal_file.truncate()
+
+    if players_scraped:
+        elapsed_min = max((monotonic() - started) / 60, 1e-9)
+        print(
+            f"\nTotal new players scraped: {players_scraped} "
+            f"({players_scraped / elapsed_min:.1f} players/minute)\n"
+        )
+    else:
+        print("No players found.\n")
+
+
+def sort_career_batch(batch):
+    """Returns the records of a crawl batch in directory order
+
+    Parameters:
+        batch (list): (directory position, record) pairs.
+
+    Returns:
+        list: The records sorted by directory position."""
+    return [record for _, record in sorted(batch, key=lambda pair: pair[0])]
+
+
+def extract_player_links(soup):
+    """Finds the individual player page links on an NPB.jp team player directory
+
+    Parameters:
+        soup (BeautifulSoup): The parsed team player directory page.
+
+    Returns:
+        list: (player_url, player_name) tuples in page order."""
+    player_links = []
+    # Find all player links on the page
+    # The page structure contains player names as links to their individual stats pages
+    links = soup.find_all("a", href=True)
+    print(f"Total links found on page: {len(links)}")
+    for link in links:
+        href = link.get("href", "")
+        name_element = link.find(class_="name")
+        if name_element:
+            player_name = name_element.get_text(strip=True)
+        else:
+            player_name = link.get_text(strip=True)
+
+        # Skip empty names or navigation links
+        if not player_name:
+            continue
+
+        # Look for individual player page links
+        # Pattern: /bis/players/[id]/ or contains numeric player ID
+        if "/bis/players/" in href:
+            # Extract the player ID from the URL
+            # URLs look like: /bis/players/#######/
+            parts = href.split("/bis/players/")
+            if len(parts) > 1:
+                player_id = parts[-1].strip("/")
+                player_id = player_id.replace(".html", "")
+                # Check if it's a numeric player ID (6-8 digits)
+                if player_id.isdigit() and len(player_id) >= 6:
+                    player_url = (
+                        f"https://npb.jp{href}" if href.startswith("/") else href
+                    )
+                    player_links.append((player_url, player_name))
+    return player_links
+
+
+def load_career_journal(journal_path):
+    """Reads the player records of the career crawler's write-ahead journal
 
-            # Skip empty names or navigation links
-            if not player_name:
+    Parameters:
+        journal_path (str): Path of the journal file.
+
+    Returns:
+        list: The journaled player records, oldest first. A partially written
+            last line (from a crash mid-write) is ignored."""
+    records = []
+    if not os.path.exists(journal_path):
+        return records
+    with open(journal_path, encoding="utf-8") as journal_file:
+        for line in journal_file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
                 continue
+    return records
 
-            # Look for individual player page links
-            # Pattern: /bis/players/[id]/ or contains numeric player ID
-            if "/bis/players/" in href:
-                # Extract the player ID from the URL
-                # URLs look like: /bis/players/#######/
-                parts = href.split("/bis/players/")
-                if len(parts) > 1:
-                    player_id = parts[-1].strip("/")
-                    player_id = player_id.replace(".html", "")
-                    # Check if it's a numeric player ID (6-8 digits)
-                    if player_id.isdigit() and len(player_id) >= 6:
-                        player_url = (
-                            f"https://npb.jp{href}" if href.startswith("/") else href
-                        )
-
-                        # Skip if we've already processed this player
-                        if player_url in processed_urls:
-                            continue
-                        processed_urls.add(player_url)
-
-                        print(f"  Found unscraped player: {player_name}")
-
-                        # Scrape career stats from individual player page
-                        try:
-                            scrape_player_career_stats(
-                                bio_df,
-                                bat_stat_df,
-                                pitch_stat_df,
-                                player_url,
-                                player_name,
-                            )
-                        except Exception as e:
-                            print(
-                                f"    Warning: Could not fetch stats for {player_name}: {e}"
-                            )
-                        players_scraped += 1
-                        # Pace requests to NPB
-                        sleep(randint(1, 3))
-        r.close()
 
-        # Create DataFrame from player data
-        if players_scraped:
-            # Save to CSV in raw dir
-            bio_df.to_csv(
-                os.path.join(rel_dir, "stats", "all", "raw", "raw_career_bio.csv")
-            )
-            bat_stat_df.to_csv(
-                os.path.join(rel_dir, "stats", "all", "raw", "raw_career_bat.csv"),
-                index=False,
-            )
-            pitch_stat_df.to_csv(
-                os.path.join(rel_dir, "stats", "all", "raw", "raw_career_pitch.csv"),
-                index=False,
+def read_raw_career_data(raw_dir, kind):
+    """Reads a raw career file, keeping only each player's latest rows.
+
+    The raw career files are append-only, so a refreshed player appears more
+    than once. The last bio row per player URL is kept. A player's stat rows
+    are appended together, so for each (Link, 年度) only the rows of the
+    player's last appended block with that year are kept, which also drops
+    stale rows whose team was corrected by the refresh. Within a block the
+    last row per (Link, 年度, 所属球団) is kept.
+
+    Parameters:
+        raw_dir (str): The stats/all/raw directory holding the raw career files.
+        kind (str): "bio", "bat" or "pitch".
+
+    Returns:
+        pandas.DataFrame: The current rows (bio is indexed by player URL). An
+            empty DataFrame with the raw columns if the file does not exist."""
+    raw_path = os.path.join(raw_dir, "raw_career_" + kind + ".csv")
+    if not os.path.exists(raw_path):
+        print(f"Unable to load a raw_career_{kind}.csv, creating new file...")
+        if kind == "bat":
+            return pd.DataFrame(columns=CAREER_BAT_COLUMNS)
+        if kind == "pitch":
+            return pd.DataFrame(columns=CAREER_PITCH_COLUMNS)
+        return pd.DataFrame()
+    if kind == "bio":
+        df = pd.read_csv(raw_path, index_col=0)
+        return df[~df.index.duplicated(keep="last")]
+    df = pd.read_csv(raw_path)
+    # Number each run of consecutive rows of one player
+    block = (df["Link"] != df["Link"].shift()).cumsum()
+    last_block = block.groupby([df["Link"], df["年度"]], dropna=False).transform("max")
+    df = df[block == last_block]
+    df = df.drop_duplicates(subset=["Link", "年度", "所属球団"], keep="last")
+    return df.reset_index(drop=True)
+
+
+def append_raw_career_data(raw_dir, records):
+    """Materializes a batch of player records into DataFrames once and
+    appends them to the raw career files.
+
+    Parameters:
+        raw_dir (str): The stats/all/raw directory holding the raw career files.
+        records (list): Player records from fetch_player_career_stats()."""
+    bio_df = pd.DataFrame.from_records(
+        [record["bio"] for record in records],
+        index=[record["url"] for record in records],
+    )
+    append_raw_csv(bio_df, os.path.join(raw_dir, "raw_career_bio.csv"), True)
+
+    for kind, columns in [("bat", CAREER_BAT_COLUMNS), ("pitch", CAREER_PITCH_COLUMNS)]:
+        rows = []
+        for record in records:
+            for row in record[kind]:
+                if len(row) != len(columns):
+                    print(f"    Warning: Could not add stats for {record['name']}")
+                    continue
+                rows.append(row)
+        if len(rows) > 0:
+            append_raw_csv(
+                pd.DataFrame(rows, columns=columns),
+                os.path.join(raw_dir, "raw_career_" + kind + ".csv"),
+                False,
             )
-            print(f"\nTotal new players scraped: {players_scraped}\n")
-        else:
-            print("No players found.\n")
 
 
-def scrape_player_career_stats(
-    bio_df, bat_stat_df, pitch_stat_df, player_url, player_name
-):
-    """Scrapes career statistics from an individual NPB player page.
+def append_raw_csv(df, raw_path, index):
+    """Appends a DataFrame to a CSV file, writing the header if it is new.
+    Columns are aligned to the existing header. If the rows have columns the
+    header lacks, the file is rewritten with the union of both headers so the
+    new columns are kept (existing rows get blanks in them).
+
+    Parameters:
+        df (pandas.DataFrame): The rows to append.
+        raw_path (str): The CSV file path.
+        index (bool): Whether the index is written as the first column."""
+    if os.path.exists(raw_path) and os.path.getsize(raw_path) > 0:
+        index_col = 0 if index else None
+        header = pd.read_csv(raw_path, nrows=0, index_col=index_col)
+        new_cols = [col for col in df.columns if col not in header.columns]
+        if len(new_cols) == 0:
+            df = df.reindex(columns=header.columns)
+            df.to_csv(raw_path, mode="a", header=False, index=index)
+            return
+        print(f"    Adding columns {new_cols} to {raw_path}")
+        # Existing rows are read as text so they are written back unchanged
+        old_df = pd.read_csv(raw_path, index_col=index_col, dtype=str)
+        columns = header.columns.tolist() + new_cols
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(raw_path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as tmp_file:
+            old_df.reindex(columns=columns).to_csv(tmp_file, index=index)
+            df.reindex(columns=columns).to_csv(tmp_file, header=False, index=index)
+        os.replace(tmp_path, raw_path)
+    else:
+        df.to_csv(raw_path, index=index)
+
 
-    This function fetches the player's personal statistics page and extracts
-    their biographical information and career totals (batting and/or pitching)
-    by modifying the provided DataFrames in place.
+def compact_raw_career_data(raw_dir):
+    """Rewrites a raw career file without its replaced rows once they make up
+    more than CAREER_COMPACT_RATIO of the file.
+
+    Parameters:
+        raw_dir (str): The stats/all/raw directory holding the raw career files."""
+    for kind in ["bio", "bat", "pitch"]:
+        raw_path = os.path.join(raw_dir, "raw_career_" + kind + ".csv")
+        if not os.path.exists(raw_path):
+            continue
+        with open(raw_path, encoding="utf-8") as raw_file:
+            total_rows = sum(1 for _ in raw_file) - 1
+        current_df = read_raw_career_data(raw_dir, kind)
+        if total_rows - len(current_df.index) <= CAREER_COMPACT_RATIO * total_rows:
+            continue
+        print(f"Compacting raw_career_{kind}.csv...")
+        current_df.to_csv(raw_path + ".tmp", index=kind == "bio")
+        os.replace(raw_path + ".tmp", raw_path)
+
+
+def fetch_player_career_stats(player_url, player_name):
+    """Fetches and parses career statistics from an individual NPB player page
+    into a plain record. Safe to call from worker threads since nothing shared
+    is modified.
 
     Parameters:
-        bio_df (pandas.DataFrame): DataFrame to store player biographical
-            information. Player data is added as a new row indexed by player name.
-        bat_stat_df (pandas.DataFrame): DataFrame to store career batting statistics.
-            Each row represents one year of batting stats for a player.
-        pitch_stat_df (pandas.DataFrame): DataFrame to store career pitching statistics.
-            Each row represents one year of pitching stats for a player.
         player_url (str): The full URL to the player's individual statistics page.
-        player_name (str): The name of the player (used for indexing and error reporting).
+        player_name (str): The name of the player.
 
     Returns:
-        None: This function modifies the provided DataFrames in place and does
-            not return a value.
-
-    Side Effects:
-        - Modifies bio_df by adding player biographical data as a new row
-        - Modifies bat_stat_df by adding batting statistics (if player has batting data)
-        - Modifies pitch_stat_df by adding pitching statistics (if player has pitching data)
-    """
+        dict: The player record with keys "url", "name", "bio" (column: value),
+            "bat" and "pitch" (lists of stat rows), or None if scraping failed."""
     try:
         print(f"    Fetching stats from: {player_url}")
         r = get_url(player_url)
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = make_soup(r.content, "player_career")
+        r.close()
+        record = {"url": player_url, "name": player_name, "bio": {}}
 
         # Find player's bio statistics table rows
         for row in soup.find(id="pc_bio").find_all("tr"):
             # Add player's name and link to the row
-            bio_df.loc[player_url, "Player"] = player_name
+            record["bio"]["Player"] = player_name
             # th = dataframe column names
             for header_cell in row.find_all(["th"]):
                 # td = dataframe column values
                 for data_cell in row.find_all(["td"]):
-                    bio_df.loc[player_url, header_cell.get_text(strip=True)] = (
+                    record["bio"][header_cell.get_text(strip=True)] = (
                         data_cell.get_text(strip=True)
                     )
 
-        # Loop through dict of career stat table: relevant dataframe
+        # Loop through career stat table: record key
         stat_table_dict = {
-            soup.find(id="tablefix_b"): bat_stat_df,
-            soup.find(id="tablefix_p"): pitch_stat_df,
+            "bat": soup.find(id="tablefix_b"),
+            "pitch": soup.find(id="tablefix_p"),
         }
-        for table, df in stat_table_dict.items():
+        for key, table in stat_table_dict.items():
+            record[key] = []
             # Players may only have 1 of batting/pitching table, so check the table type
             if table is not None:
                 # Process rows containing career totals
@@ -4552,29 +6374,30 @@ def scrape_player_career_stats(
                         if cell.find(class_="table_inning"):
                             continue
                         temp_row.append(cell.get_text(strip=True))
-                    df.loc[len(df)] = temp_row
-
-        r.close()
+                    record[key].append(temp_row)
+        return record
     except Exception as e:
         print(f"    Error scraping {player_name}: {e}")
+        return None
 
 
-def get_cdx_rows(
-    url, session, from_year=None, to_year=None, limit=1000, timeout=(10, 60)
-):
-    """Search the Internet Archive for cached snapshots of a URL.
+def get_cdx_rows(url, from_year=None, to_year=None, limit=1000, timeout=(10, 60)):
+    """Search the Internet Archive for cached snapshots of a URL. Results are
+    cached in the HTTP cache's cdx/ directory until prune_http_cache() expires
+    them, since the snapshots of past years rarely change. Empty results are
+    not cached, so pages without snapshots yet are checked again
 
     Parameters:
         url (str): The original URL to search for archived snapshots.
-        session (requests.Session): A configured requests session.
         from_year (int, optional): Filter snapshots from this year.
         to_year (int, optional): Filter snapshots to this year.
         limit (int, optional): Maximum number of snapshots to retrieve (default 1000).
         timeout (tuple, optional): Request timeout as (connect timeout, read timeout).
 
     Returns:
-        list: A list of (score, row) tuples sorted by proximity to June 15th of from_year.
-              Higher scores indicate closer to mid-year.
+        list: A list of (score, row) tuples sorted by proximity to June 15th of
+            from_year, where score is the distance in days (lower is closer) and
+            row is a dict of the CDX fields (timestamp, original, etc.).
 
     Note:
         Uses the Internet Archive CDX API to find snapshots. The score is based on
@@ -4592,51 +6415,90 @@ def get_cdx_rows(
     if to_year:
         params["to"] = str(to_year)
 
-    # TODO : DEBUG
-    # TODO: around this area, remove unused functions
-    print(params)
-
-    r = session.get(
-        "https://web.archive.org/cdx/search/cdx",
-        params=params,
-        timeout=timeout,
+    cache_path = os.path.join(
+        HTTP_CACHE["dir"],
+        "cdx",
+        get_archive_name(WAYBACK_CDX_URL, params) + ".json",
     )
-    r.raise_for_status()
+    cdx_table = None
+    if HTTP_CACHE["enabled"] is True and os.path.exists(cache_path):
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cdx_table = json.load(cache_file)
+    if cdx_table is None:
+        r = get_url(WAYBACK_CDX_URL, params=params, timeout=timeout)
+        # An empty result is an empty body instead of an empty JSON list
+        cdx_table = r.json() if r.text.strip() else []
+        r.close()
+        if HTTP_CACHE["enabled"] is True and len(cdx_table) > 0:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path), suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                json.dump(cdx_table, cache_file)
+            os.replace(tmp_path, cache_path)
 
     candidates = []
-    # Choose the 2 snapshots closest to the middle of the year
-    for row in r.json():
-        score = 0
-        # score += date_proximity_score(row["timestamp"], target_date)
-        delta = datetime.strptime(row["timestamp"], "%Y%b%d") - datetime.strptime(
-            (str(from_year) + "0615"), "%Y%b%d"
-        )
-        score += delta.days
-        candidates.append((score, row))
-    candidates.sort(reverse=True)
+    if len(cdx_table) == 0:
+        return candidates
+    # The first JSON row holds the field names
+    fields = cdx_table[0]
+    target_date = datetime(int(from_year or datetime.now().year), 6, 15)
+    for cdx_row in cdx_table[1:]:
+        row = dict(zip(fields, cdx_row))
+        delta = datetime.strptime(row["timestamp"], "%Y%m%d%H%M%S") - target_date
+        candidates.append((abs(delta.days), row))
+    # Snapshots closest to the middle of the year first
+    candidates.sort(key=lambda candidate: candidate[0])
 
     return candidates
 
 
-def fetch_archived_html(original_url, session, timestamp, timeout=(10, 45)):
+def fetch_archived_html(original_url, timestamp, timeout=(10, 45)):
     """Fetch an archived HTML page from the Internet Archive.
 
     Parameters:
         original_url (str): The original URL that was archived.
-        session (requests.Session): A configured requests session.
         timestamp (str): The archive.org timestamp (e.g., "20240615000000").
         timeout (tuple, optional): Request timeout as (connect timeout, read timeout).
 
     Returns:
-        str: The HTML content of the archived page.
+        bytes: The HTML content of the archived page, None if the request failed.
 
     Note:
         Uses the Wayback Machine's "id_" variant which redirects to the closest
         available snapshot if the exact timestamp doesn't exist."""
     archive_url = f"https://web.archive.org/web/{timestamp}id_/{original_url}"
-    r = session.get(archive_url, timeout=timeout)
-    r.raise_for_status()
-    return r.text
+    try:
+        r = get_url(archive_url, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        print(f"Failed to fetch {archive_url}: {e}")
+        return None
+    content = r.content
+    r.close()
+    return content
+
+
+def get_roster_snapshot(url, year):
+    """Finds the archived snapshot of a roster page closest to the middle of
+    the season
+
+    Parameters:
+        url (str): The original npb.jp roster page URL.
+        year (str): The season year.
+
+    Returns:
+        str: The snapshot's archive.org timestamp, None if the page has no
+            snapshot that year or the CDX lookup failed."""
+    try:
+        candidates = get_cdx_rows(url, from_year=int(year), to_year=int(year))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"CDX lookup failed for {url} ({year}): {e}")
+        return None
+    if len(candidates) == 0:
+        print(f"No {year} snapshot of {url}")
+        return None
+    return candidates[0][1]["timestamp"]
 
 
 def get_roster_data(year_dir, suffix, year):
@@ -4645,7 +6507,8 @@ def get_roster_data(year_dir, suffix, year):
     This function scrapes player roster pages from the NPB website for all teams,
     extracting player names, their personal page links, and team affiliations.
     The data is written to a CSV file for later use in creating player profile links
-    and gathering additional player statistics.
+    and gathering additional player statistics. The roster pages only show the
+    current season, use backfill_roster_data() for past seasons.
 
     Parameters:
         year_dir (str): The directory path where year-specific statistics are stored.
@@ -4661,160 +6524,122 @@ def get_roster_data(year_dir, suffix, year):
         >>> get_roster_data("/path/to/stats/2025", "en", "2025")
         >>> # Creates file at: /path/to/stats/2025/raw/2025raw_roster_data_en.csv
     """
-    if suffix == "en":
-        roster_url_dict = {
-            "https://npb.jp/bis/eng/teams/rst_t.html": "Hanshin Tigers",
-            "https://npb.jp/bis/eng/teams/rst_c.html": "Hiroshima Carp",
-            "https://npb.jp/bis/eng/teams/rst_db.html": "DeNA BayStars",
-            "https://npb.jp/bis/eng/teams/rst_g.html": "Yomiuri Giants",
-            "https://npb.jp/bis/eng/teams/rst_s.html": "Yakult Swallows",
-            "https://npb.jp/bis/eng/teams/rst_d.html": "Chunichi Dragons",
-            "https://npb.jp/bis/eng/teams/rst_b.html": "ORIX Buffaloes",
-            "https://npb.jp/bis/eng/teams/rst_m.html": "Lotte Marines",
-            "https://npb.jp/bis/eng/teams/rst_h.html": "SoftBank Hawks",
-            "https://npb.jp/bis/eng/teams/rst_e.html": "Rakuten Eagles",
-            "https://npb.jp/bis/eng/teams/rst_l.html": "Seibu Lions",
-            "https://npb.jp/bis/eng/teams/rst_f.html": "Nipponham Fighters",
-        }
-    elif suffix == "jp":
-        roster_url_dict = {
-            "https://npb.jp/bis/teams/rst_t.html": "Hanshin Tigers",
-            "https://npb.jp/bis/teams/rst_c.html": "Hiroshima Carp",
-            "https://npb.jp/bis/teams/rst_db.html": "DeNA BayStars",
-            "https://npb.jp/bis/teams/rst_g.html": "Yomiuri Giants",
-            "https://npb.jp/bis/teams/rst_s.html": "Yakult Swallows",
-            "https://npb.jp/bis/teams/rst_d.html": "Chunichi Dragons",
-            "https://npb.jp/bis/teams/rst_b.html": "ORIX Buffaloes",
-            "https://npb.jp/bis/teams/rst_m.html": "Lotte Marines",
-            "https://npb.jp/bis/teams/rst_h.html": "SoftBank Hawks",
-            "https://npb.jp/bis/teams/rst_e.html": "Rakuten Eagles",
-            "https://npb.jp/bis/teams/rst_l.html": "Seibu Lions",
-            "https://npb.jp/bis/teams/rst_f.html": "Nipponham Fighters",
-        }
-    else:
-        roster_url_dict = {}
+    roster_url_dict = ROSTER_URLS.get(suffix, {})
+    # Fetch every team's roster at once over the pooled npb.jp session
+    responses = fetch_pages(roster_url_dict.keys(), timeout=(10, 45))
+    team_pages = []
+    for team, r in zip(roster_url_dict.values(), responses):
+        team_pages.append((team, r.content))
+        r.close()
+    write_raw_roster_data(year_dir, suffix, year, team_pages)
 
-    # TODO: make this function so this only scrapes current year, and skips automatically otherwise
-    # might be bad idea to post wayback machine links in an input file for github
-    # TODO: remove unused wayback machine functions, integrate wayback machine scraping
-    """
-    # if current year doesnt equal inputted year, scrape wayback
-    s = make_session()
-    for url, _ in roster_url_dict.items():
-        #print(url)
-        best_archive_links = get_cdx_rows(url, s, from_year=int(year), to_year=(int(year)+1), limit=100, timeout=(10, 60))
-        #print(get_cdx_rows(url, s, from_year=int(year), to_year=(int(year)+1), limit=100, timeout=(10, 60)))
-        sleep(1.0)
-
-    for score, row in best_archive_links[:2]:
-        print(str(row["original"])+ str(row["timestamp"]))
-        #html = fetch_archived_html(row["original"], s, row["timestamp"])
-    """
 
-    """
-    if suffix == "en":
-        # TODO: 2023 and before (just change the first 4 digits in the timestamp part of each url)
-        roster_url_dict = {
-            # Hanshin Tigers
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_t.html": "Hanshin Tigers",
-            # Hiroshima Toyo Carp
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_c.html": "Hiroshima Carp",
-            # YOKOHAMA DeNA BAYSTARS
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_db.html": "DeNA BayStars",
-            # Yomiuri Giants
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_g.html": "Yomiuri Giants",
-            # Tokyo Yakult Swallows
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_s.html": "Yakult Swallows",
-            # Chunichi Dragons
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_d.html": "Chunichi Dragons",
-            # ORIX Buffaloes
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_b.html": "ORIX Buffaloes",
-            # China Lotte Marines
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_m.html": "Lotte Marines",
-            # Fukuoka SoftBank Hawks
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_h.html": "SoftBank Hawks",
-            # Tohoku Rakuten Golden Eagles
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_e.html": "Rakuten Eagles",
-            # Saitama Seibu Lions
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_l.html": "Seibu Lions",
-            # Hokkaido Nippon-Ham Fighters
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/eng/teams/rst_f.html": "Nipponham Fighters",
-        }
-    elif suffix == "jp":
-        roster_url_dict = {
-            # Hanshin Tigers
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_t.html": "Hanshin Tigers",
-            # Hiroshima Toyo Carp
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_c.html": "Hiroshima Carp",
-            # YOKOHAMA DeNA BAYSTARS
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_db.html": "DeNA BayStars",
-            # Yomiuri Giants
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_g.html": "Yomiuri Giants",
-            # Tokyo Yakult Swallows
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_s.html": "Yakult Swallows",
-            # Chunichi Dragons
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_d.html": "Chunichi Dragons",
-            # ORIX Buffaloes
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_b.html": "ORIX Buffaloes",
-            # China Lotte Marines
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_m.html": "Lotte Marines",
-            # Fukuoka SoftBank Hawks
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_h.html": "SoftBank Hawks",
-            # Tohoku Rakuten Golden Eagles
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_e.html": "Rakuten Eagles",
-            # Saitama Seibu Lions
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_l.html": "Seibu Lions",
-            # Hokkaido Nippon-Ham Fighters
-            "https://web.archive.org/web/20160702010731id_/https://npb.jp/bis/teams/rst_f.html": "Nipponham Fighters",
-        }
-    else:
-        roster_url_dict = {}
-    """
+def write_raw_roster_data(year_dir, suffix, year, team_pages):
+    """Parses team roster pages into a raw roster data file
 
+    Parameters:
+        year_dir (str): The directory path where year-specific statistics are stored.
+        suffix (str): Language suffix of the roster pages ("en" or "jp").
+        year (str): The NPB season year of the rosters.
+        team_pages (list): (team name, roster page body) tuples."""
     output_file = make_raw_roster_data_file(year_dir, suffix, year)
 
-    # Loop through all roster URLs passed in
-    for url, team in roster_url_dict.items():
-        # Make GET request
-        # r = get_url(url)
-        # TODO: debug, making session to connect
-        s = make_session()
-        print("Current team: " + team + " - Connecting to: " + url)
-        r = s.get(url, timeout=(10, 45))
-        r.raise_for_status()
-        # r = session_r.text
-
+    for team, content in team_pages:
+        print("Current team: " + team)
         # Create the soup for parsing the html content
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = make_soup(content, "roster")
 
         # Grab all player name table entries
         player_tr = soup.find_all("tr", {"class": ["rosterPlayer", "rosterRetire"]})
         # Loop through and grab player names + links
         for tr in player_tr:
+            row = []
             for td in tr:
                 entry_text = td.get_text()
                 if entry_text.find(","):
                     entry_text = entry_text.replace(",", "")
+                row.append(entry_text)
                 # If there is an <a> tag, there is a link to scrape
                 if td.a is not None:
-                    # Write name in csv file format
-                    output_file.write(entry_text + ",")
-                    # Get URL associated with player
-                    href = td.a.get("href")
-                    # Write full URL in csv file format
-                    output_file.write("https://npb.jp" + href + ",")
-                else:
-                    output_file.write(entry_text + ",")
-                    continue
+                    # Add full URL associated with player after the name
+                    row.append("https://npb.jp" + td.a.get("href"))
             # Add team name then move to next row
-            output_file.write(team)
-            output_file.write("\n")
+            row.append(team)
+            output_file.write_row(row)
+
+    # After every team is scraped, commit the output file
+    output_file.close()
+
+
+def backfill_roster_data(rel_dir, years):
+    """Rebuilds input/[year]/roster_data.csv for past seasons from Wayback
+    Machine snapshots of the npb.jp roster pages. The CDX lookups for every
+    EN/JP roster page and year run concurrently, then the mid-season snapshots
+    are fetched concurrently, all paced by HOST_SCHEDULER
+
+    Parameters:
+        rel_dir (str): The relative directory path to the project root.
+        years (list): The season years (strings) to backfill."""
+    jobs = []
+    for year in years:
+        for suffix, roster_url_dict in ROSTER_URLS.items():
+            for url, team in roster_url_dict.items():
+                jobs.append((year, suffix, url, team))
+    workers = HOST_SCHEDULER.concurrency(WAYBACK_CDX_URL)
+
+    print(f"Finding mid-season roster snapshots for {len(jobs)} pages...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        timestamps = list(
+            pool.map(
+                get_roster_snapshot,
+                [job[2] for job in jobs],
+                [job[0] for job in jobs],
+            )
+        )
+    print("Fetching archived roster pages...")
+    snapshots = [
+        (job[2], timestamp)
+        for job, timestamp in zip(jobs, timestamps)
+        if timestamp is not None
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        snapshot_contents = dict(
+            zip(
+                snapshots,
+                pool.map(
+                    fetch_archived_html,
+                    [snapshot[0] for snapshot in snapshots],
+                    [snapshot[1] for snapshot in snapshots],
+                ),
+            )
+        )
+    contents = [
+        snapshot_contents.get((job[2], timestamp))
+        for job, timestamp in zip(jobs, timestamps)
+    ]
 
-        # TODO: debug
-        # r.close()
-        # Pace requests to npb.jp to avoid excessive requests
-        # sleep(randint(3, 5))
-        sleep(10.0)
+    stats_dir = os.path.join(rel_dir, "stats")
+    for year in years:
+        year_jobs = [
+            (job, content) for job, content in zip(jobs, contents) if job[0] == year
+        ]
+        missing = [job for job, content in year_jobs if content is None]
+        # A partial roster would drop whole teams from roster_data.csv
+        if len(missing) > 0:
+            for job in missing:
+                print(f"WARNING: no {year} {job[1]} roster for {job[3]}")
+            print(f"Keeping the existing {year} roster_data.csv.")
+            continue
+        year_dir = os.path.join(stats_dir, year)
+        os.makedirs(year_dir, exist_ok=True)
+        os.makedirs(os.path.join(rel_dir, "input", year), exist_ok=True)
+        for suffix in ROSTER_URLS:
+            team_pages = [
+                (job[3], content) for job, content in year_jobs if job[1] == suffix
+            ]
+            write_raw_roster_data(year_dir, suffix, year, team_pages)
+        org_roster_data(year_dir, rel_dir, year)
+        print(f"{year} roster_data.csv backfilled.")
 
 
 # TODO: fuzzy translate remaining untranslated players with no rosters (oisix and hayate)?
@@ -4916,13 +6741,8 @@ def get_stat_urls(suffix, year):
         >>> # Returns URLs for 2025 regular season batting stats
         >>> # and the table version to use for scraping
     """
-    rel_dir = os.path.dirname(__file__)
-    url_file = rel_dir + "/input/npb_urls.csv"
-    url_df = pd.read_csv(url_file)
-
-    # Drop all rows that are not the df's suffix or year
-    url_df = url_df.drop(url_df[url_df.Year.astype(str) != year].index)
-    url_df = url_df.drop(url_df[url_df.Suffix != suffix].index)
+    # Only keep the rows of the df's suffix and year
+    url_df = select_input_rows("npb_urls.csv", ["Year", "Suffix"], (year, suffix))
     # Create URL arr for that year and stat type
     url_arr = url_df["Link"]
     # Version determines the type of table to scrape
@@ -4932,6 +6752,266 @@ def get_stat_urls(suffix, year):
     return url_arr, version
 
 
+class InputStore:
+    """Process-level cache of the csv files in input/. Each file is read once
+    and reread only when its modification time or size changes, and lookups
+    built from a file (dicts keyed by (Player, Team), (Year, League), etc.)
+    are cached alongside it and dropped with it
+
+    Tables are copied on every table() call, indexes are shared and must not
+    be modified by callers"""
+
+    def __init__(self, input_dir):
+        """Parameters:
+        input_dir (string): The input/ directory the relative paths are under"""
+        self.input_dir = input_dir
+        self.lock = threading.Lock()
+        self.files = {}
+
+    def get_file(self, rel_path, dtype=None):
+        """Returns the cache entry of an input file, rereading it if it changed
+
+        Parameters:
+        rel_path (string): The file's path relative to input/ (or absolute)
+        dtype (type): Passed to pd.read_csv(), cached separately
+
+        Returns:
+        entry (dict): The file's stamp, table and indexes"""
+        path = os.path.join(self.input_dir, rel_path)
+        file_stat = os.stat(path)
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        key = (rel_path, dtype)
+        with self.lock:
+            entry = self.files.get(key)
+            if entry is None or entry["stamp"] != stamp:
+                entry = {
+                    "stamp": stamp,
+                    "df": pd.read_csv(path, dtype=dtype),
+                    "indexes": {},
+                }
+                self.files[key] = entry
+            return entry
+
+    def table(self, rel_path, dtype=None):
+        """Returns a copy of an input file's table
+
+        Parameters:
+        rel_path (string): The file's path relative to input/
+        dtype (type): Passed to pd.read_csv()
+
+        Returns:
+        df (pandas dataframe): The file's contents"""
+        return self.get_file(rel_path, dtype)["df"].copy()
+
+    def index(self, rel_path, name, build, dtype=None):
+        """Returns a lookup built from an input file, building it on first use
+        and again whenever the file changes
+
+        Parameters:
+        rel_path (string): The file's path relative to input/
+        name (string): The lookup's name, unique per file
+        build (function): Builds the lookup from the file's table (which it
+        must not modify)
+        dtype (type): Passed to pd.read_csv()
+
+        Returns:
+        index (object): The lookup returned by build()"""
+        entry = self.get_file(rel_path, dtype)
+        with self.lock:
+            if name not in entry["indexes"]:
+                entry["indexes"][name] = build(entry["df"])
+            return entry["indexes"][name]
+
+
+# The input/ files read while organizing (see InputStore)
+INPUT_STORE = InputStore(os.path.join(os.path.dirname(__file__), "input"))
+
+
+def group_input_rows(df, key_cols):
+    """Splits an input table into its rows per key, for InputStore indexes
+
+    Parameters:
+    df (pandas dataframe): The input file's table
+    key_cols (list): The columns making up the key (e.g. ["Year", "League"])
+
+    Returns:
+    groups (dict): Key tuple of strings: the rows with that key, in file order"""
+    keys = [df[col].astype(str) for col in key_cols]
+    return dict(iter(df.groupby(keys, sort=False)))
+
+
+def select_input_rows(rel_path, key_cols, key):
+    """Returns the rows of an input file matching a key (see group_input_rows())
+
+    Parameters:
+    rel_path (string): The file's path relative to input/
+    key_cols (list): The columns making up the key
+    key (tuple): The key's values as strings
+
+    Returns:
+    rows (pandas dataframe): The matching rows, empty if there are none"""
+    groups = INPUT_STORE.index(
+        rel_path,
+        "rows_by_" + "_".join(key_cols),
+        lambda df: group_input_rows(df, key_cols),
+    )
+    if key in groups:
+        return groups[key]
+    return INPUT_STORE.index(rel_path, "empty", lambda df: df.iloc[0:0])
+
+
+class RawTableWriter:
+    """Buffers a Raw csv file in memory and only replaces the file on disk
+    when the whole table is committed. The table is written to a temp file
+    that is renamed over the old Raw file, so a failed scrape leaves the
+    previous Raw file intact instead of a truncated one. Every commit records
+    the file's row count and hash in the directory's raw_manifest.json
+
+    Used as a context manager, the table is committed on a clean exit and
+    discarded if an exception is raised
+
+    Attributes:
+        path (str): The Raw file's path.
+        trailing_field (bool): True if every row ends with an empty field
+            (the "entry," format older Raw files are read with).
+        rows (int): The number of data rows written so far."""
+
+    def __init__(self, path, trailing_field=False):
+        self.path = path
+        self.trailing_field = trailing_field
+        self.rows = 0
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, lineterminator="\n")
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+        return False
+
+    def write_header(self, header):
+        """Writes the header row (list of column names)"""
+        self.writer.writerow(header + [""] if self.trailing_field else header)
+
+    def write_row(self, row):
+        """Writes one data row (list of entries)"""
+        self.writer.writerow(row + [""] if self.trailing_field else row)
+        self.rows += 1
+
+    def write_frame(self, df):
+        """Writes a DataFrame, header included. "Unnamed: " columns (see
+        make_raw_frame()) get blank names again"""
+        header = ["" if str(col).startswith("Unnamed: ") else col for col in df.columns]
+        df.to_csv(self.buffer, index=False, header=header, lineterminator="\n")
+        self.rows += len(df.index)
+
+    def write(self, text):
+        """Writes csv text, header included, as is"""
+        self.buffer.write(text)
+        self.rows += max(len(text.splitlines()) - 1, 0)
+
+    def close(self):
+        """Commits the table to the Raw file and records it in the manifest"""
+        if self.closed is True:
+            return
+        self.closed = True
+        content = self.buffer.getvalue().encode("utf-8")
+        with open(self.path + ".tmp", "wb") as tmp_file:
+            tmp_file.write(content)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(self.path + ".tmp", self.path)
+        update_raw_manifest(
+            self.path,
+            {
+                "rows": self.rows,
+                "sha256": hashlib.sha256(content).hexdigest(),
+                "written": datetime.now().isoformat(timespec="seconds"),
+            },
+        )
+
+    def discard(self):
+        """Drops the buffered table, leaving the Raw file untouched"""
+        if self.closed is True:
+            return
+        self.closed = True
+        print("Scrape failed, keeping previous Raw file: " + self.path)
+
+
+def save_raw_table(output_file):
+    """Commits a filled RawTableWriter, on the background Raw writer thread
+    if RAW_OUTPUT["background"] is True (see flush_raw_writes())
+
+    Parameters:
+    output_file (RawTableWriter): The Raw file's writer"""
+    if RAW_OUTPUT["background"] is True:
+        RAW_WRITES.append(RAW_WRITE_POOL.submit(output_file.close))
+    else:
+        output_file.close()
+
+
+def flush_raw_writes():
+    """Waits for every background Raw file write to finish, reporting the ones
+    that failed"""
+    for future in RAW_WRITES:
+        try:
+            future.result()
+        except Exception as e:
+            print("ERROR: could not save Raw file: " + repr(e))
+    RAW_WRITES.clear()
+
+
+def update_raw_manifest(raw_path, entry):
+    """Stores a Raw file's entry in the raw_manifest.json next to it
+
+    Parameters:
+    raw_path (string): The Raw file's path
+    entry (dict): The file's row count, hash and write time"""
+    manifest_path = os.path.join(os.path.dirname(raw_path), RAW_MANIFEST_NAME)
+    with RAW_MANIFEST_LOCK:
+        manifest = read_raw_manifest(manifest_path)
+        manifest[os.path.basename(raw_path)] = entry
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+        os.replace(manifest_path + ".tmp", manifest_path)
+
+
+def read_raw_manifest(manifest_path):
+    """Reads a raw_manifest.json, returning an empty manifest if it is missing
+    or unreadable"""
+    try:
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_raw_file_complete(raw_path):
+    """Checks that a Raw file exists and matches the hash recorded when it was
+    written. Files written before the manifest existed are trusted as is
+
+    Parameters:
+    raw_path (string): The Raw file's path
+
+    Returns:
+    complete (bool): False if the file is missing or does not match"""
+    if not os.path.exists(raw_path):
+        return False
+    manifest = read_raw_manifest(
+        os.path.join(os.path.dirname(raw_path), RAW_MANIFEST_NAME)
+    )
+    entry = manifest.get(os.path.basename(raw_path))
+    if entry is None:
+        return True
+    with open(raw_path, "rb") as raw_file:
+        return hashlib.sha256(raw_file.read()).hexdigest() == entry["sha256"]
+
+
 def make_raw_roster_data_file(year_dir, suffix, year):
     """Creates and opens a file to store raw roster data for NPB players.
 
@@ -4949,7 +7029,7 @@ def make_raw_roster_data_file(year_dir, suffix, year):
         year (str): The NPB season year for which roster data is being scraped.
 
     Returns:
-        file stream object: An opened file object in write mode for the raw roster data.
+        RawTableWriter: The raw roster data writer, with the header row written.
 
     Example:
         >>> file = make_raw_roster_data_file("/path/to/stats/2025", "en", "2025")
@@ -4957,13 +7037,13 @@ def make_raw_roster_data_file(year_dir, suffix, year):
     """
     raw_dir = os.path.join(year_dir, "raw")
     # TODO: make sure all make_raw_X() have this check
-    if not os.path.exists(raw_dir):
-        os.makedirs(raw_dir)
+    os.makedirs(raw_dir, exist_ok=True)
     raw_csv_name = raw_dir + "/" + year + "raw_roster_data_" + suffix + ".csv"
     print("Player URLs scraped in this session will be stored in: " + raw_csv_name)
-    raw_roster_data_file = open(raw_csv_name, mode="w", encoding="utf-8")
-    raw_roster_data_file.write(
-        "PlayerNum," + suffix + "Player,Link,BirthDate,Height,Weight,T,B,Note,Team\n"
+    raw_roster_data_file = RawTableWriter(raw_csv_name)
+    raw_roster_data_file.write_header(
+        ["PlayerNum", suffix + "Player", "Link", "BirthDate", "Height"]
+        + ["Weight", "T", "B", "Note", "Team"]
     )
     return raw_roster_data_file
 
@@ -4988,7 +7068,7 @@ def make_raw_player_file(write_dir, suffix, year):
         year (str): The NPB season year for which statistics are being scraped.
 
     Returns:
-        file stream object: An opened file object in write mode for the raw statistics.
+        RawTableWriter: The raw statistics writer (rows end with an empty field).
 
     Example:
         >>> file = make_raw_player_file("/path/to/stats/2025", "BR", "2025")
@@ -4996,8 +7076,7 @@ def make_raw_player_file(write_dir, suffix, year):
     """
     # Open and return the file object in write mode
     raw_dir = os.path.join(write_dir, "raw")
-    if not os.path.exists(raw_dir):
-        os.mkdir(raw_dir)
+    os.makedirs(raw_dir, exist_ok=True)
     new_csv_name = raw_dir + "/" + year + "StatsRaw" + suffix + ".csv"
     if suffix == "BR":
         print("Raw regular season batting results will be stored in: " + new_csv_name)
@@ -5011,7 +7090,7 @@ def make_raw_player_file(write_dir, suffix, year):
         print("Raw post season batting results will be stored in: " + new_csv_name)
     if suffix == "PP":
         print("Raw post season pitching results will be stored in: " + new_csv_name)
-    new_file = open(new_csv_name, "w", encoding="utf-8")
+    new_file = RawTableWriter(new_csv_name, trailing_field=True)
     return new_file
 
 
@@ -5024,15 +7103,14 @@ def make_raw_daily_scores_file(write_dir, suffix, year):
     year (string): The desired npb year to scrape
 
     Returns:
-    new_file (file stream object): An opened file in /year/raw/ named
+    new_file (RawTableWriter): The writer of the file in /year/raw/ named
     "[Year]DailyScoresRaw[Suffix].csv"""
-    # Open and return the file object in write mode
+    # Create and return the file's writer
     raw_dir = os.path.join(write_dir, "raw")
-    if not os.path.exists(raw_dir):
-        os.mkdir(raw_dir)
+    os.makedirs(raw_dir, exist_ok=True)
     new_csv_name = raw_dir + "/" + year + "DailyScoresRaw" + suffix + ".csv"
     print("Raw daily scores will be stored in: " + new_csv_name)
-    new_file = open(new_csv_name, "w", encoding="utf-8")
+    new_file = RawTableWriter(new_csv_name)
     return new_file
 
 
@@ -5050,12 +7128,11 @@ def make_raw_standings_file(write_dir, suffix, year):
     year (string): The desired npb year to scrape
 
     Returns:
-    new_file (file stream object): An opened file in /year/raw/ formatted as
-    "[Year][Standings][Suffix].csv"""
-    # Open and return the file object in write mode
+    new_file (RawTableWriter): The writer (rows end with an empty field) of
+    the file in /year/raw/ formatted as "[Year][Standings][Suffix].csv"""
+    # Create and return the file's writer
     raw_dir = os.path.join(write_dir, "raw")
-    if not os.path.exists(raw_dir):
-        os.mkdir(raw_dir)
+    os.makedirs(raw_dir, exist_ok=True)
     new_csv_name = raw_dir + "/" + year + "StandingsRaw" + suffix + ".csv"
     if suffix == "C":
         print(
@@ -5071,7 +7148,7 @@ def make_raw_standings_file(write_dir, suffix, year):
         print("Raw Eastern League farm standings will be stored in: " + new_csv_name)
     elif suffix == "W":
         print("Raw Western League farm standings will be stored in: " + new_csv_name)
-    new_file = open(new_csv_name, "w", encoding="utf-8")
+    new_file = RawTableWriter(new_csv_name, trailing_field=True)
     return new_file
 
 
@@ -5087,19 +7164,18 @@ def make_raw_fielding_file(write_dir, suffix, year):
     year (string): The desired npb year to scrape
 
     Return:
-    new_file (file stream object): An opened file in /year/raw/ named
-    "[Year]FieldingRaw[Suffix].csv"
+    new_file (RawTableWriter): The writer (rows end with an empty field) of
+    the file in /year/raw/ named "[Year]FieldingRaw[Suffix].csv"
     """
-    # Open and return the file object in write mode
+    # Create and return the file's writer
     raw_dir = os.path.join(write_dir, "raw")
-    if not os.path.exists(raw_dir):
-        os.mkdir(raw_dir)
+    os.makedirs(raw_dir, exist_ok=True)
     new_csv_name = raw_dir + "/" + year + "FieldingRaw" + suffix + ".csv"
     if suffix == "R":
         print("Raw regular season fielding results will be stored in: " + new_csv_name)
     if suffix == "F":
         print("Raw farm fielding results will be stored in: " + new_csv_name)
-    new_file = open(new_csv_name, "w", encoding="utf-8")
+    new_file = RawTableWriter(new_csv_name, trailing_field=True)
     return new_file
 
 
@@ -5233,18 +7309,15 @@ def convert_team_to_html(df, year, mode=None):
     df (pandas dataframe): The dataframe with correct links and abbreviations
     inserted in tags (if applicable) or normal text (if no tags can be made),
     plus an img tag column if mode is not None"""
-    # Check for the team link file, if missing, tell user and return
-    rel_dir = os.path.dirname(__file__)
-    link_df = pd.read_csv(rel_dir + "/input/team_urls.csv")
+    team_links = INPUT_STORE.index("team_urls.csv", "team_links", index_team_links)
+    # Create dict of Team Name:<img> tag
+    img_dict = team_links["img"]
 
     # Default mode links any team names it finds (assumes full team names are
     # present in the dataframe) and returns
     if mode is None:
-        link_df["Link"] = link_df.apply(build_html, args=("Team",), axis=1)
-        # Create dict of Team Name:<img> tag
-        img_dict = dict(zip(link_df["Team"], link_df["ImgSrc"]))
         # Create dict of Team Name:Complete HTML tag
-        team_dict = dict(zip(link_df["Team"], link_df["Link"]))
+        team_dict = team_links["Team"]
         for col in df.columns:
             # Insert img tag column before converting team names to <a> tags
             df.insert(
@@ -5258,17 +7331,12 @@ def convert_team_to_html(df, year, mode=None):
             df[col] = df[col].map(team_dict).infer_objects().fillna(df[col]).astype(str)
         return df
     if mode == "Full":
-        # Update Link col to have <a> tags
-        link_df["Link"] = link_df.apply(build_html, args=("Team",), axis=1)
         # Create dict of Team Name:Complete HTML tag
-        team_dict = dict(zip(link_df["Team"], link_df["Link"]))
+        team_dict = team_links["Team"]
     elif mode == "Abb":
-        # Make HTML Link col using abbreviated names
-        link_df["Link"] = link_df.apply(build_html, args=("Abbr",), axis=1)
-        # Create dict of Team Name:Complete HTML tag
-        team_dict = dict(zip(link_df["Team"], link_df["Link"]))
+        # Create dict of Team Name:HTML tag using abbreviated names
+        team_dict = team_links["Abbr"]
     # Add logo/color <img> tag column before converting team names to <a> tags
-    img_dict = dict(zip(link_df["Team"], link_df["ImgSrc"]))
     df.insert(
         df.columns.get_loc("Team"),
         "Logos",
@@ -5283,6 +7351,22 @@ def convert_team_to_html(df, year, mode=None):
     return df
 
 
+def index_team_links(link_df):
+    """Builds the team name lookups used by convert_team_to_html()
+
+    Parameters:
+    link_df (pandas dataframe): The team_urls.csv table
+
+    Returns:
+    team_links (dict): "img" maps team names to their <img> tags, "Team" and
+    "Abbr" map them to <a> tags showing the full or abbreviated name"""
+    team_links = {"img": dict(zip(link_df["Team"], link_df["ImgSrc"]))}
+    for name_col in ("Team", "Abbr"):
+        html_links = link_df.apply(build_html, args=(name_col,), axis=1)
+        team_links[name_col] = dict(zip(link_df["Team"], html_links))
+    return team_links
+
+
 def add_roster_data(df, suffix, year):
     """Adds player age and throwing/batting arm data to the dataframe
 
@@ -5297,36 +7381,28 @@ def add_roster_data(df, suffix, year):
     Returns:
     df (pandas dataframe): The inputted dataframe with the appended throwing
     arms and ages"""
-    rel_dir = os.path.dirname(__file__)
-    roster_data_file = rel_dir + "/input/" + year + "/roster_data.csv"
-
-    # Player throwing/batting arms
-    roster_df = pd.read_csv(roster_data_file)
+    # Dicts of Player Name,Team:T/B arm tag and Player Name,Team:Age tag
+    roster_dicts = INPUT_STORE.index(
+        os.path.join(year, "roster_data.csv"),
+        "arms_age",
+        lambda roster_df: index_roster_data(roster_df, year),
+    )
     convert_col = df.iloc[:, 0].name
     tb_col = ""
+    # Player throwing/batting arms
     if suffix in ("BR", "BF", "PR", "PF"):
         if suffix in ("PR", "PF"):
             tb_col = "T"
         elif suffix in ("BR", "BF"):
             tb_col = "B"
-        # Create dict of Player Name,Team:T/B arm tag
-        player_arm_dict = dict(
-            zip((zip(roster_df["Player"], roster_df["Team"])), roster_df[tb_col])
-        )
+        player_arm_dict = roster_dicts[tb_col]
         df["keys"] = list(zip(df[convert_col], df["Team"]))
         df[tb_col] = (
             df["keys"].map(player_arm_dict).infer_objects().fillna("").astype(str)
         )
 
     # Player age
-    roster_df["BirthDate"] = pd.to_datetime(roster_df["BirthDate"], format="mixed")
-    roster_df["Age"] = roster_df["BirthDate"].apply(
-        calculate_npb_age, args=(int(year),)
-    )
-    # Create dict of Player Name,Team:Age tag
-    player_age_dict = dict(
-        zip((zip(roster_df["Player"], roster_df["Team"])), roster_df["Age"])
-    )
+    player_age_dict = roster_dicts["Age"]
     df["keys"] = list(zip(df[convert_col], df["Team"]))
     df["Age"] = df["keys"].map(player_age_dict).infer_objects().fillna("").astype(str)
     # Remove trailing zeroes from age
@@ -5337,6 +7413,26 @@ def add_roster_data(df, suffix, year):
     return df
 
 
+def index_roster_data(roster_df, year):
+    """Builds the roster lookups used by add_roster_data()
+
+    Parameters:
+    roster_df (pandas dataframe): A year's roster_data.csv table
+    year (string): The roster's year, ages are as of that season
+
+    Returns:
+    roster_dicts (dict): "T", "B" and "Age" each map (Player, Team) to the
+    player's throwing arm, batting arm and NPB age"""
+    player_keys = list(zip(roster_df["Player"], roster_df["Team"]))
+    birth_dates = pd.to_datetime(roster_df["BirthDate"], format="mixed")
+    ages = birth_dates.apply(calculate_npb_age, args=(int(year),))
+    return {
+        "T": dict(zip(player_keys, roster_df["T"])),
+        "B": dict(zip(player_keys, roster_df["B"])),
+        "Age": dict(zip(player_keys, ages)),
+    }
+
+
 def calculate_npb_age(birthdate, year):
     """Calculates the age of a player based on their birthdate according to
     the standard for NPB (June 30th)
@@ -5443,32 +7539,49 @@ def select_park_factor(df, suffix, year):
     Returns:
     df (pandas dataframe): The pandas dataframe with the new temp park factor
     column"""
-    # Check for the park factor file, if nothing is there tell user and return
-    pf_df = pd.read_csv(os.path.dirname(__file__) + "/input/park_factors.csv")
-    # Modifying all park factors for calculations
-    pf_df["ParkF"] = (pf_df["ParkF"] + 1) / 2
-    # TODO: clean up
+    park_factors = INPUT_STORE.index(
+        "park_factors.csv", "park_factors", index_park_factors
+    )
     if suffix not in ("B", "P"):
-        # Drop all rows that are not the df's year
-        pf_df = pf_df.drop(pf_df[pf_df.Year.astype(str) != year].index)
-        # Drop all rows that do not match the df's league
+        # Only use the df's year and league
         if suffix in ("BR", "PR", "BP", "PP"):
             pf_suffix = "NPB"
         else:
             pf_suffix = "Farm"
-        pf_df = pf_df.drop(pf_df[pf_df.League != pf_suffix].index)
-        # Drop remaining unneeded cols before merge
-        pf_df.drop(["Year", "League"], axis=1, inplace=True)
+        pf_df = park_factors["season"].get((year, pf_suffix), park_factors["empty"])
         df = df.merge(pf_df, on="Team", how="left")
         # For team files, league avg calculations have park factor as 1.000
         df.loc[df.Team == "League Average", "ParkF"] = 1.000
     # Match park factors by year for career stats
     else:
-        pf_df = pf_df.drop(pf_df[pf_df.League != "NPB"].index)
-        df = df.merge(pf_df[["ParkF", "Year", "Team"]], on=["Year", "Team"], how="left")
+        df = df.merge(park_factors["career"], on=["Year", "Team"], how="left")
     return df
 
 
+def index_park_factors(pf_df):
+    """Builds the park factor lookups used by select_park_factor()
+
+    Parameters:
+    pf_df (pandas dataframe): The park_factors.csv table
+
+    Returns:
+    park_factors (dict): "season" maps (Year, League) to that league's Team and
+    ParkF rows, "career" holds every NPB Year, Team and ParkF and "empty" is
+    used for seasons without park factors"""
+    pf_df = pf_df.copy()
+    # Modifying all park factors for calculations
+    pf_df["ParkF"] = (pf_df["ParkF"] + 1) / 2
+    season = {
+        key: rows.drop(["Year", "League"], axis=1)
+        for key, rows in group_input_rows(pf_df, ["Year", "League"]).items()
+    }
+    return {
+        "season": season,
+        "career": pf_df[pf_df.League == "NPB"][["ParkF", "Year", "Team"]],
+        "empty": pf_df.iloc[0:0].drop(["Year", "League"], axis=1),
+    }
+
+
 def select_league(df, suffix, year):
     """Add a "League" column to a dataframe based on team names.
 
@@ -5546,6 +7659,59 @@ def select_league(df, suffix, year):
     return df
 
 
+def classify_positions(
+    pos_df,
+    pct_utl_threshold_high=0.075,
+    pct_utl_threshold_low=0.05,
+    pct_primary_threshold=0.50,
+):
+    """Labels every player's primary position (or "UTL") at once, with the
+    same rules and results as assign_primary_or_utl() applied to each row
+
+    Parameters:
+    pos_df (pandas dataframe): Innings per position, with one column per
+    position ("1"-"9", "DH") and one row per player
+    pct_utl_threshold_high (float): The threshold for a player to be considered
+    UTL if they have 3 or more positions >= this value
+    pct_utl_threshold_low (float): The threshold for a player to be considered
+    UTL if they have 4 or more positions >= this value
+    pct_primary_threshold (float): The threshold for a player to be considered
+    primary at a position if they have >= this value
+
+    Returns:
+    positions (numpy array): Each row's position label"""
+    pos_cols = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "DH"]
+    innings = pos_df[pos_cols].to_numpy(dtype=float)
+    # Summed left to right like the row sums in assign_primary_or_utl()
+    total_innings = np.zeros(len(innings))
+    for i in range(len(pos_cols)):
+        total_innings = total_innings + innings[:, i]
+    non_dh_innings = total_innings - innings[:, 9]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fractions = innings / non_dh_innings[:, np.newaxis]
+    # First position with the largest fraction, like idxmax()
+    largest = np.array(pos_cols, dtype=object)[fractions.argmax(axis=1)]
+    outfield_only = (innings[:, 6] > 0) & (innings[:, 7] > 0) & (innings[:, 8] > 0)
+    return np.select(
+        [
+            total_innings == 0,
+            # Rule 1: Grab all players that are solely DH and pitchers
+            non_dh_innings == 0,
+            # Rule 2: Grab all players that are solely pitchers
+            (total_innings - innings[:, 0]) == 0,
+            # Rule 3 and 4: All 3 outfield positions or any position >= 50%
+            outfield_only | (fractions >= pct_primary_threshold).any(axis=1),
+            # Rule 5: If 3 or more positions are >= our thresholds, label UTL
+            ((fractions >= pct_utl_threshold_high).sum(axis=1) >= 3)
+            | ((fractions >= pct_utl_threshold_low).sum(axis=1) >= 4),
+        ],
+        ["No Data", "DH", "1", largest, "UTL"],
+        # Rule 6: If none of the above, pick the position with the largest
+        # fraction
+        default=largest,
+    )
+
+
 def assign_primary_or_utl(
     row,
     pct_utl_threshold_high=0.075,
@@ -5553,7 +7719,8 @@ def assign_primary_or_utl(
     pct_primary_threshold=0.50,
 ):
     """Given a row with positions (e.g. row['1B'], row['2B'], etc.),
-    decide if the player is 'UTL' or has a primary position.
+    decide if the player is 'UTL' or has a primary position. Kept as the
+    reference for classify_positions(), which labels a whole dataframe at once
 
     Parameters:
     row (pandas series): A row of a dataframe with positions as columns
@@ -5613,17 +7780,16 @@ def convert_player_to_html(df, suffix, year):
     Returns:
     df (pandas dataframe): The final stat dataframe with valid HTML in the
     player/pitcher columns"""
-    rel_dir = os.path.dirname(__file__)
-    player_link_file = rel_dir + "/input/" + year + "/roster_data.csv"
-    # Read in csv that contains player name and their personal page link
-    link_df = pd.read_csv(player_link_file)
-
-    # Create dict of (Name,Team):Link from roster data
-    player_dict = dict(
-        zip(
-            (zip(link_df["Player"], link_df["Team"])),
-            link_df["Link"],
-        )
+    # Dict of (Name,Team):Link from the year's roster data
+    player_dict = INPUT_STORE.index(
+        os.path.join(year, "roster_data.csv"),
+        "links",
+        lambda link_df: dict(
+            zip(
+                (zip(link_df["Player"], link_df["Team"])),
+                link_df["Link"],
+            )
+        ),
     )
     # Make keys from input df
     if suffix in ("PR", "PF", "PP"):
@@ -5651,42 +7817,14 @@ def translate_players(df, suffix, year, mode=None):
 
     Returns:
     df (pandas dataframe): The final stat dataframe with translated names"""
-    # TODO: combine all roster_data.csv into big file, make sure to add year as a column, change other functions that touch roster_data to reflect this
-    rel_dir = os.path.dirname(__file__)
     # Read in csv that contains player and team names in JP and EN
     if mode == "career":
-        base_input_dir = os.path.join(rel_dir, "input")
-        # List all directories in base_input_dir that are numeric (years) and exist
-        year_dirs = [
-            d
-            for d in os.listdir(base_input_dir)
-            if os.path.isdir(os.path.join(base_input_dir, d)) and d.isdigit()
-        ]
-        # We'll collect dataframes
-        dfs = []
-        for y in year_dirs:
-            trans_file = os.path.join(base_input_dir, y, "roster_data.csv")
-            if os.path.exists(trans_file):
-                df_year = pd.read_csv(trans_file)
-                # Add year column to track source year
-                df_year["_source_year"] = int(y)
-                dfs.append(df_year)
-        if dfs:
-            translation_df = pd.concat(dfs, ignore_index=True)
-            # Sort by source year descending (newest first) and drop duplicates
-            translation_df = translation_df.sort_values("_source_year", ascending=False)
-            translation_df = translation_df.drop_duplicates(
-                subset=["Link"], keep="first"
-            )
-            # Drop the temporary year column
-            translation_df = translation_df.drop("_source_year", axis=1)
-            translation_df = translation_df.reset_index(drop=True)
-        else:
-            # If no files found, we create an empty dataframe
-            translation_df = pd.DataFrame()
+        # Every year's rosters, a player's newest entry is used
+        translations = get_roster_index()["translations"]
     else:
-        translation_file = rel_dir + "/input/" + year + "/roster_data.csv"
-        translation_df = pd.read_csv(translation_file)
+        translations = INPUT_STORE.index(
+            os.path.join(year, "roster_data.csv"), "translations", index_translations
+        )
 
     if "Pitcher" in df.columns:
         target_col = "Pitcher"
@@ -5699,23 +7837,10 @@ def translate_players(df, suffix, year, mode=None):
 
     # Match translation using name and team if needed, else use name and link
     if "Link" not in df.columns:
-        # Create dict of (JP name,EN team):EN name
-        player_dict = dict(
-            zip(
-                (zip(translation_df["jpPlayer"], translation_df["Team"])),
-                translation_df["Player"],
-            )
-        )
+        player_dict = translations["name"]
         df["keys"] = list(zip(df[target_col], df["Team"]))
     else:
-        # Change NPB English player link to Japanese link
-        translation_df["Link"] = translation_df["Link"].str.replace(
-            "/eng", "", regex=False
-        )
-        # Create dict of Japanese NPB link:EN name
-        player_dict = pd.Series(
-            translation_df["Player"].values, index=translation_df["Link"]
-        ).to_dict()
+        player_dict = translations["link"]
         df["keys"] = df["Link"]
 
     df[target_col] = (
@@ -5727,6 +7852,162 @@ def translate_players(df, suffix, year, mode=None):
     return df
 
 
+def index_translations(translation_df):
+    """Builds the JP to EN player name lookups used by translate_players()
+
+    Parameters:
+    translation_df (pandas dataframe): Roster data with jpPlayer, Team, Player
+    and Link columns
+
+    Returns:
+    translations (dict): "name" maps (JP name, EN team) to EN names and "link"
+    maps Japanese NPB player links to EN names"""
+    # Change NPB English player link to Japanese link
+    jp_links = translation_df["Link"].str.replace("/eng", "", regex=False)
+    return {
+        "name": dict(
+            zip(
+                (zip(translation_df["jpPlayer"], translation_df["Team"])),
+                translation_df["Player"],
+            )
+        ),
+        "link": pd.Series(translation_df["Player"].values, index=jp_links).to_dict(),
+    }
+
+
+def get_roster_index(rel_dir=None):
+    """Returns every year's roster data as one table with a Year column. The
+    index is kept in stats/all/raw/roster_index.pkl and only the years whose
+    input/[year]/roster_data.csv changed are reread, the rest come from the
+    saved index. Later calls in the same process reuse it while no roster
+    file changes
+
+    Parameters:
+    rel_dir (string): The project directory, defaults to this file's directory
+
+    Returns:
+    index (dict): "df" holds every roster row (newest year first), "years"
+    each year's roster file stamp and hash and "translations" the JP to EN
+    name lookups built from each player's newest row (see
+    index_translations())"""
+    if rel_dir is None:
+        rel_dir = os.path.dirname(__file__)
+    input_dir = os.path.join(rel_dir, "input")
+    index_path = os.path.join(rel_dir, "stats", "all", "raw", "roster_index.pkl")
+    with ROSTER_INDEX_LOCK:
+        index = ROSTER_INDEX["index"]
+        if index is None or index["path"] != index_path:
+            index = load_roster_index(index_path)
+        if update_roster_index(index, input_dir) is True:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            # Write to a temp file first, parallel career organizers may save
+            # the same index at once
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(index_path), suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as index_file:
+                pickle.dump(index, index_file)
+            os.replace(tmp_path, index_path)
+        ROSTER_INDEX["index"] = index
+        return index
+
+
+def load_roster_index(index_path):
+    """Reads a saved roster index, returns an empty one if it is missing,
+    unreadable or from an older ROSTER_INDEX version
+
+    Parameters:
+    index_path (string): Path of roster_index.pkl
+
+    Returns:
+    index (dict): The roster index (see get_roster_index())"""
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, "rb") as index_file:
+                index = pickle.load(index_file)
+            if index.get("version") == ROSTER_INDEX["version"]:
+                index["path"] = index_path
+                return index
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError, AttributeError):
+            print("WARNING: Unreadable roster index, rebuilding " + index_path)
+    index = {
+        "version": ROSTER_INDEX["version"],
+        "path": index_path,
+        "years": {},
+        "df": pd.DataFrame(columns=["Link", "Player", "Team", "jpPlayer", "Year"]),
+    }
+    index_roster_rows(index)
+    return index
+
+
+def update_roster_index(index, input_dir):
+    """Brings a roster index up to date with input/[year]/roster_data.csv.
+    Files are compared by modification time and size first and by content
+    hash when those changed, only changed years are reread
+
+    Parameters:
+    index (dict): The roster index (see get_roster_index())
+    input_dir (string): The input directory holding the year directories
+
+    Returns:
+    changed (bool): True if the index was modified and should be saved"""
+    years = {}
+    for year in os.listdir(input_dir):
+        roster_file = os.path.join(input_dir, year, "roster_data.csv")
+        if year.isdigit() and os.path.isfile(roster_file):
+            file_stat = os.stat(roster_file)
+            years[year] = [file_stat.st_mtime_ns, file_stat.st_size]
+
+    changed_years = []
+    changed_stamps = False
+    for year, stamp in years.items():
+        year_entry = index["years"].get(year)
+        if year_entry is not None and year_entry["stamp"] == stamp:
+            continue
+        changed_stamps = True
+        roster_file = os.path.join(input_dir, year, "roster_data.csv")
+        with open(roster_file, "rb") as roster:
+            sha256 = hashlib.sha256(roster.read()).hexdigest()
+        if year_entry is None or year_entry["sha256"] != sha256:
+            changed_years.append(year)
+        index["years"][year] = {"stamp": stamp, "sha256": sha256}
+    removed_years = [year for year in index["years"] if year not in years]
+    for year in removed_years:
+        del index["years"][year]
+
+    if len(changed_years) == 0 and len(removed_years) == 0:
+        # Only the stamps moved (e.g. a fresh checkout), the rows are current
+        return changed_stamps
+
+    # Replace the changed years' rows, newest year first
+    keep_df = index["df"][
+        ~index["df"]["Year"].astype(str).isin(changed_years + removed_years)
+    ]
+    frames = [keep_df] if len(keep_df) > 0 else []
+    for year in changed_years:
+        year_df = pd.read_csv(os.path.join(input_dir, year, "roster_data.csv"))
+        year_df["Year"] = int(year)
+        frames.append(year_df)
+    if len(frames) > 0:
+        roster_df = pd.concat(frames, ignore_index=True)
+        roster_df = roster_df.sort_values("Year", ascending=False, kind="stable")
+        index["df"] = roster_df.reset_index(drop=True)
+    else:
+        index["df"] = index["df"].iloc[0:0]
+    index_roster_rows(index)
+    return True
+
+
+def index_roster_rows(index):
+    """Rebuilds a roster index's name translations from its table. Rows are
+    newest year first, so each player link keeps its newest row
+
+    Parameters:
+    index (dict): The roster index (see get_roster_index())"""
+    newest_df = index["df"].drop_duplicates(subset=["Link"], keep="first")
+    index["translations"] = index_translations(newest_df)
+
+
 def translate_teams(df, suffix):
     """Translate team names from Japanese abbreviations to full English names.
 
@@ -5826,8 +8107,7 @@ def make_zip(year_dir, suffix, year):
         "P" = a given year's plots directories
     year (string): The year of npb stats to group together"""
     zip_dir = os.path.join(year_dir, "zip")
-    if not os.path.exists(zip_dir):
-        os.mkdir(zip_dir)
+    os.makedirs(zip_dir, exist_ok=True)
 
     output_filename = ""
     if suffix == "S":
@@ -5929,6 +8209,106 @@ def check_input_files(rel_dir, scrape_year=str(datetime.now().year)):
     return missing_files
 
 
+def compute_fip_constant(df):
+    """Calculates the FIP constant of a league's pitching stats, which aligns
+    FIP with the league's runs allowed: lg_RA - (13HR + 3(BB - IBB + HB) - 2SO) / IP
+
+    Parameters:
+    df (pandas dataframe): Pitching stats with R, IP, HR, BB, IBB, HB and SO
+
+    Returns:
+    fip_const (float): The league's FIP constant"""
+    lg_ra = df["R"].sum() * 9 / df["IP"].sum()
+    numerator = (
+        (13 * df["HR"].sum())
+        + (3 * (df["BB"].sum() - df["IBB"].sum() + df["HB"].sum()))
+        - (2 * df["SO"].sum())
+    )
+    return lg_ra - ((numerator) / (df["IP"].sum()))
+
+
+def compute_fip_constants(df, years, league):
+    """Calculates the FIP constant of every (Year, League) in pitching stats
+    with one groupby (see compute_fip_constant())
+
+    Parameters:
+    df (pandas dataframe): Pitching stats with R, IP, HR, BB, IBB, HB and SO
+    years (pandas series or string): Each row's year, or the year of every row
+    league (string): "NPB" or "Farm"
+
+    Returns:
+    fip_consts (dict): {(Year, League): FIP}, empty if df is missing one of the
+    columns"""
+    fip_cols = ["R", "IP", "HR", "BB", "IBB", "HB", "SO"]
+    if not set(fip_cols).issubset(df.columns):
+        return {}
+    keys = pd.DataFrame({"Year": years, "League": league}, index=df.index)
+    fip_consts = (
+        df[fip_cols]
+        .groupby([keys["Year"].astype(str), keys["League"]])
+        .apply(compute_fip_constant)
+    )
+    return fip_consts.to_dict()
+
+
+def load_fip_constants():
+    """Returns the process's FIP constant table, {(Year, League): FIP}, reading
+    input/fip_const.csv the first time"""
+    with FIP_CONSTANTS_LOCK:
+        if FIP_CONSTANTS["table"] is None:
+            fip_df = pd.read_csv(
+                os.path.join(os.path.dirname(__file__), "input", "fip_const.csv")
+            )
+            FIP_CONSTANTS["table"] = dict(
+                zip(zip(fip_df["Year"].astype(str), fip_df["League"]), fip_df["FIP"])
+            )
+        return FIP_CONSTANTS["table"]
+
+
+def get_fip_constant(year, league):
+    """Looks up a year's FIP constant
+
+    Parameters:
+    year (string): The year of the constant
+    league (string): "NPB" or "Farm"
+
+    Returns:
+    fip_const (float): The constant calculated this run, else the one from
+    input/fip_const.csv"""
+    return load_fip_constants()[(str(year), league)]
+
+
+def set_fip_constant(year, league, fip_const):
+    """Stores a calculated FIP constant in the process's FIP constant table"""
+    table = load_fip_constants()
+    with FIP_CONSTANTS_LOCK:
+        table[(str(year), league)] = fip_const
+
+
+def save_fip_constants(*stats):
+    """Writes the FIP constants calculated during the run to
+    input/fip_const.csv in one pass. Only existing (Year, League) rows are
+    updated, later stats overwrite earlier ones
+
+    Parameters:
+    stats (Stats): Organized stats whose fip_updates are saved, in the order
+    they were organized"""
+    fip_updates = {}
+    for stat in stats:
+        fip_updates.update(stat.fip_updates)
+    if len(fip_updates) == 0:
+        return
+    fip_path = os.path.join(os.path.dirname(__file__), "input", "fip_const.csv")
+    fip_df = pd.read_csv(fip_path)
+    row_keys = list(zip(fip_df["Year"].astype(str), fip_df["League"]))
+    fip_df["FIP"] = [
+        fip_updates.get(key, fip_const) for key, fip_const in zip(row_keys, fip_df["FIP"])
+    ]
+    fip_df.to_csv(fip_path, index=False)
+    for (year, league), fip_const in fip_updates.items():
+        set_fip_constant(year, league, fip_const)
+
+
 def store_dataframe(df, store_dir, filename, mode):
     """
     Stores a DataFrame to disk as either a CSV file or a plain text file.
@@ -5943,8 +8323,7 @@ def store_dataframe(df, store_dir, filename, mode):
     Returns:
         str: The full path to the stored file.
     """
-    if not os.path.exists(store_dir):
-        os.mkdir(store_dir)
+    os.makedirs(store_dir, exist_ok=True)
     store_path = store_dir + "/" + filename
     if mode == "csv":
         df.to_csv(store_path, index=False)
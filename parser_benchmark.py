@@ -0,0 +1,103 @@
+"""Times npb_scrape.py's HTML parsing per page type over the pages saved in
+the HTTP cache. Each page is parsed whole with html.parser (the old way) and
+with make_soup() (HTML_PARSER, scoped to the page type's PARSE_SCOPES)
+
+Run npb_scrape.py first to fill the cache, then: python parser_benchmark.py"""
+
+import os
+import sys
+import json
+import timeit
+import pandas as pd
+import npb_scrape
+
+
+def get_page_type(url, stat_versions):
+    """Returns the PARSE_SCOPES key of a cached page, None if it isn't parsed
+
+    Parameters:
+    url (string): The page's URL
+    stat_versions (dict): npb_urls.csv team stat page links to their version
+
+    Returns:
+    page_type (string): The page's PARSE_SCOPES key"""
+    if url in stat_versions:
+        return "stats_" + stat_versions[url]
+    if "/stats/std_" in url:
+        return "standings"
+    if url.endswith("/games/"):
+        return "daily_scores"
+    if "hatenadiary" in url:
+        return "hatena_fielding"
+    if "/players/search/yearly/" in url:
+        return "team_directory"
+    if "/bis/players/" in url:
+        return "player_career"
+    if "/teams/rst_" in url:
+        return "roster"
+    return None
+
+
+def load_cached_pages():
+    """Groups the HTTP cache's saved page bodies by page type
+
+    Returns:
+    pages (dict): Page type to a list of page bodies (bytes)"""
+    url_df = pd.read_csv(
+        os.path.join(os.path.dirname(__file__), "input", "npb_urls.csv")
+    )
+    stat_versions = dict(zip(url_df["Link"], url_df["Version"]))
+    pages = {}
+    cache_dir = npb_scrape.HTTP_CACHE["dir"]
+    if not os.path.isdir(cache_dir):
+        return pages
+    for filename in os.listdir(cache_dir):
+        if not filename.endswith(".json"):
+            continue
+        meta_path = os.path.join(cache_dir, filename)
+        body_path = meta_path[: -len(".json")] + ".body"
+        try:
+            with open(meta_path, encoding="utf-8") as meta_file:
+                url = json.load(meta_file)["url"]
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError, KeyError):
+            continue
+        page_type = get_page_type(url, stat_versions)
+        if page_type is not None:
+            pages.setdefault(page_type, []).append(body)
+    return pages
+
+
+def main():
+    """Prints the average parse time per page for each page type"""
+    pages = load_cached_pages()
+    if len(pages) == 0:
+        print("No cached pages found in " + npb_scrape.HTTP_CACHE["dir"])
+        sys.exit(1)
+
+    print("Scoped parser backend: " + npb_scrape.HTML_PARSER)
+    print(f"{'Page type':<16}{'Pages':>6}{'Full (ms)':>12}{'Scoped (ms)':>13}{'Speedup':>9}")
+    for page_type, bodies in sorted(pages.items()):
+        full_time = timeit.timeit(
+            lambda bodies=bodies: [
+                npb_scrape.make_soup(body, parser="html.parser") for body in bodies
+            ],
+            number=3,
+        )
+        scoped_time = timeit.timeit(
+            lambda bodies=bodies, page_type=page_type: [
+                npb_scrape.make_soup(body, page_type) for body in bodies
+            ],
+            number=3,
+        )
+        full_ms = full_time / (3 * len(bodies)) * 1000
+        scoped_ms = scoped_time / (3 * len(bodies)) * 1000
+        print(
+            f"{page_type:<16}{len(bodies):>6}{full_ms:>12.2f}{scoped_ms:>13.2f}"
+            f"{full_ms / scoped_ms:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
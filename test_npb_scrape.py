@@ -130,6 +130,24 @@ class TestNpbScrape(unittest.TestCase):
         is_exist = os.path.exists(field_farm)
         self.assertTrue(is_exist, msg="No raw fielding F file")
 
+    def test_fielding_browser(self):
+        """test_fielding_browser() tests that one FieldingBrowser session
+        downloads the selected division each time, not the previous table"""
+        url_df = npb_scrape.select_input_rows(
+            "fielding_urls.csv", ["Year", "League"], (self.scrape_year, "NPB")
+        )
+        if len(url_df) == 0 or "npbbasement.com" not in url_df["Link"].iloc[0]:
+            self.skipTest("test_fielding_browser() skipped, no npbbasement URL")
+        fielding_url = url_df["Link"].iloc[0]
+        with npb_scrape.FieldingBrowser() as browser:
+            npb_csv = browser.download_csv(fielding_url, "top", self.scrape_year)
+            farm_csv = browser.download_csv(fielding_url, "farm", self.scrape_year)
+            npb_again_csv = browser.download_csv(
+                fielding_url, "top", self.scrape_year
+            )
+        self.assertNotEqual(npb_csv, farm_csv)
+        self.assertEqual(npb_csv, npb_again_csv)
+
     def test_get_daily_stats(self):
         """test_get_daily_stats() tests existence of daily stat files after
         running get_daily_scores() (only if the test year is the current year)
@@ -146,6 +164,308 @@ class TestNpbScrape(unittest.TestCase):
         is_exist = os.path.exists(daily)
         self.assertTrue(is_exist, msg="No raw daily scores R file")
 
+    def test_host_scheduler(self):
+        """test_host_scheduler() tests that HostScheduler halves a host's rate
+        after errors or slow responses and raises it after healthy ones"""
+        limits = {
+            "default": {
+                "rate": 1.0,
+                "min_rate": 0.25,
+                "max_rate": 1.5,
+                "step": 0.5,
+                "concurrency": 1,
+            }
+        }
+        scheduler = npb_scrape.HostScheduler(limits)
+        state = scheduler.acquire("https://npb.jp/bis/eng/2026/stats/")
+        scheduler.release(state, 200, 0.1)
+        self.assertEqual(state["rate"], 1.5)
+        # Already at the ceiling
+        scheduler.record(state, 200, 0.1)
+        self.assertEqual(state["rate"], 1.5)
+        scheduler.record(state, 429, 0.1)
+        self.assertEqual(state["rate"], 0.75)
+        # Much slower than the host's average latency
+        scheduler.record(state, 200, 5.0)
+        self.assertEqual(state["rate"], 0.375)
+        scheduler.record(state, None, None)
+        self.assertEqual(state["rate"], 0.25)
+
+    def test_raw_table_writer(self):
+        """test_raw_table_writer() tests that a RawTableWriter only replaces
+        its Raw file when committed and keeps the old file after a failure"""
+        raw_csv = os.path.join(self.temp_raw_dir, "RawTableWriterTest.csv")
+        with npb_scrape.RawTableWriter(raw_csv, trailing_field=True) as writer:
+            writer.write_header(["Player", "Team"])
+            writer.write_row(["Sato Teruaki", "Hanshin Tigers"])
+        with open(raw_csv, encoding="utf-8") as raw_file:
+            self.assertEqual(
+                raw_file.read(), "Player,Team,\nSato Teruaki,Hanshin Tigers,\n"
+            )
+
+        with self.assertRaises(ValueError):
+            with npb_scrape.RawTableWriter(raw_csv) as writer:
+                writer.write_row(["Chikamoto Koji", "Hanshin Tigers"])
+                raise ValueError("Scrape failed")
+        with open(raw_csv, encoding="utf-8") as raw_file:
+            self.assertEqual(
+                raw_file.read(), "Player,Team,\nSato Teruaki,Hanshin Tigers,\n"
+            )
+        self.assertTrue(npb_scrape.is_raw_file_complete(raw_csv))
+
+    def test_task_graph(self):
+        """test_task_graph() tests that TaskGraph passes input results to
+        thread and process nodes and rejects unknown dependencies"""
+        graph = npb_scrape.TaskGraph()
+        graph.add("total", sum, args=([1, 2, 3],))
+        graph.add("largest", max, args=(4,), inputs=["total"], kind="cpu")
+        graph.add("count", len, args=("abc",), after=["largest"])
+        results = graph.run()
+        self.assertEqual(results, {"total": 6, "largest": 6, "count": 3})
+        with self.assertRaises(ValueError):
+            graph.add("orphan", len, inputs=["missing"])
+
+    def test_game_log(self):
+        """test_game_log() tests that the game log only adds scored games,
+        replaces a mid-game score with the final score and that its splits add
+        up"""
+        rows = [
+            ["Hanshin", "2", "1", "Yomiuri"],
+            ["Yakult", "", "", "DeNA"],
+        ]
+        added = npb_scrape.append_game_log(self.temp_year_dir, "2025-04-01", rows)
+        self.assertEqual(added, 1)
+        rows[0] = ["Hanshin", "3", "1", "Yomiuri"]
+        rows[1] = ["Yakult", "2", "2", "DeNA"]
+        added = npb_scrape.append_game_log(self.temp_year_dir, "2025-04-01", rows)
+        self.assertEqual(added, 2)
+        added = npb_scrape.append_game_log(self.temp_year_dir, "2025-04-01", rows)
+        self.assertEqual(added, 0)
+        npb_scrape.append_game_log(
+            self.temp_year_dir, "2025-04-02", [["Yomiuri", "5", "0", "Hanshin"]]
+        )
+        log_df = npb_scrape.read_game_log(self.temp_year_dir)
+        self.assertEqual(len(log_df), 3)
+        self.assertEqual(
+            len(npb_scrape.read_game_log(self.temp_year_dir, "2025-04-02")), 1
+        )
+        diff_df = npb_scrape.get_run_differential(self.temp_year_dir)
+        hanshin = diff_df[diff_df["Team"] == "Hanshin"]
+        self.assertEqual(hanshin["CumDiff"].tolist(), [2, -3])
+        split_df = npb_scrape.get_home_away_splits(self.temp_year_dir)
+        yakult = split_df[split_df["Team"] == "Yakult"].iloc[0]
+        self.assertEqual((yakult["Site"], yakult["T"]), ("Home", 1))
+
+    def test_parse_games_date(self):
+        """test_parse_games_date() tests that the games' date comes from the
+        heading above the games, not from other dates on the page"""
+        page = (
+            b'<a href="/bis/eng/2025/games/gm20250331.html">2025/3/31</a>'
+            b"<h3>April 1, 2025</h3>"
+            b'<div class="contentsgame"><span class="contentsTeam">Hanshin'
+            b"</span></div>"
+        )
+        soup = npb_scrape.make_soup(page, "daily_scores")
+        game_blocks = soup.find_all("div", class_="contentsgame")
+        self.assertEqual(
+            npb_scrape.parse_games_date(game_blocks, "2025"), "2025-04-01"
+        )
+        self.assertIsNone(npb_scrape.parse_games_date(game_blocks, "2026"))
+        soup = npb_scrape.make_soup(page.replace(b"h3", b"p"), "daily_scores")
+        game_blocks = soup.find_all("div", class_="contentsgame")
+        self.assertIsNone(npb_scrape.parse_games_date(game_blocks, "2025"))
+
+    def test_fip_constants(self):
+        """test_fip_constants() tests that every year's FIP constant is built
+        in one pass and matches the single league calculation"""
+        pitch_df = npb_scrape.pd.DataFrame(
+            {
+                "Year": [2024, 2025, 2025],
+                "R": [50, 60, 40],
+                "IP": [100.0, 120.0, 80.0],
+                "HR": [10, 12, 8],
+                "BB": [30, 35, 25],
+                "IBB": [2, 3, 1],
+                "HB": [4, 5, 3],
+                "SO": [80, 90, 70],
+            }
+        )
+        fip_consts = npb_scrape.compute_fip_constants(
+            pitch_df, pitch_df["Year"], "NPB"
+        )
+        self.assertEqual(set(fip_consts), {("2024", "NPB"), ("2025", "NPB")})
+        self.assertAlmostEqual(
+            fip_consts[("2025", "NPB")],
+            npb_scrape.compute_fip_constant(pitch_df.iloc[1:]),
+        )
+        self.assertEqual(
+            npb_scrape.compute_fip_constants(
+                pitch_df.drop(columns="IBB"), "2025", "Farm"
+            ),
+            {},
+        )
+
+    def test_input_store(self):
+        """test_input_store() tests that InputStore caches an input file's
+        indexes and rebuilds them after the file changes"""
+        store = npb_scrape.InputStore(self.temp_year_dir)
+        input_csv = os.path.join(self.temp_year_dir, "team_urls.csv")
+        with open(input_csv, "w", encoding="utf-8") as input_file:
+            input_file.write("Team,Abbr\nHanshin Tigers,Hanshin\n")
+        builds = []
+
+        def build(df):
+            builds.append(len(df))
+            return dict(zip(df["Team"], df["Abbr"]))
+
+        abbr_dict = store.index("team_urls.csv", "abbr", build)
+        self.assertEqual(abbr_dict, {"Hanshin Tigers": "Hanshin"})
+        self.assertIs(store.index("team_urls.csv", "abbr", build), abbr_dict)
+        with open(input_csv, "a", encoding="utf-8") as input_file:
+            input_file.write("Yomiuri Giants,Yomiuri\n")
+        abbr_dict = store.index("team_urls.csv", "abbr", build)
+        self.assertEqual(abbr_dict["Yomiuri Giants"], "Yomiuri")
+        self.assertEqual(builds, [1, 2])
+        # Tables are copies, so callers can modify them
+        link_df = store.table("team_urls.csv")
+        link_df["Abbr"] = ""
+        self.assertEqual(
+            list(store.table("team_urls.csv")["Abbr"]), ["Hanshin", "Yomiuri"]
+        )
+
+    def test_roster_index(self):
+        """test_roster_index() tests that the roster index keeps each player's
+        newest roster entry and rereads a year after its roster changes"""
+        header = "Player,Link,Team,jpPlayer\n"
+        rosters = {
+            "2024": "Sato Teruaki,/eng/players/1.html,Hanshin Tigers,佐藤 輝明\n",
+            "2025": "Sato Teru,/eng/players/1.html,Hanshin Tigers,佐藤 輝明\n",
+        }
+        for year, rows in rosters.items():
+            os.makedirs(os.path.join(self.temp_stats_dir, "input", year))
+            roster_file = os.path.join(
+                self.temp_stats_dir, "input", year, "roster_data.csv"
+            )
+            with open(roster_file, "w", encoding="utf-8") as roster:
+                roster.write(header + rows)
+        index = npb_scrape.get_roster_index(self.temp_stats_dir)
+        self.assertEqual(list(index["df"]["Year"]), [2025, 2024])
+        self.assertEqual(
+            index["translations"]["link"]["/players/1.html"], "Sato Teru"
+        )
+        with open(roster_file, "a", encoding="utf-8") as roster:
+            roster.write(
+                "Morishita Shota,/eng/players/2.html,Hanshin Tigers,森下 翔太\n"
+            )
+        index = npb_scrape.get_roster_index(self.temp_stats_dir)
+        self.assertEqual(list(index["df"]["Year"]), [2025, 2025, 2024])
+        self.assertEqual(
+            index["translations"]["name"][("森下 翔太", "Hanshin Tigers")],
+            "Morishita Shota",
+        )
+        # The saved index is used when the rosters have not changed
+        npb_scrape.ROSTER_INDEX["index"] = None
+        index = npb_scrape.get_roster_index(self.temp_stats_dir)
+        self.assertEqual(len(index["df"]), 3)
+
+    def test_revise_stats(self):
+        """test_revise_stats() tests that revisions are applied in file order
+        and that revised columns keep their dtype"""
+        revise_dir = os.path.join(self.temp_stats_dir, "input", "2025")
+        os.makedirs(revise_dir)
+        with open(
+            os.path.join(revise_dir, "roster_revisions.csv"), "w", encoding="utf-8"
+        ) as revise_file:
+            revise_file.write(
+                "ColumnName,PlayerName,Error,Revision\n"
+                "Player,Davis Jonathan,Davis Jonathan,Davis JD\n"
+                "Age,Davis JD,30,32\n"
+                "Age,Sakamoto Hayato,23,36\n"
+                "Age,Sakamoto Hayato,36,37\n"
+                "B,Davis JD,,R\n"
+            )
+        df = npb_scrape.pd.DataFrame(
+            {
+                "Player": ["Davis Jonathan", "Sakamoto Hayato", "Sato Teruaki"],
+                "Age": [30, 23, 23],
+                "B": [npb_scrape.np.nan, "R", "L"],
+            }
+        )
+        df = npb_scrape.revise_stats(df, self.temp_stats_dir, "2025")
+        self.assertEqual(
+            list(df["Player"]), ["Davis JD", "Sakamoto Hayato", "Sato Teruaki"]
+        )
+        self.assertEqual(list(df["Age"]), [32, 37, 23])
+        self.assertEqual(df["Age"].dtype, "int64")
+        self.assertEqual(list(df["B"]), ["R", "R", "L"])
+
+    def test_append_raw_csv(self):
+        """test_append_raw_csv() tests that appending rows with new columns
+        keeps them and leaves the existing rows as they were"""
+        raw_path = os.path.join(self.temp_raw_dir, "raw_career_bio.csv")
+        first_df = npb_scrape.pd.DataFrame(
+            {"身長": [183.0, npb_scrape.np.nan]}, index=["/players/1", "/players/2"]
+        )
+        npb_scrape.append_raw_csv(first_df, raw_path, True)
+        new_df = npb_scrape.pd.DataFrame(
+            {"身長": [170], "投打": ["右投左打"]}, index=["/players/3"]
+        )
+        npb_scrape.append_raw_csv(new_df, raw_path, True)
+        with open(raw_path, encoding="utf-8") as raw_file:
+            self.assertEqual(
+                raw_file.read(),
+                ",身長,投打\n/players/1,183.0,\n/players/2,,\n/players/3,170,右投左打\n",
+            )
+
+    def test_read_raw_career_data(self):
+        """test_read_raw_career_data() tests that a refreshed player's rows
+        replace all their earlier rows of the refreshed years"""
+        raw_path = os.path.join(self.temp_raw_dir, "raw_career_bat.csv")
+        with open(raw_path, "w", encoding="utf-8") as raw_file:
+            raw_file.write(
+                "Link,年度,所属球団,試合\n"
+                "/players/1,2024,阪 神,10\n"
+                "/players/1,2025,巨 人,20\n"
+                "/players/2,2025,中 日,5\n"
+                # Refresh of player 1 corrects the 2025 team
+                "/players/1,2025,阪 神,30\n"
+            )
+        df = npb_scrape.read_raw_career_data(self.temp_raw_dir, "bat")
+        self.assertEqual(
+            df.values.tolist(),
+            [
+                ["/players/1", 2024, "阪 神", 10],
+                ["/players/2", 2025, "中 日", 5],
+                ["/players/1", 2025, "阪 神", 30],
+            ],
+        )
+
+    def test_classify_positions(self):
+        """test_classify_positions() tests that classify_positions() labels
+        players the same as assign_primary_or_utl()"""
+        pos_cols = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "DH"]
+        rows = [
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0, 50.2],
+            [120.1, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 30, 20.1, 10, 0],
+            [0, 0, 400, 100, 0, 0, 0, 0, 0, 200],
+            [0, 0, 40, 40, 40, 30, 0, 0, 0, 0],
+            [0, 0, 300, 20, 17, 16, 15, 0, 0, 0],
+            [5.1, 90, 0, 0, 0, 0, 0, 0, 0, 3],
+        ]
+        rng = npb_scrape.np.random.default_rng(117)
+        rows += (
+            rng.integers(0, 4, (200, 10)) * rng.random((200, 10)) * 100
+        ).tolist()
+        pos_df = npb_scrape.pd.DataFrame(rows, columns=pos_cols)
+        pos_df["Player"] = "Player"
+        pos_df["Team"] = "Team"
+        expected = pos_df.apply(npb_scrape.assign_primary_or_utl, axis=1)
+        self.assertEqual(
+            list(npb_scrape.classify_positions(pos_df)), expected.tolist()
+        )
+
 
 if __name__ == "__main__":
     unittest.main()